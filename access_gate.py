@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Access Gate - decides, before any LLM call, whether an article is behind a paywall
+or a consent wall. Text checks reuse text_classifier; markup checks are regexes over
+the raw HTML (JSON-LD isAccessibleForFree, paywall meta tags, paywall/CMP markers),
+so no extra parse is needed
+"""
+
+import os
+import re
+from urllib.parse import urlsplit
+
+import text_classifier
+
+
+# JSON-LD / schema.org: "isAccessibleForFree": false (or "False" as a string)
+ACCESSIBLE_FOR_FREE_FALSE = re.compile(rb'"isAccessibleForFree"\s*:\s*"?false\b', re.I)
+
+# <meta property="article:content_tier" content="locked|metered"> and similar access metas
+PAYWALL_META = re.compile(
+    rb'<meta[^>]+(?:property|name)\s*=\s*["\'](?:article:content_tier|og:article:content_tier|'
+    rb'access|article:access|cxenseparse:access|paywall)["\'][^>]*'
+    rb'content\s*=\s*["\'](?:locked|metered|subscription|subscriber|premium|registration|true)["\']',
+    re.I
+)
+
+# Class/id/attribute names publishers and paywall vendors (Piano, Zephr, Poool) put on the wall itself
+PAYWALL_MARKUP = re.compile(
+    rb'<[a-z][^>]*(?:\bdata-paywall\b|\bdata-zephr\b|'
+    rb'(?:class|id)\s*=\s*["\'][^"\']*\b(?:paywall|tp-modal|tp-container-inner|piano-paywall|'
+    rb'meteredContent|subscriber-only|premium-wall|poool-widget)\b)',
+    re.I
+)
+
+# Hosts that serve a consent interstitial instead of the requested page
+CONSENT_HOSTS = ('consent.yahoo.com', 'guce.yahoo.com', 'consent.google.com', 'consent.youtube.com')
+
+
+def markup_signals(html, final_url=None):
+    """Paywall/consent signals found in raw page HTML (bytes or str), e.g. ['paywall:json-ld']"""
+    if not html:
+        return []
+    if isinstance(html, str):
+        html = html.encode('utf-8', errors='ignore')
+
+    signals = []
+    host = (urlsplit(final_url).hostname or '') if final_url else ''
+    if host.endswith(CONSENT_HOSTS):
+        signals.append('consent:redirect')
+    if ACCESSIBLE_FOR_FREE_FALSE.search(html):
+        signals.append('paywall:json-ld')
+    if PAYWALL_META.search(html):
+        signals.append('paywall:meta')
+    if PAYWALL_MARKUP.search(html):
+        signals.append('paywall:markup')
+    return signals
+
+
+class AccessGate:
+    """Text and markup rules that keep paywalled/consent content away from the providers"""
+
+    # Provider calls a gated article would have spent (summary + categorization)
+    CALLS_PER_ARTICLE = 2
+
+    def __init__(self):
+        self.enabled = os.getenv('ACCESS_GATE_ENABLED', '1') != '0'
+        # Markup alone only gates when the extracted text is teaser-sized; metered pages often
+        # carry the markers while still serving the whole article
+        try:
+            self.teaser_chars = max(int(os.getenv('ACCESS_GATE_TEASER_CHARS', 1500)), 0)
+        except ValueError:
+            self.teaser_chars = 1500
+        # Sources whose free teaser is what we summarize on purpose (markup signals ignored)
+        self.exempt_sources = {
+            name.strip().lower()
+            for name in os.getenv('ACCESS_GATE_EXEMPT_SOURCES', 'The Information').split(',') if name.strip()
+        }
+
+    def check(self, text, signals=(), source_name=None):
+        """Return ('paywall' | 'consent' | None, reason)"""
+        if not self.enabled:
+            return None, "gate disabled"
+
+        if 'consent:redirect' in signals:
+            return 'consent', "redirected to consent page"
+        if text_classifier.is_cookie_consent(text):
+            return 'consent', "consent text"
+        if text_classifier.has_paywall(text):
+            return 'paywall', "paywall text"
+
+        markup = [s for s in signals if s.startswith('paywall:')]
+        if markup and len(text or '') < self.teaser_chars \
+                and (source_name or '').lower() not in self.exempt_sources:
+            return 'paywall', f"{', '.join(markup)} + {len(text or '')}-char teaser"
+        return None, "open"
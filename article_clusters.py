@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Article Clusters - one summary per near-duplicate story
+The same wire story arrives from several sources. Each article's extracted text is
+fingerprinted with a shingled SimHash; the first article of a cluster is summarized as
+usual and the rest copy its summary and categories, linked to it by canonical_article_id.
+Clusters cover the articles in flight in this process plus recently summarized ones
+loaded from the database (sql/005_article_clusters.sql); without those columns only
+in-process clustering is done and no links are stored. A copy whose representative is
+still being summarized does not wait for it in a worker: it is deferred (handed back to
+the queue for a short while) and copies the summary once it is claimed again.
+"""
+
+import os
+import sys
+import time
+from threading import Lock, Event
+from mysql.connector import Error
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'scrapers'))
+from simhash_util import SimHash
+
+
+class Cluster:
+    """A representative article and, once it is done, the summary its copies reuse"""
+    __slots__ = ('canonical_id', 'fingerprint', 'done', 'summary', 'category_ids', 'seen_at')
+
+    def __init__(self, canonical_id, fingerprint, summary=None, category_ids=()):
+        self.canonical_id = canonical_id
+        self.fingerprint = fingerprint
+        self.done = Event()
+        self.summary = summary
+        self.category_ids = tuple(category_ids)
+        self.seen_at = time.time()
+        if summary:
+            self.done.set()
+
+
+class ArticleClusters:
+    """Thread-safe near-duplicate index shared by the summarizer's workers"""
+
+    def __init__(self):
+        self.enabled = os.getenv('ARTICLE_CLUSTERS_ENABLED', '1') != '0'
+        self.shingle_size = self._env_int('CLUSTER_SHINGLE_SIZE', 3)
+        self.max_distance = self._env_int('CLUSTER_MAX_DISTANCE', 8)
+        self.window_hours = self._env_int('CLUSTER_WINDOW_HOURS', 48)
+        # How long copies are deferred for their representative's summary before summarizing themselves
+        self.wait_seconds = self._env_int('CLUSTER_WAIT_SECONDS', 120)
+        # A deferred copy becomes claimable again after this long
+        self.defer_seconds = self._env_int('CLUSTER_DEFER_SECONDS', 30)
+        # Short texts (teasers, blurbs) share too little to be fingerprinted reliably
+        self.min_chars = self._env_int('CLUSTER_MIN_CHARS', 500)
+
+        self.lock = Lock()
+        self.clusters = []
+        self.loaded_ids = set()
+        self.columns_enabled = None
+        self.last_refresh = None
+        self.stats = {'representatives': 0, 'copies': 0, 'deferred': 0, 'fallbacks': 0}
+
+    @staticmethod
+    def _env_int(name, default):
+        try:
+            value = int(os.getenv(name, default))
+            return value if value > 0 else default
+        except ValueError:
+            return default
+
+    def fingerprint(self, text):
+        """Shingled SimHash of the text, or None when it is too short to cluster"""
+        if not self.enabled or not text or len(text) < self.min_chars:
+            return None
+        return SimHash(text, shingle_size=self.shingle_size).hash
+
+    @staticmethod
+    def distance(a, b):
+        return bin(a ^ b).count('1')
+
+    def refresh(self, connection):
+        """Load clusters summarized since the last refresh (main thread, before each claim)"""
+        if not self.enabled:
+            return 0
+        cursor = connection.cursor()
+        try:
+            if self.columns_enabled is None:
+                cursor.execute("SHOW COLUMNS FROM articles LIKE 'canonical_article_id'")
+                self.columns_enabled = cursor.fetchone() is not None
+                if not self.columns_enabled:
+                    print("⚠ articles.cluster_hash/canonical_article_id missing (apply sql/005_article_clusters.sql); "
+                          "clustering only within this process")
+            if not self.columns_enabled:
+                return 0
+
+            window = self.window_hours * 3600
+            if self.last_refresh is not None:
+                window = min(window, time.time() - self.last_refresh + 120)
+            refreshed_at = time.time()
+            cursor.execute("""
+                SELECT a.id, a.cluster_hash, a.summary, GROUP_CONCAT(ac.category_id)
+                FROM articles a
+                LEFT JOIN article_categories ac ON ac.article_id = a.id
+                WHERE a.summary_date >= DATE_SUB(NOW(), INTERVAL %s SECOND)
+                  AND a.cluster_hash IS NOT NULL
+                  AND a.canonical_article_id IS NULL
+                  AND a.summary IS NOT NULL AND a.summary != ''
+                GROUP BY a.id, a.cluster_hash, a.summary
+            """, (int(window),))
+            rows = cursor.fetchall()
+            connection.commit()
+            self.last_refresh = refreshed_at
+        except Error as e:
+            print(f"⚠ Cluster refresh failed: {e}")
+            return 0
+        finally:
+            cursor.close()
+
+        cutoff = time.time() - self.window_hours * 3600
+        added = 0
+        with self.lock:
+            self.clusters = [c for c in self.clusters if c.seen_at >= cutoff]
+            for article_id, fingerprint, summary, category_ids in rows:
+                if article_id in self.loaded_ids:
+                    continue
+                self.loaded_ids.add(article_id)
+                ids = [int(i) for i in (category_ids or '').split(',') if i]
+                self.clusters.append(Cluster(article_id, int(fingerprint), summary, ids))
+                added += 1
+        return added
+
+    def join(self, article_id, fingerprint):
+        """Find this article's cluster. Returns (cluster, is_representative, distance);
+        a new cluster led by the article is opened when nothing is close enough."""
+        with self.lock:
+            best, best_distance = None, None
+            for cluster in self.clusters:
+                distance = self.distance(cluster.fingerprint, fingerprint)
+                if distance <= self.max_distance and (best is None or distance < best_distance):
+                    best, best_distance = cluster, distance
+            if best is not None and best.canonical_id != article_id:
+                return best, False, best_distance
+            if best is None:
+                best = Cluster(article_id, fingerprint)
+                self.clusters.append(best)
+                self.stats['representatives'] += 1
+            return best, True, 0
+
+    def resolve(self, cluster, can_defer=True):
+        """Non-blocking look at the representative. Returns (summary, defer): its summary once it
+        is in; defer while it is still running (for up to CLUSTER_WAIT_SECONDS after it started);
+        (None, False) when it failed, took too long, or the copy cannot be deferred, and the copy
+        is summarized on its own."""
+        with self.lock:
+            if cluster.done.is_set() and cluster.summary:
+                self.stats['copies'] += 1
+                return cluster.summary, False
+            if (can_defer and not cluster.done.is_set()
+                    and time.time() - cluster.seen_at < self.wait_seconds):
+                self.stats['deferred'] += 1
+                return None, True
+            self.stats['fallbacks'] += 1
+            return None, False
+
+    def complete(self, cluster, summary=None, category_ids=()):
+        """Publish the representative's result; a failed one is dropped so the next copy leads"""
+        if cluster.done.is_set():
+            return
+        if summary:
+            cluster.summary = summary
+            cluster.category_ids = tuple(category_ids)
+        else:
+            with self.lock:
+                if cluster in self.clusters:
+                    self.clusters.remove(cluster)
+        cluster.done.set()
+
+    def summary_line(self, calls_per_article):
+        s = self.stats
+        return (f"Clusters: {s['copies']} near-duplicates reused a summary "
+                f"({s['copies'] * calls_per_article} LLM calls saved), {s['representatives']} new clusters, "
+                f"{s['deferred']} deferrals, {s['fallbacks']} summarized on their own")
@@ -0,0 +1,319 @@
+#!/usr/bin/env python3
+"""
+Article Queue - lease-based claiming of articles that need summaries
+Each summarizer process claims its batch with SELECT ... FOR UPDATE SKIP LOCKED and
+stamps claimed_by/claimed_until, so several processes (on one host or many) can drain
+the backlog without picking the same rows. Leases are renewed while a batch is in
+progress and released at the end; a crashed process's leases simply expire.
+With sql/002_summary_queue_state.sql applied, eligibility is an explicit summary_state
+plus next_retry_at (set from RETRY_BACKOFF_HOURS when an attempt fails) and the claim is
+one index range scan per state. With sql/003_summary_priority.sql, claims are ordered by a stored
+priority_score (recency, source weight, readership, retry state) instead of age alone.
+With sql/006_provisional_summaries.sql (on top of 002), articles holding a provisional
+extractive summary stay claimable until an LLM summary replaces it.
+Without the 001/002/003 columns it falls back to the legacy predicate and order and to
+unclaimed reads.
+"""
+
+import os
+import socket
+import time
+from mysql.connector import Error
+
+
+# Hours to wait before retry N (summary_retry_count after the Nth failure); no retry after the last
+RETRY_BACKOFF_HOURS = {1: 1, 2: 6, 3: 12, 4: 24}
+MAX_ATTEMPTS = 5
+# Failed articles older than this are not retried
+RETRY_MAX_AGE_HOURS = 24
+
+# Eligibility from summary_state, queried one state at a time so each branch is a range scan
+# over idx_articles_summary_queue (or idx_articles_summary_priority when ordered by priority)
+STATE_BRANCHES_SQL = (
+    "a.summary_state = 'pending'",
+    "a.summary_state = 'retry' AND a.next_retry_at <= NOW()",
+)
+STATE_ELIGIBLE_SQL = """
+    {state}
+    AND {summary_missing}
+    AND (s.isActive = 'Y' OR s.id IS NULL)
+"""
+SUMMARY_MISSING_SQL = "(a.summary IS NULL OR a.summary = '')"
+# A provisional (extractive) summary counts as missing so an LLM pass can replace it
+SUMMARY_UPGRADABLE_SQL = "(a.summary IS NULL OR a.summary = '' OR a.isSummaryProvisional = 'Y')"
+
+# Newest first within a state; pending (never attempted) rows come before due retries
+STATE_ORDER_SQL = "a.scraped_at DESC"
+
+# Highest priority first; the score already folds in recency and the retry penalty
+PRIORITY_ORDER_SQL = "a.priority_score DESC"
+
+# Legacy eligibility: no summary yet, active source, and either never failed or due for a retry
+ELIGIBLE_SQL = """
+    (a.summary IS NULL OR a.summary = '')
+    AND (s.isActive = 'Y' OR s.id IS NULL)
+    AND (a.summary_retry_count IS NULL OR a.summary_retry_count < 5)
+    AND (
+        -- Never attempted or not marked as failed
+        (a.isSummaryFailed IS NULL OR a.isSummaryFailed != 'Y')
+        OR
+        -- Failed but eligible for retry (only if article is less than 1 day old, max 5 attempts)
+        (a.isSummaryFailed = 'Y'
+            AND a.scraped_at >= DATE_SUB(NOW(), INTERVAL 1 DAY)
+            AND (
+                -- Retry 1: after 1 hour (retry_count = 1)
+                (a.summary_retry_count = 1 AND a.summary_last_attempt < DATE_SUB(NOW(), INTERVAL 1 HOUR))
+                OR
+                -- Retry 2: after 6 hours (retry_count = 2)
+                (a.summary_retry_count = 2 AND a.summary_last_attempt < DATE_SUB(NOW(), INTERVAL 6 HOUR))
+                OR
+                -- Retry 3: after 12 hours (retry_count = 3)
+                (a.summary_retry_count = 3 AND a.summary_last_attempt < DATE_SUB(NOW(), INTERVAL 12 HOUR))
+                OR
+                -- Retry 4: after 24 hours (retry_count = 4, final attempt)
+                (a.summary_retry_count = 4 AND a.summary_last_attempt < DATE_SUB(NOW(), INTERVAL 24 HOUR))
+            )
+        )
+    )
+"""
+
+ORDER_SQL = """
+    -- First-time articles first (never failed), retries last
+    CASE WHEN (a.isSummaryFailed IS NULL OR a.isSummaryFailed != 'Y') THEN 0 ELSE 1 END,
+    -- Within each group, newest articles first
+    a.scraped_at DESC
+"""
+
+SELECT_COLUMNS = """
+    a.id, a.source_id, a.title, a.url, a.fullArticle, a.summary_retry_count, s.mainCategory, s.name as source_name,
+    TIMESTAMPDIFF(MINUTE, a.scraped_at, NOW()) AS age_minutes
+"""
+
+
+def retry_delay_minutes(retry_count):
+    """Minutes until the next attempt after `retry_count` failures, or None when none is left"""
+    hours = RETRY_BACKOFF_HOURS.get(retry_count)
+    return None if hours is None or retry_count >= MAX_ATTEMPTS else hours * 60
+
+
+class ArticleQueue:
+    """Claims, renews and releases article leases for one summarizer process"""
+
+    def __init__(self, connection, worker_id=None, lease_seconds=None):
+        self.connection = connection
+        self.worker_id = (worker_id or os.getenv('SUMMARIZER_WORKER_ID')
+                          or f"{socket.gethostname()}:{os.getpid()}")[:64]
+        try:
+            self.lease_seconds = max(int(lease_seconds or os.getenv('SUMMARY_CLAIM_LEASE_SECONDS', 1800)), 60)
+        except ValueError:
+            self.lease_seconds = 1800
+        self.last_renewal = 0.0
+        self.claims_enabled = self._has_column('claimed_until')
+        if not self.claims_enabled:
+            print("⚠ articles.claimed_by/claimed_until missing (apply sql/001_article_claims.sql); "
+                  "running without leases")
+        self.state_enabled = self._has_column('next_retry_at')
+        if not self.state_enabled:
+            print("⚠ articles.summary_state/next_retry_at missing (apply sql/002_summary_queue_state.sql); "
+                  "using the legacy retry-window query")
+        self.priority_enabled = self.state_enabled and self._has_column('priority_score')
+        # Only the summary_state queue re-claims an article that already has a (provisional) summary
+        self.provisional_enabled = self.state_enabled and self._has_column('isSummaryProvisional')
+        if not self.provisional_enabled:
+            print("⚠ articles.isSummaryProvisional or summary_state missing (apply sql/002 and "
+                  "sql/006_provisional_summaries.sql); extractive fallback summaries disabled")
+        self.eligible_sql = [ELIGIBLE_SQL]
+        if self.state_enabled:
+            summary_missing = SUMMARY_UPGRADABLE_SQL if self.provisional_enabled else SUMMARY_MISSING_SQL
+            self.eligible_sql = [STATE_ELIGIBLE_SQL.format(state=state, summary_missing=summary_missing)
+                                 for state in STATE_BRANCHES_SQL]
+        self.select_columns = (SELECT_COLUMNS
+                               + (", a.priority_score" if self.priority_enabled else "")
+                               + (", a.isSummaryProvisional" if self.provisional_enabled else ""))
+        self.order_sql = (PRIORITY_ORDER_SQL if self.priority_enabled
+                          else STATE_ORDER_SQL if self.state_enabled else ORDER_SQL)
+
+        # Priority bonuses/penalties, in hours of recency they are worth
+        self.source_bonus_hours = self._env_float('SUMMARY_PRIORITY_SOURCE_HOURS', 12)
+        self.reader_bonus_hours = self._env_float('SUMMARY_PRIORITY_READER_HOURS', 24)
+        self.retry_penalty_hours = self._env_float('SUMMARY_PRIORITY_RETRY_HOURS', 6)
+        self.full_refresh_seconds = self._env_float('SUMMARY_PRIORITY_REFRESH_SECONDS', 300)
+        # A full pass updates this many ids per statement so claims are not stalled behind its row locks
+        self.refresh_batch = int(self._env_float('SUMMARY_PRIORITY_REFRESH_BATCH', 5000)) or 5000
+        self.last_full_refresh = 0.0
+
+    @staticmethod
+    def _env_float(name, default):
+        try:
+            value = float(os.getenv(name, default))
+            return value if value >= 0 else default
+        except ValueError:
+            return default
+
+    def _has_column(self, name):
+        cursor = self.connection.cursor()
+        try:
+            cursor.execute("SHOW COLUMNS FROM articles LIKE %s", (name,))
+            return cursor.fetchone() is not None
+        except Error:
+            return False
+        finally:
+            cursor.close()
+
+    def refresh_priorities(self, full=None):
+        """Recompute priority_score for queued articles. A full pass (every
+        SUMMARY_PRIORITY_REFRESH_SECONDS) picks up weight and subscription changes in id-range
+        batches; otherwise only unscored new rows and retries are touched, both found through
+        idx_articles_summary_priority. One process refreshes at a time; the others skip it."""
+        if not self.priority_enabled:
+            return 0
+        if full is None:
+            full = time.time() - self.last_full_refresh >= self.full_refresh_seconds
+        cursor = self.connection.cursor()
+        try:
+            cursor.execute("SELECT GET_LOCK('summary_priority_refresh', 0)")
+            if not cursor.fetchone()[0]:
+                return 0
+            try:
+                updated = self._update_priorities(cursor, full)
+            finally:
+                cursor.execute("SELECT RELEASE_LOCK('summary_priority_refresh')")
+                cursor.fetchone()
+            if full:
+                self.last_full_refresh = time.time()
+            return updated
+        except Error as e:
+            self.connection.rollback()
+            print(f"⚠ Priority refresh failed: {e}")
+            return 0
+        finally:
+            cursor.close()
+
+    def _update_priorities(self, cursor, full):
+        cursor.execute("SELECT COUNT(*) FROM users WHERE isActive = 'Y'")
+        active_users = max(cursor.fetchone()[0] or 0, 1)
+        ranges = [None]
+        if full:
+            cursor.execute("SELECT MIN(id), MAX(id) FROM articles WHERE summary_state IN ('pending', 'retry')")
+            low, high = cursor.fetchone()
+            ranges = [(start, min(start + self.refresh_batch - 1, high))
+                      for start in range(low, high + 1, self.refresh_batch)] if low is not None else []
+        scope = "AND a.id BETWEEN %s AND %s" if full else "AND (a.priority_score = 0 OR a.summary_state = 'retry')"
+
+        updated = 0
+        for id_range in ranges:
+            # Base sources are read by every active user; others by their users_sources subscribers
+            cursor.execute(f"""
+                UPDATE articles a
+                LEFT JOIN (
+                    SELECT s.id AS source_id, s.priority_weight AS weight,
+                           CASE WHEN s.isBase = 'Y' THEN %s ELSE COUNT(us.user_id) END AS readers
+                    FROM sources s
+                    LEFT JOIN users_sources us ON us.source_id = s.id
+                    GROUP BY s.id, s.priority_weight, s.isBase
+                ) r ON r.source_id = a.source_id
+                SET a.priority_score = UNIX_TIMESTAMP(a.scraped_at) DIV 60 + ROUND(60 * (
+                      %s * (COALESCE(r.weight, 1) - 1)
+                    + %s * LN(1 + LEAST(COALESCE(r.readers, 0), %s)) / LN(1 + %s)
+                    - %s * COALESCE(a.summary_retry_count, 0)))
+                WHERE a.summary_state IN ('pending', 'retry') {scope}
+            """, (active_users, self.source_bonus_hours, self.reader_bonus_hours, active_users,
+                  active_users, self.retry_penalty_hours) + (id_range or ()))
+            updated += cursor.rowcount
+            self.connection.commit()
+        return updated
+
+    def _select(self, cursor, limit, claimable=False):
+        """Eligible articles in claim order, merged from one query per eligibility branch.
+        With claimable, only unleased rows, locked for this transaction (rows held by another
+        process are skipped); rows of a branch that do not make the cut are unlocked at commit."""
+        lease_sql = "AND (a.claimed_until IS NULL OR a.claimed_until < NOW())" if claimable else ""
+        lock_sql = "FOR UPDATE OF a SKIP LOCKED" if claimable else ""
+        articles = []
+        for eligible_sql in self.eligible_sql:
+            cursor.execute(f"""
+                SELECT {self.select_columns}
+                FROM articles a
+                LEFT JOIN sources s ON a.source_id = s.id
+                WHERE {eligible_sql}
+                {lease_sql}
+                ORDER BY {self.order_sql}
+                LIMIT %s
+                {lock_sql}
+            """, (limit,))
+            articles.extend(cursor.fetchall())
+            if not self.priority_enabled and len(articles) >= limit:
+                break  # Earlier branches come first
+        if self.priority_enabled:
+            articles.sort(key=lambda article: article['priority_score'], reverse=True)
+        return articles[:limit]
+
+    def claim(self, limit):
+        """Claim up to `limit` eligible articles for this worker and return them"""
+        self.refresh_priorities()
+        cursor = self.connection.cursor(dictionary=True)
+        try:
+            if not self.claims_enabled:
+                return self._select(cursor, limit)
+
+            # End any implicit read transaction so the claim sees (and locks) current rows
+            self.connection.commit()
+            self.connection.start_transaction()
+            articles = self._select(cursor, limit, claimable=True)
+            if articles:
+                ids = [article['id'] for article in articles]
+                cursor.execute(f"""
+                    UPDATE articles
+                    SET claimed_by = %s,
+                        claimed_until = DATE_ADD(NOW(), INTERVAL %s SECOND)
+                    WHERE id IN ({', '.join(['%s'] * len(ids))})
+                """, [self.worker_id, self.lease_seconds] + ids)
+            self.connection.commit()
+            self.last_renewal = time.time()
+            return articles
+        except Error:
+            self.connection.rollback()
+            raise
+        finally:
+            cursor.close()
+
+    def renew(self, force=False):
+        """Extend this worker's live leases (the result writer clears each article's lease with its
+        result, so only articles still in progress are renewed); cheap no-op until a third of the
+        lease has passed"""
+        if not self.claims_enabled or (not force and time.time() - self.last_renewal < self.lease_seconds / 3):
+            return 0
+        cursor = self.connection.cursor()
+        try:
+            cursor.execute("""
+                UPDATE articles
+                SET claimed_until = DATE_ADD(NOW(), INTERVAL %s SECOND)
+                WHERE claimed_by = %s AND claimed_until >= NOW()
+            """, (self.lease_seconds, self.worker_id))
+            self.connection.commit()
+            self.last_renewal = time.time()
+            return cursor.rowcount
+        except Error as e:
+            print(f"⚠ Lease renewal failed: {e}")
+            return 0
+        finally:
+            cursor.close()
+
+    def release(self):
+        """Drop every lease this worker still holds (articles it skipped become claimable again)"""
+        if not self.claims_enabled:
+            return 0
+        cursor = self.connection.cursor()
+        try:
+            cursor.execute("""
+                UPDATE articles
+                SET claimed_by = NULL, claimed_until = NULL
+                WHERE claimed_by = %s
+            """, (self.worker_id,))
+            self.connection.commit()
+            return cursor.rowcount
+        except Error as e:
+            print(f"⚠ Lease release failed: {e}")
+            return 0
+        finally:
+            cursor.close()
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+Benchmark: cookie/paywall/AI-failure pattern classification
+Times the per-article checks the summarizer makes (consent check on the fetched text,
+consent check again before summarizing, paywall check on save, failure check on the
+AI response) with four implementations:
+
+  legacy   the previous inline `in` scans (lower() per call, per-pattern lower() for failures)
+  regex    one alternation per pattern set, lookahead so overlapping/prefix patterns all hit
+  aho      pure-Python Aho-Corasick automaton per pattern set
+  module   text_classifier (precompiled sets, one lower() per text, memoized classify())
+
+Usage:
+    python3 benchmarks/bench_classifier.py [--repeat 200] [--kb 10]
+"""
+
+import os
+import re
+import sys
+import glob
+import time
+import argparse
+from collections import deque
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import text_classifier
+from text_classifier import COOKIE_STRONG, COOKIE_WEAK, PAYWALL, PAYWALL_SHORT, AI_FAILURE
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+RESPONSE = ("Stocks rallied after a cooler inflation report, with chipmakers leading gains and "
+            "Treasury yields falling as traders priced in a December rate cut.")
+
+
+def cookie_rule(strong, weak, length):
+    return strong >= 2 or (strong >= 1 and weak >= 2) or (length < 2000 and strong >= 1 and weak >= 1)
+
+
+def paywall_rule(paywall_hits, short_hits, length):
+    return bool(paywall_hits) or (length < 300 and bool(short_hits))
+
+
+# --- legacy -----------------------------------------------------------------
+
+def legacy_cookie(content):
+    content_lower = content.lower()
+    strong = sum(1 for p in COOKIE_STRONG.patterns if p in content_lower)
+    weak = sum(1 for p in COOKIE_WEAK.patterns if p in content_lower)
+    return cookie_rule(strong, weak, len(content))
+
+
+def legacy_paywall(content):
+    content_lower = content.lower()
+    if any(p in content_lower for p in PAYWALL.patterns):
+        return True
+    return len(content) < 300 and any(p in content_lower for p in PAYWALL_SHORT.patterns)
+
+
+def legacy_failure(result):
+    return any(pattern.lower() in result.lower() for pattern in AI_FAILURE.patterns)
+
+
+# --- regex alternation ------------------------------------------------------
+
+def compile_regex(patterns):
+    """Lookahead alternation: reports the longest pattern starting at each position;
+    shorter patterns that are prefixes of it are added from a precomputed table"""
+    ordered = sorted(patterns, key=len, reverse=True)
+    prefixes = {p: {q for q in patterns if p.startswith(q)} for p in patterns}
+    return re.compile('(?=(' + '|'.join(map(re.escape, ordered)) + '))'), prefixes
+
+
+REGEX = {name: compile_regex(s.patterns) for name, s in
+         (('strong', COOKIE_STRONG), ('weak', COOKIE_WEAK), ('paywall', PAYWALL),
+          ('short', PAYWALL_SHORT), ('failure', AI_FAILURE))}
+
+
+def regex_hits(name, lowered):
+    pattern, prefixes = REGEX[name]
+    hits = set()
+    for match in pattern.finditer(lowered):
+        hits |= prefixes[match.group(1)]
+    return hits
+
+
+def regex_cookie(content):
+    lowered = content.lower()
+    return cookie_rule(len(regex_hits('strong', lowered)), len(regex_hits('weak', lowered)), len(content))
+
+
+def regex_paywall(content):
+    lowered = content.lower()
+    return paywall_rule(regex_hits('paywall', lowered), regex_hits('short', lowered), len(content))
+
+
+def regex_failure(result):
+    return bool(regex_hits('failure', result.lower()))
+
+
+# --- pure-Python Aho-Corasick -----------------------------------------------
+
+class AhoCorasick:
+    def __init__(self, patterns):
+        self.goto = [{}]
+        self.fail = [0]
+        self.out = [()]
+        for pattern in patterns:
+            state = 0
+            for ch in pattern:
+                if ch not in self.goto[state]:
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.out.append(())
+                    self.goto[state][ch] = len(self.goto) - 1
+                state = self.goto[state][ch]
+            self.out[state] += (pattern,)
+        queue = deque(self.goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, child in self.goto[node].items():
+                queue.append(child)
+                fallback = self.fail[node]
+                while fallback and ch not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                target = self.goto[fallback].get(ch, 0)
+                self.fail[child] = target if target != child else 0
+                self.out[child] += self.out[self.fail[child]]
+
+    def hits(self, lowered):
+        goto, fail, out = self.goto, self.fail, self.out
+        state = 0
+        found = set()
+        for ch in lowered:
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if out[state]:
+                found.update(out[state])
+        return found
+
+
+AHO = {name: AhoCorasick(s.patterns) for name, s in
+       (('strong', COOKIE_STRONG), ('weak', COOKIE_WEAK), ('paywall', PAYWALL),
+        ('short', PAYWALL_SHORT), ('failure', AI_FAILURE))}
+
+
+def aho_cookie(content):
+    lowered = content.lower()
+    return cookie_rule(len(AHO['strong'].hits(lowered)), len(AHO['weak'].hits(lowered)), len(content))
+
+
+def aho_paywall(content):
+    lowered = content.lower()
+    return paywall_rule(AHO['paywall'].hits(lowered), AHO['short'].hits(lowered), len(content))
+
+
+def aho_failure(result):
+    return bool(AHO['failure'].hits(result.lower()))
+
+
+IMPLEMENTATIONS = {
+    'legacy': (legacy_cookie, legacy_paywall, legacy_failure),
+    'regex': (regex_cookie, regex_paywall, regex_failure),
+    'aho': (aho_cookie, aho_paywall, aho_failure),
+    'module': (text_classifier.is_cookie_consent, text_classifier.has_paywall, text_classifier.is_ai_failure),
+}
+
+
+def load_texts(kb):
+    texts = []
+    for path in sorted(glob.glob(os.path.join(FIXTURE_DIR, '*.html'))):
+        with open(path, encoding='utf-8') as f:
+            text = ' '.join(re.sub(r'<[^>]+>', ' ', f.read()).split())
+        texts.append((os.path.basename(path), (text + ' ') * (kb * 1024 // max(len(text), 1) + 1)))
+    return [(name, text[:kb * 1024]) for name, text in texts]
+
+
+def per_article(impl, text):
+    cookie, paywall, failure = impl
+    fetched = cookie(text)
+    before_summary = cookie(text)
+    saved = paywall(text[:50000])
+    return fetched, before_summary, saved, failure(RESPONSE)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark cookie/paywall/failure classification")
+    parser.add_argument("--repeat", type=int, default=200, help="Articles per implementation (default: 200)")
+    parser.add_argument("--kb", type=int, default=10, help="Article text size in KB (default: 10, the summarizer cap)")
+    args = parser.parse_args()
+
+    texts = load_texts(args.kb)
+    expected = {name: per_article(IMPLEMENTATIONS['legacy'], text) for name, text in texts}
+
+    print(f"{args.kb} KB texts, 4 checks per article")
+    for label, impl in IMPLEMENTATIONS.items():
+        for name, text in texts:
+            assert per_article(impl, text) == expected[name], f"{label} disagrees on {name}"
+        start = time.perf_counter()
+        for i in range(args.repeat):
+            name, text = texts[i % len(texts)]
+            # Distinct text per article so the module's memo only helps within one article
+            per_article(impl, f"{i} {text}")
+        ms = (time.perf_counter() - start) * 1000 / args.repeat
+        print(f"  {label:<7} {ms:>7.3f} ms/article")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Benchmark: pre-LLM content compression
+Reports input tokens before/after compression and compression time per article.
+With --live PROVIDER it also times the provider on the raw and compressed prompts.
+
+Usage:
+    python3 benchmarks/bench_compression.py                    # HTML fixtures
+    python3 benchmarks/bench_compression.py --db 25            # 25 most recent fullArticle rows
+    python3 benchmarks/bench_compression.py --budget 600 --live anthropic
+"""
+
+import os
+import sys
+import glob
+import time
+import argparse
+from html.parser import HTMLParser
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from content_compressor import ContentCompressor
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+
+class _TextLines(HTMLParser):
+    """Collects one line per text block, boilerplate included, like a naive extractor"""
+
+    BLOCKS = {'p', 'li', 'h1', 'h2', 'h3', 'figcaption'}
+
+    def __init__(self):
+        super().__init__()
+        self.lines = []
+        self.depth = 0
+        self.skip = 0
+        self.buffer = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag in ('script', 'style'):
+            self.skip += 1
+        elif tag in self.BLOCKS:
+            self.depth += 1
+
+    def handle_endtag(self, tag):
+        if tag in ('script', 'style'):
+            self.skip -= 1
+        elif tag in self.BLOCKS and self.depth:
+            self.depth -= 1
+            text = ' '.join(''.join(self.buffer).split())
+            if text:
+                self.lines.append(text)
+            self.buffer = []
+
+    def handle_data(self, data):
+        if self.depth and not self.skip:
+            self.buffer.append(data)
+
+
+def load_fixtures():
+    samples = []
+    for path in sorted(glob.glob(os.path.join(FIXTURE_DIR, '*.html'))):
+        parser = _TextLines()
+        with open(path, encoding='utf-8') as f:
+            parser.feed(f.read())
+        title = parser.lines[0] if parser.lines else ''
+        samples.append((os.path.basename(path), title, '\n\n'.join(parser.lines)))
+    return samples
+
+
+def load_from_db(limit):
+    import env_loader  # noqa: F401  Auto-loads .env
+    import mysql.connector
+    conn = mysql.connector.connect(
+        host=os.getenv('DB_HOST'), database=os.getenv('DB_NAME'),
+        user=os.getenv('DB_USER'), password=os.getenv('DB_PASS')
+    )
+    cursor = conn.cursor(dictionary=True)
+    cursor.execute("""
+        SELECT id, title, fullArticle FROM articles
+        WHERE fullArticle IS NOT NULL AND LENGTH(fullArticle) > 1000
+        ORDER BY scraped_at DESC LIMIT %s
+    """, (limit,))
+    rows = cursor.fetchall()
+    cursor.close()
+    conn.close()
+    return [(f"article {r['id']}", r['title'], r['fullArticle'][:10000]) for r in rows]
+
+
+def time_provider(summarizer, provider, title, content):
+    prompt = summarizer._summary_prompt(title, content)
+    start = time.perf_counter()
+    result = summarizer._dispatch_provider(provider, prompt, 250)
+    return time.perf_counter() - start, bool(result)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark pre-LLM content compression")
+    parser.add_argument("--db", type=int, metavar="N", help="Use the N most recent articles from MySQL")
+    parser.add_argument("--budget", type=int, help="Token budget (default: AI_TOKEN_BUDGET or 1800)")
+    parser.add_argument("--live", metavar="PROVIDER", help="Also time PROVIDER on raw vs compressed prompts")
+    args = parser.parse_args()
+
+    samples = load_from_db(args.db) if args.db else load_fixtures()
+    compressor = ContentCompressor()
+    compressor.enabled = True
+    budget = args.budget or compressor.default_budget
+
+    summarizer = None
+    if args.live:
+        from summarizer_parallel import ParallelSummarizer
+        summarizer = ParallelSummarizer()
+
+    print(f"{'sample':<32} {'in tok':>7} {'out tok':>7} {'saved':>6} {'ms':>7}" +
+          (f" {'raw s':>7} {'comp s':>7}" if summarizer else ""))
+    totals = {'in': 0, 'out': 0, 'ms': 0.0, 'raw': 0.0, 'comp': 0.0}
+    for name, title, content in samples:
+        start = time.perf_counter()
+        compressed, stats = compressor.compress(title, content, budget)
+        ms = (time.perf_counter() - start) * 1000
+        saved = stats['input_tokens'] - stats['output_tokens']
+        line = f"{name[:32]:<32} {stats['input_tokens']:>7} {stats['output_tokens']:>7} {saved:>6} {ms:>7.2f}"
+        totals['in'] += stats['input_tokens']
+        totals['out'] += stats['output_tokens']
+        totals['ms'] += ms
+        if summarizer:
+            raw_s, _ = time_provider(summarizer, args.live, title, content)
+            comp_s, _ = time_provider(summarizer, args.live, title, compressed)
+            totals['raw'] += raw_s
+            totals['comp'] += comp_s
+            line += f" {raw_s:>7.2f} {comp_s:>7.2f}"
+        print(line)
+
+    n = max(len(samples), 1)
+    saved = totals['in'] - totals['out']
+    print("-" * 64)
+    print(f"{len(samples)} samples, budget {budget}: {saved} tokens saved "
+          f"({saved / max(totals['in'], 1) * 100:.0f}%), {totals['ms'] / n:.2f} ms/article to compress")
+    if summarizer:
+        print(f"{args.live} latency: raw {totals['raw'] / n:.2f}s vs compressed {totals['comp'] / n:.2f}s per article")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Benchmark: article body extraction
+Times the legacy multi-pass extraction (article tag, class-matched containers, then
+every paragraph, each pass re-running find_all('p')) against the single-pass
+content_extractor, and compares output length. Each fixture is parsed once and both
+extractors run on that same tree, so the parse is timed separately instead of being
+subtracted. Fixtures whose body is embedded as JSON take the structured-data path,
+which skips the parse altogether and is timed on the raw HTML.
+
+Usage:
+    python3 benchmarks/bench_extraction.py                 # HTML fixtures
+    python3 benchmarks/bench_extraction.py --repeat 50
+    python3 benchmarks/bench_extraction.py --show          # print both outputs
+"""
+
+import os
+import sys
+import glob
+import time
+import argparse
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from bs4 import BeautifulSoup
+from content_extractor import extract_content
+from structured_data import extract_structured
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+
+def legacy_extract(soup):
+    """The extraction chain previously inlined in ParallelSummarizer.get_article_content
+    (after its BeautifulSoup parse); strips script/nav/... from the tree in place"""
+    for element in soup(['script', 'style', 'nav', 'header', 'footer', 'aside']):
+        element.decompose()
+
+    content = ""
+    article_body = soup.find('article')
+    if article_body:
+        paragraphs = article_body.find_all('p')
+        content = '\n\n'.join([p.get_text(strip=True) for p in paragraphs[:40]])
+
+    if not content or len(content) < 500:
+        containers = soup.find_all(['div', 'section', 'main'], class_=lambda x: x and any(
+            term in str(x).lower() for term in ['content', 'article', 'post', 'body', 'text', 'story']
+        ))
+        for container in containers[:8]:
+            paragraphs = container.find_all('p')
+            if paragraphs:
+                content = '\n\n'.join([p.get_text(strip=True) for p in paragraphs[:40]])
+                if len(content) > 500:
+                    break
+
+    if not content or len(content) < 500:
+        all_paragraphs = soup.find_all('p')
+        good_paragraphs = [
+            p.get_text(strip=True)
+            for p in all_paragraphs
+            if len(p.get_text(strip=True)) > 50
+        ]
+        content = '\n\n'.join(good_paragraphs[:40])
+
+    return content[:10000]
+
+
+def time_it(func, arg, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = func(arg)
+    return (time.perf_counter() - start) * 1000 / repeat, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark article body extraction")
+    parser.add_argument("--repeat", type=int, default=20, help="Runs per fixture (default: 20)")
+    parser.add_argument("--show", action="store_true", help="Print both extractions")
+    args = parser.parse_args()
+
+    print(f"{'fixture':<26} {'parse ms':>8} {'legacy ms':>9} {'new ms':>7} {'legacy ch':>9} {'new ch':>7} "
+          f"{'conf':>5} {'path':<10}")
+    totals = {'parse': 0.0, 'legacy': 0.0, 'new': 0.0}
+    for path in sorted(glob.glob(os.path.join(FIXTURE_DIR, '*.html'))):
+        with open(path, encoding='utf-8') as f:
+            html = f.read()
+        parse_ms, soup = time_it(lambda h: BeautifulSoup(h, 'html.parser'), html, args.repeat)
+        _, structured = extract_structured(html)
+        # The single-pass extractor only reads the tree; the legacy chain decomposes tags, so it goes second
+        new_ms, (new_text, confidence) = time_it(
+            lambda doc: extract_content(doc, max_paragraphs=40, max_chars=10000),
+            html if structured else soup, args.repeat)
+        legacy_ms, legacy_text = time_it(legacy_extract, soup, args.repeat)
+        totals['parse'] += parse_ms
+        totals['legacy'] += legacy_ms
+        totals['new'] += new_ms
+        print(f"{os.path.basename(path)[:26]:<26} {parse_ms:>8.2f} {legacy_ms:>9.2f} {new_ms:>7.2f} "
+              f"{len(legacy_text):>9} {len(new_text):>7} {confidence:>5.2f} {structured or 'dom':<10}")
+        if args.show:
+            print(f"--- legacy ---\n{legacy_text}\n--- new ---\n{new_text}\n")
+
+    print("-" * 88)
+    legacy_ms, new_ms = totals['legacy'], totals['new']
+    print(f"extraction on a parsed tree: legacy {legacy_ms:.2f} ms, single-pass {new_ms:.2f} ms "
+          f"({legacy_ms / max(new_ms, 1e-9):.1f}x); parsing {totals['parse']:.2f} ms "
+          f"(not needed on the structured path)")
+
+
+if __name__ == "__main__":
+    main()
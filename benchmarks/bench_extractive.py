@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Benchmark: extractive fallback summarizer
+Times ExtractiveSummarizer per article and reports summary length against the word
+limit. With --show it prints each summary next to the title for a quick quality check.
+
+Usage:
+    python3 benchmarks/bench_extractive.py                 # HTML fixtures
+    python3 benchmarks/bench_extractive.py --db 25         # 25 most recent fullArticle rows
+    python3 benchmarks/bench_extractive.py --repeat 50 --words 60 --show
+"""
+
+import os
+import sys
+import time
+import argparse
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from extractive_summarizer import ExtractiveSummarizer
+from bench_compression import load_fixtures, load_from_db
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the extractive fallback summarizer")
+    parser.add_argument("--db", type=int, metavar="N", help="Use the N most recent articles from MySQL")
+    parser.add_argument("--words", type=int, help="Word limit (default: SUMMARY_WORD_LIMIT or 100)")
+    parser.add_argument("--repeat", type=int, default=20, help="Runs per sample (default 20)")
+    parser.add_argument("--show", action="store_true", help="Print each summary")
+    args = parser.parse_args()
+
+    samples = load_from_db(args.db) if args.db else load_fixtures()
+    words = args.words or int(os.getenv('SUMMARY_WORD_LIMIT', 100))
+    summarizer = ExtractiveSummarizer(word_limit=words)
+    summarizer.enabled = True
+
+    print(f"{'sample':<32} {'in words':>8} {'sents':>6} {'out words':>9} {'ms':>7}")
+    total_ms = 0.0
+    empty = 0
+    for name, title, content in samples:
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            summary = summarizer.summarize(title, content)
+        ms = (time.perf_counter() - start) * 1000 / args.repeat
+        total_ms += ms
+        out_words = len(summary.split()) if summary else 0
+        empty += 0 if summary else 1
+        print(f"{name[:32]:<32} {len(content.split()):>8} {len(summarizer.sentences(title, content)):>6} "
+              f"{out_words:>9} {ms:>7.2f}")
+        if args.show:
+            print(f"  {title[:100]}\n  → {summary or '(none)'}\n")
+
+    n = max(len(samples), 1)
+    print("-" * 66)
+    print(f"{len(samples)} samples, limit {words} words: {total_ms / n:.2f} ms/article, "
+          f"{empty} without a summary")
+
+
+if __name__ == "__main__":
+    main()
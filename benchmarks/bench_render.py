@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Playwright render throughput
+Compares launching a fresh Chromium per URL (the old code path) against the
+long-lived RenderService pool, rendering the same URLs with the same concurrency.
+With --blocking it instead compares the pool with resource blocking off and on
+(bytes per page and render time come from the service summary line).
+
+Usage:
+    python3 benchmarks/bench_render.py URL [URL ...] [--threads 5] [--workers 2]
+    python3 benchmarks/bench_render.py --db 20      # 20 most recent article URLs
+    python3 benchmarks/bench_render.py --db 20 --blocking
+"""
+
+import os
+import sys
+import time
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from render_service import RenderService, DEFAULT_USER_AGENT, LAUNCH_ARGS
+from render_profile import RenderProfile
+
+
+def render_fresh_browser(url, timeout=60):
+    """Old path: one sync_playwright session and browser launch per URL, in the calling thread"""
+    from playwright.sync_api import sync_playwright
+    try:
+        with sync_playwright() as p:
+            browser = p.chromium.launch(headless=True, args=LAUNCH_ARGS)
+            page = browser.new_page(user_agent=DEFAULT_USER_AGENT, viewport={'width': 1920, 'height': 1080})
+            page.goto(url, wait_until='domcontentloaded', timeout=timeout * 1000)
+            html = page.content()
+            browser.close()
+            return html
+    except Exception:
+        return ''
+
+
+def load_urls_from_db(limit):
+    import env_loader  # noqa: F401  Auto-loads .env
+    import mysql.connector
+    conn = mysql.connector.connect(
+        host=os.getenv('DB_HOST'), database=os.getenv('DB_NAME'),
+        user=os.getenv('DB_USER'), password=os.getenv('DB_PASS')
+    )
+    cursor = conn.cursor()
+    cursor.execute("SELECT url FROM articles ORDER BY scraped_at DESC LIMIT %s", (limit,))
+    urls = [row[0] for row in cursor.fetchall()]
+    cursor.close()
+    conn.close()
+    return urls
+
+
+def run(label, render, urls, threads):
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        pages = list(executor.map(render, urls))
+    elapsed = time.perf_counter() - start
+    ok = sum(1 for html in pages if html)
+    print(f"{label:<22} {len(urls):>4} urls {ok:>4} ok {elapsed:>8.1f}s "
+          f"{len(urls) / elapsed * 60:>7.1f} pages/min")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark Playwright render throughput")
+    parser.add_argument("urls", nargs="*")
+    parser.add_argument("--db", type=int, metavar="N", help="Use the N most recent article URLs from MySQL")
+    parser.add_argument("--threads", type=int, default=5, help="Concurrent callers (default: 5, like the summarizer)")
+    parser.add_argument("--workers", type=int, default=2, help="Render service browser processes (default: 2)")
+    parser.add_argument("--blocking", action="store_true", help="Compare resource blocking off vs on instead")
+    args = parser.parse_args()
+
+    urls = args.urls or (load_urls_from_db(args.db) if args.db else [])
+    if not urls:
+        parser.error("give URLs or --db N")
+
+    if args.blocking:
+        timings = {}
+        for block in (False, True):
+            service = RenderService(workers=args.workers, profile=RenderProfile(block=block))
+            service.start()
+            label = "blocking on" if block else "blocking off"
+            timings[block] = run(label, lambda url: service.render(url)[0], urls, args.threads)
+            service.close()
+        print(f"Speedup: {timings[False] / timings[True]:.1f}x")
+        return
+
+    # Same callers as the old summarizer: each worker thread runs its own sync_playwright driver
+    baseline = run("fresh browser per URL", render_fresh_browser, urls, args.threads)
+
+    service = RenderService(workers=args.workers)
+    service.start()
+    pooled = run(f"render service x{args.workers}", lambda url: service.render(url)[0], urls, args.threads)
+    service.close()
+
+    print(f"Speedup: {baseline / pooled:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
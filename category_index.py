@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Category Index - immutable lookup structure over the categories table
+Built once per run so categorizers never rescan the full category list per article
+"""
+
+from types import MappingProxyType
+
+
+class CategoryIndex:
+    """Read-only view of the two-level category tree (level 1 = parent, level 2 = assignable)"""
+
+    # Parent groups shown in the general categorization prompt, in display order
+    PROMPT_PARENT_ORDER = ('Business', 'Technology', 'Sports', 'General')
+
+    def __init__(self, rows):
+        by_id = {}
+        by_name = {}
+        for row in rows:
+            entry = MappingProxyType(dict(row))
+            by_id[entry['id']] = entry
+            by_name[entry['name']] = entry
+
+        children = {}
+        parent_of = {}
+        for entry in by_id.values():
+            if entry.get('level') != 2:
+                continue
+            parent = by_id.get(entry.get('parentID'))
+            if not parent or parent.get('level') != 1:
+                continue
+            children.setdefault(parent['name'], []).append(entry['name'])
+            parent_of[entry['name']] = parent['name']
+
+        fragments = {}
+        for parent_name, names in children.items():
+            lines = []
+            for name in names:
+                desc = by_name[name].get('description') or ''
+                lines.append(f"{name}: {desc}" if desc else name)
+            fragments[parent_name] = tuple(sorted(lines))
+
+        self._by_id = MappingProxyType(by_id)
+        self._by_name = MappingProxyType(by_name)
+        self._children = MappingProxyType({k: tuple(sorted(v)) for k, v in children.items()})
+        self._parent_of = MappingProxyType(parent_of)
+        self._fragments = MappingProxyType(fragments)
+        # Case-insensitive matcher for validating LLM output (level-2 only)
+        self._assignable = MappingProxyType({
+            name.casefold(): name for name in parent_of
+        })
+
+    @classmethod
+    def load(cls, connection):
+        """Build the index from the categories table"""
+        cursor = connection.cursor(dictionary=True)
+        cursor.execute("SELECT id, name, description, level, parentID FROM categories")
+        rows = cursor.fetchall()
+        cursor.close()
+        return cls(rows)
+
+    def __len__(self):
+        return len(self._by_id)
+
+    def __contains__(self, name):
+        return name in self._by_name
+
+    @property
+    def assignable_count(self):
+        return len(self._assignable)
+
+    def get(self, name):
+        """Category row by exact name, or None"""
+        return self._by_name.get(name)
+
+    def get_by_id(self, category_id):
+        """Category row by id, or None"""
+        return self._by_id.get(category_id)
+
+    def id_for(self, name):
+        """Category id by exact name, or None"""
+        entry = self._by_name.get(name)
+        return entry['id'] if entry else None
+
+    def parents(self):
+        """Level-1 category rows sorted by id"""
+        return sorted((e for e in self._by_id.values() if e.get('level') == 1), key=lambda e: e['id'])
+
+    def parent_of(self, name):
+        """Parent name of a level-2 category, or None"""
+        return self._parent_of.get(name)
+
+    def children(self, parent_name):
+        """Sorted level-2 category names under a parent"""
+        return self._children.get(parent_name, ())
+
+    def prompt_fragment(self, parent_name):
+        """Sorted 'Name: description' lines for a parent's children"""
+        return self._fragments.get(parent_name, ())
+
+    def prompt_listing(self, parents=PROMPT_PARENT_ORDER):
+        """Grouped category listing used by the general categorization prompt"""
+        listing = ""
+        for parent in parents:
+            lines = self._fragments.get(parent)
+            if lines:
+                listing += f"\n[{parent}]\n"
+                for line in lines:
+                    listing += f"  - {line}\n"
+        return listing
+
+    def match(self, name):
+        """Canonical level-2 name for a case-insensitive match, or None"""
+        if not name:
+            return None
+        cleaned = name.strip().strip('"\'`*-. ').strip()
+        return self._assignable.get(cleaned.casefold())
+
+    def validate(self, result, limit):
+        """Parse a comma-separated LLM answer into at most `limit` distinct assignable names"""
+        valid = []
+        for part in (result or '').split(','):
+            name = self.match(part)
+            if name and name not in valid:
+                valid.append(name)
+        return valid[:limit]
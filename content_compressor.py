@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Content Compressor - trims article text to a token budget before it reaches an LLM
+Drops repeated lines, navigation fragments and photo captions, then keeps the
+paragraphs most central to the article (TF-IDF against the centroid and the title)
+"""
+
+import os
+import re
+import math
+from collections import Counter
+
+
+STOPWORDS = frozenset("""
+the and for that with this from are was were have has had not but you your its it's they their them
+his her she him our out who what when where which will would could should about into over after
+than then there these those been being also just more most some such only other said says say can
+""".split())
+
+CAPTION_PATTERNS = re.compile(
+    r"^(photo|photograph|image|video|caption|credit|file photo|advertisement|read more|related|"
+    r"recommended|sign up|subscribe|share this|watch)\b"
+    r"|\((photo|image)s?\b|\bgetty images\b|\bap photo\b|/ap\b|/reuters\b|reuters/|\bshutterstock\b",
+    re.IGNORECASE
+)
+# Trailing photo credit such as "... near Lima, Ohio. Example Wire/Jordan Pike"
+CREDIT_TAIL = re.compile(r"\b[A-Z][\w.&-]*(?: [A-Z][\w.&-]*)*/[A-Z][\w.-]*(?: [A-Z][\w.-]*)*\s*\)?$")
+TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9'&-]{2,}")
+
+
+def tokenize(text):
+    """Lowercased content words of the text (stopwords and short tokens dropped)"""
+    return [t for t in TOKEN_RE.findall(text.lower()) if t not in STOPWORDS]
+
+
+def tfidf_vectors(token_lists):
+    """Unit TF-IDF vectors for a set of texts' tokens, with the IDF taken over that set.
+    Returns (vector, vectors): vector(tokens) maps any other text into the same space."""
+    df = Counter()
+    for tokens in token_lists:
+        df.update(set(tokens))
+    n = len(token_lists)
+    idf = {term: math.log((n + 1) / (count + 1)) + 1 for term, count in df.items()}
+
+    def vector(tokens):
+        vec = {t: c * idf.get(t, 1.0) for t, c in Counter(tokens).items()}
+        norm = math.sqrt(sum(v * v for v in vec.values())) or 1.0
+        return {t: v / norm for t, v in vec.items()}
+    return vector, [vector(tokens) for tokens in token_lists]
+
+
+class ContentCompressor:
+    """Fits article text into a per-provider token budget"""
+
+    def __init__(self):
+        self.enabled = os.getenv('AI_COMPRESSION_ENABLED', '1') != '0'
+        self.default_budget = self._env_int('AI_TOKEN_BUDGET', 1800)
+        self.min_words = self._env_int('AI_COMPRESSION_MIN_WORDS', 6)
+
+    @staticmethod
+    def _env_int(name, default):
+        try:
+            value = int(os.getenv(name, default))
+            return value if value > 0 else default
+        except ValueError:
+            return default
+
+    def budget_for(self, provider):
+        """Token budget for a provider (AI_TOKEN_BUDGET_<PROVIDER>, else AI_TOKEN_BUDGET)"""
+        return self._env_int(f"AI_TOKEN_BUDGET_{provider.upper()}", self.default_budget)
+
+    @staticmethod
+    def estimate_tokens(text):
+        """Cheap token estimate (~4 characters per token for English prose)"""
+        return (len(text or '') + 3) // 4
+
+    def _is_boilerplate(self, line):
+        words = line.split()
+        if len(words) < self.min_words and not line.rstrip('"\'”’)').endswith(('.', '!', '?')):
+            return True  # Navigation/menu fragment
+        if len(words) < 40 and (CAPTION_PATTERNS.search(line) or CREDIT_TAIL.search(line)):
+            return True  # Caption, credit or promo line
+        return False
+
+    def clean(self, content, title=None):
+        """Split into lines, dropping repeats, the repeated headline and boilerplate"""
+        seen = {' '.join(title.lower().split())} if title else set()
+        kept = []
+        for raw in (content or '').split('\n'):
+            line = raw.strip()
+            if not line:
+                continue
+            key = ' '.join(line.lower().split())
+            if key in seen:
+                continue
+            seen.add(key)
+            if self._is_boilerplate(line):
+                continue
+            kept.append(line)
+        return kept
+
+    def _rank(self, title, paragraphs):
+        """Score paragraphs by TF-IDF cosine to the article centroid and the title"""
+        vector, vectors = tfidf_vectors([tokenize(p) for p in paragraphs])
+        centroid = Counter()
+        for vec in vectors:
+            centroid.update(vec)
+        centroid_norm = math.sqrt(sum(v * v for v in centroid.values())) or 1.0
+        title_vec = vector(tokenize(title or ''))
+
+        scores = []
+        for index, vec in enumerate(vectors):
+            centrality = sum(w * centroid.get(t, 0) for t, w in vec.items()) / centroid_norm
+            title_sim = sum(w * title_vec.get(t, 0) for t, w in vec.items())
+            lead_bonus = 0.15 if index < 2 else 0.0
+            scores.append(centrality + 0.5 * title_sim + lead_bonus)
+        return scores
+
+    def compress(self, title, content, token_budget):
+        """Return (text, stats) with text fitted to token_budget"""
+        input_tokens = self.estimate_tokens(content)
+        if not self.enabled or not content:
+            return content, {'input_tokens': input_tokens, 'output_tokens': input_tokens}
+
+        paragraphs = self.clean(content, title)
+        if not paragraphs:
+            paragraphs = [line.strip() for line in content.split('\n') if line.strip()]
+
+        text = '\n\n'.join(paragraphs)
+        if self.estimate_tokens(text) > token_budget and len(paragraphs) > 1:
+            scores = self._rank(title, paragraphs)
+            chosen = set()
+            used = 0
+            for index in sorted(range(len(paragraphs)), key=lambda i: scores[i], reverse=True):
+                cost = self.estimate_tokens(paragraphs[index]) + 1
+                if used + cost > token_budget:
+                    continue
+                chosen.add(index)
+                used += cost
+            if chosen:
+                text = '\n\n'.join(paragraphs[i] for i in sorted(chosen))
+
+        if self.estimate_tokens(text) > token_budget:
+            text = text[:token_budget * 4]
+
+        return text, {'input_tokens': input_tokens, 'output_tokens': self.estimate_tokens(text)}
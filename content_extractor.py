@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Content Extractor - single-pass article body extraction shared by every fetch path
+Walks the DOM once, collecting paragraph text and per-element text/link lengths,
+scores candidate containers by paragraph mass, text density and link density, and
+returns the best block's text with a 0-1 confidence. Bodies embedded as JSON in the
+page (structured_data) short-circuit the DOM pass entirely
+"""
+
+import re
+from bs4 import BeautifulSoup, NavigableString, Comment, Declaration, Doctype, ProcessingInstruction
+from structured_data import extract_structured
+
+
+SKIP_TAGS = frozenset(['script', 'style', 'nav', 'header', 'footer', 'aside', 'iframe', 'noscript',
+                       'form', 'svg', 'template', 'button', 'select'])
+CONTAINER_TAGS = frozenset(['article', 'main', 'section', 'div', 'body', 'td'])
+NON_TEXT_STRINGS = (Comment, Declaration, Doctype, ProcessingInstruction)
+
+POSITIVE_HINTS = re.compile(r"article|body|content|entry|main|post|story|text", re.IGNORECASE)
+NEGATIVE_HINTS = re.compile(r"comment|sidebar|footer|promo|related|recommend|newsletter|share|social|"
+                            r"cookie|consent|banner|ad-|advert|trending|popular|subscribe", re.IGNORECASE)
+
+# Paragraphs shorter than this do not vote for their containers
+SCORING_MIN_CHARS = 25
+MAX_DEPTH = 400
+# Embedded JSON bodies shorter than this (teasers, dek lines) fall through to the DOM pass
+STRUCTURED_MIN_CHARS = 500
+
+
+class _Node:
+    """Per-container accumulator filled during the walk"""
+    __slots__ = ('tag', 'order', 'parent', 'score', 'text_len', 'link_len', 'paragraphs')
+
+    def __init__(self, tag, order, parent):
+        self.tag = tag
+        self.order = order
+        self.parent = parent
+        self.score = 0.0
+        self.text_len = 0
+        self.link_len = 0
+        self.paragraphs = []
+
+
+def _class_weight(tag):
+    hints = ' '.join(tag.get('class') or []) + ' ' + (tag.get('id') or '')
+    weight = 1.0
+    if tag.name == 'article' or POSITIVE_HINTS.search(hints):
+        weight += 0.25
+    if NEGATIVE_HINTS.search(hints):
+        weight -= 0.5
+    return weight
+
+
+def _walk(soup):
+    """One pass over the tree. Returns (paragraphs, containers) where paragraphs is a list of
+    (text, ancestor_nodes) and containers maps id(tag) -> _Node with text/link lengths."""
+    containers = {}
+    paragraphs = []
+    # Stack entries: (element, depth, exiting)
+    stack = [(soup, 0, False)]
+    ancestors = []        # open _Node containers, outermost first
+    link_depth = 0
+    paragraph = None      # string buffer while inside a <p>
+
+    while stack:
+        element, depth, exiting = stack.pop()
+
+        if exiting:
+            if element.name == 'a':
+                link_depth -= 1
+            elif element.name == 'p' and paragraph is not None:
+                text = ' '.join(' '.join(paragraph).split())
+                if text:
+                    paragraphs.append((text, tuple(ancestors)))
+                paragraph = None
+            if element.name in CONTAINER_TAGS:
+                ancestors.pop()
+            continue
+
+        if isinstance(element, NavigableString):
+            if isinstance(element, NON_TEXT_STRINGS):
+                continue
+            length = len(element.strip())
+            if not length:
+                continue
+            for node in ancestors:
+                node.text_len += length
+                if link_depth:
+                    node.link_len += length
+            if paragraph is not None:
+                paragraph.append(element)
+            continue
+
+        name = element.name
+        if name in SKIP_TAGS or depth > MAX_DEPTH:
+            continue
+
+        if name in CONTAINER_TAGS:
+            node = _Node(element, len(containers), ancestors[-1] if ancestors else None)
+            containers[id(element)] = node
+            ancestors.append(node)
+        if name == 'a':
+            link_depth += 1
+        elif name == 'p' and paragraph is None:
+            paragraph = []
+
+        stack.append((element, depth, True))
+        for child in reversed(element.contents):
+            stack.append((child, depth + 1, False))
+
+    return paragraphs, containers
+
+
+def extract_content(html, rule=None, min_paragraph_chars=0, max_paragraphs=None, max_chars=None):
+    """Return (text, confidence) for the main article block of an HTML document.
+
+    `html` may be a string, bytes or an existing BeautifulSoup tree. An article body embedded
+    as JSON (JSON-LD, __NEXT_DATA__, component scripts) is used first, without parsing the
+    page. `rule` is an optional ExtractionRule whose compiled selectors are tried next; the
+    first one yielding rule.min_chars of paragraph text wins with high confidence.
+    """
+    if not isinstance(html, BeautifulSoup):
+        body, _ = extract_structured(html, min_chars=STRUCTURED_MIN_CHARS)
+        text = _join(body.split('\n'), min_paragraph_chars, max_paragraphs, max_chars)
+        if len(text) >= STRUCTURED_MIN_CHARS:
+            return text, 0.9
+
+    soup = html if isinstance(html, BeautifulSoup) else BeautifulSoup(html or '', 'html.parser')
+
+    for selector in (rule.selectors if rule else ()):
+        texts = []
+        for element in selector.select(soup):
+            texts.extend(' '.join(p.get_text(' ', strip=True).split()) for p in element.find_all('p'))
+        text = _join(texts, min_paragraph_chars, max_paragraphs, max_chars)
+        if len(text) > rule.min_chars:
+            return text, 0.95
+
+    paragraphs, containers = _walk(soup)
+    if not paragraphs:
+        return "", 0.0
+
+    # Each substantial paragraph votes for its parent, and with decaying weight for two more ancestors
+    for text, ancestors in paragraphs:
+        if len(text) < SCORING_MIN_CHARS:
+            continue
+        vote = 1 + text.count(',') + min(len(text) / 100, 3)
+        for level, node in enumerate(reversed(ancestors[-3:])):
+            node.score += vote / (1, 2, 3)[level]
+        for node in ancestors:
+            node.paragraphs.append(text)
+
+    scored = []
+    for node in containers.values():
+        if not node.paragraphs or not node.text_len:
+            continue
+        para_len = sum(len(t) for t in node.paragraphs)
+        link_density = node.link_len / node.text_len
+        text_density = min(para_len / node.text_len, 1.0)
+        final = node.score * (1 - link_density) * (0.5 + 0.5 * text_density) * _class_weight(node.tag)
+        scored.append((final, -node.order, node, link_density))
+
+    if not scored:
+        # Nothing container-like scored: fall back to every substantial paragraph
+        texts = [text for text, _ in paragraphs if len(text) > 50]
+        text = _join(texts, min_paragraph_chars, max_paragraphs, max_chars)
+        return text, (0.2 if text else 0.0)
+
+    scored.sort(key=lambda item: (item[0], item[1]), reverse=True)
+    best_score, _, best, link_density = scored[0]
+    # Runner-up is the best block that does not overlap the winner (not an ancestor or descendant)
+    best_paragraphs = set(best.paragraphs)
+    runner_up = next((s for s, _, node, _ in scored[1:] if best_paragraphs.isdisjoint(node.paragraphs)), 0.0)
+
+    # Sibling blocks carrying a real share of the content (split bodies, subscriber notices) come along
+    chosen = {best}
+    if best.parent is not None:
+        for node in containers.values():
+            if (node.parent is best.parent and node is not best and node.paragraphs
+                    and node.score >= 0.2 * best.score and node.link_len / max(node.text_len, 1) < 0.33):
+                chosen.add(node)
+
+    # Output keeps every paragraph inside the chosen containers (short ones included) in document order
+    texts = [text for text, ancestors in paragraphs if chosen.intersection(ancestors)]
+    text = _join(texts, min_paragraph_chars, max_paragraphs, max_chars)
+
+    dominance = best_score / (best_score + runner_up) if best_score > 0 else 0.0
+    length_score = min(len(text) / 1500, 1.0)
+    confidence = 0.4 * length_score + 0.35 * dominance + 0.25 * (1 - link_density)
+    return text, round(confidence if text else 0.0, 2)
+
+
+def _join(texts, min_chars, max_paragraphs, max_chars):
+    kept = [t for t in texts if len(t) > min_chars] if min_chars else [t for t in texts if t]
+    if max_paragraphs:
+        kept = kept[:max_paragraphs]
+    text = '\n\n'.join(kept)
+    return text[:max_chars] if max_chars else text
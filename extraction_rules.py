@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Extraction Rules - per-domain article body selectors, compiled once at startup
+Rules live in extraction_rules.json (or EXTRACTION_RULES_PATH) so new sources can
+get precise extraction without code edits; lookups go through a domain suffix trie
+"""
+
+import os
+import json
+import soupsieve
+from urllib.parse import urlsplit
+
+
+DEFAULT_RULES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'extraction_rules.json')
+
+
+class ExtractionRule:
+    """Compiled selectors for one domain"""
+
+    def __init__(self, domain, selectors, min_chars=500):
+        self.domain = domain
+        self.selectors = selectors
+        self.min_chars = min_chars
+
+
+class ExtractionRules:
+    """Registry of ExtractionRule objects keyed by domain suffix"""
+
+    _RULE = object()  # Trie key holding the rule for the path so far
+
+    def __init__(self, rules=()):
+        self.trie = {}
+        self.count = 0
+        for rule in rules:
+            self.add(rule)
+
+    @classmethod
+    def load(cls, path=None):
+        """Build the registry from a JSON file: {"domain": {"selectors": [...], "min_chars": 500}}"""
+        path = path or os.getenv('EXTRACTION_RULES_PATH', DEFAULT_RULES_PATH)
+        try:
+            with open(path) as f:
+                config = json.load(f)
+        except FileNotFoundError:
+            return cls()
+        except (OSError, ValueError) as e:
+            print(f"⚠ Extraction rules not loaded ({e})")
+            return cls()
+
+        rules = []
+        for domain, spec in config.items():
+            compiled = []
+            for selector in spec.get('selectors', []):
+                try:
+                    compiled.append(soupsieve.compile(selector))
+                except soupsieve.SelectorSyntaxError as e:
+                    print(f"⚠ Skipping bad selector for {domain}: {selector} ({e})")
+            if compiled:
+                rules.append(ExtractionRule(domain.lower().strip('.'), compiled, spec.get('min_chars', 500)))
+        return cls(rules)
+
+    def add(self, rule):
+        node = self.trie
+        for label in reversed(rule.domain.split('.')):
+            node = node.setdefault(label, {})
+        if self._RULE not in node:
+            self.count += 1
+        node[self._RULE] = rule
+
+    def lookup(self, host):
+        """Most specific rule whose domain is a suffix of host (www.cnbc.com -> cnbc.com), or None"""
+        node = self.trie
+        found = None
+        for label in reversed((host or '').lower().split('.')):
+            node = node.get(label)
+            if node is None:
+                break
+            found = node.get(self._RULE, found)
+        return found
+
+    def for_url(self, url):
+        return self.lookup(urlsplit(url).hostname)
+
+    def __len__(self):
+        return self.count
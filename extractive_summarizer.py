@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Extractive Summarizer - local, CPU-only fallback when every AI provider fails
+Scores the article's sentences by TF-IDF cosine to the article centroid and the title,
+with a small lead bonus, then keeps the best non-redundant sentences (in article order)
+within SUMMARY_WORD_LIMIT. The summarizer stores the result as provisional so a later
+run replaces it with an LLM summary.
+"""
+
+import os
+import re
+import math
+from collections import Counter
+
+from content_compressor import ContentCompressor, tokenize, tfidf_vectors
+
+
+# Sentence boundary: terminal punctuation (plus closing quote/bracket), whitespace, then a capital or digit
+SENTENCE_BOUNDARY = re.compile(r'(?<=[.!?])["\'”’)]?\s+(?=["“‘(]?[A-Z0-9])')
+# Abbreviations that end in a period without ending the sentence
+ABBREVIATION_END = re.compile(
+    r'\b(?:Mr|Mrs|Ms|Dr|St|Sen|Rep|Gov|Gen|Corp|Inc|Co|Ltd|Jr|Sr|vs|No|U\.S|U\.K|[A-Z]'
+    r'|Jan|Feb|Mar|Apr|Jun|Jul|Aug|Sept?|Oct|Nov|Dec)\.$')
+# Headlines, menus and link lists do not end like a sentence
+SENTENCE_END = re.compile(r'[.!?]["\'”’)]?$')
+
+
+class ExtractiveSummarizer:
+    """TF-IDF centroid sentence extraction"""
+
+    def __init__(self, word_limit=100):
+        self.enabled = os.getenv('EXTRACTIVE_FALLBACK_ENABLED', '1') != '0'
+        self.word_limit = word_limit
+        # Long articles: only the first sentences are scored (news puts the substance up front)
+        self.max_sentences = self._env_int('EXTRACTIVE_MAX_SENTENCES', 80)
+        # A sentence this similar to one already picked adds nothing
+        self.redundancy = 0.5
+        self.compressor = ContentCompressor()
+
+    @staticmethod
+    def _env_int(name, default):
+        try:
+            value = int(os.getenv(name, default))
+            return value if value > 0 else default
+        except ValueError:
+            return default
+
+    def sentences(self, title, content):
+        """Article sentences after the compressor's boilerplate/caption cleanup"""
+        sentences = []
+        for paragraph in self.compressor.clean(content, title):
+            pending = ''
+            for part in SENTENCE_BOUNDARY.split(paragraph) + ['']:
+                pending = f"{pending} {part}".strip() if pending else part.strip()
+                if part and ABBREVIATION_END.search(pending):
+                    continue
+                if 6 <= len(pending.split()) <= 60 and SENTENCE_END.search(pending):
+                    sentences.append(pending)
+                pending = ''
+            if len(sentences) >= self.max_sentences:
+                break
+        return sentences[:self.max_sentences]
+
+    @staticmethod
+    def _cosine(a, b):
+        if len(a) > len(b):
+            a, b = b, a
+        return sum(w * b.get(t, 0) for t, w in a.items())
+
+    def summarize(self, title, content):
+        """Summary of at most word_limit words, or None when there is too little prose"""
+        if not self.enabled or not content:
+            return None
+        sentences = self.sentences(title, content)
+        if not sentences:
+            return None
+
+        vector, vectors = tfidf_vectors([tokenize(s) for s in sentences])
+        centroid = Counter()
+        for vec in vectors:
+            centroid.update(vec)
+        centroid_norm = math.sqrt(sum(v * v for v in centroid.values())) or 1.0
+        title_vec = vector(tokenize(title or ''))
+
+        scores = []
+        for index, vec in enumerate(vectors):
+            centrality = self._cosine(vec, centroid) / centroid_norm
+            lead_bonus = 0.2 / (1 + index) if index < 3 else 0.0
+            scores.append(centrality + 0.5 * self._cosine(vec, title_vec) + lead_bonus)
+
+        chosen = []
+        words = 0
+        for index in sorted(range(len(sentences)), key=lambda i: scores[i], reverse=True):
+            length = len(sentences[index].split())
+            if words + length > self.word_limit:
+                continue
+            if any(self._cosine(vectors[index], vectors[other]) > self.redundancy for other in chosen):
+                continue
+            chosen.append(index)
+            words += length
+            if self.word_limit - words < 6:
+                break
+
+        if not chosen:
+            # Even the best sentence is over the limit: cut it at the last whole word
+            best = max(range(len(sentences)), key=lambda i: scores[i])
+            return ' '.join(sentences[best].split()[:self.word_limit])
+        return ' '.join(sentences[index] for index in sorted(chosen))
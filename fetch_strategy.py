@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+Fetch Strategy Table - learns which fetch method works for each domain
+Records success rate and latency per (domain, method) in a local SQLite file so the
+summarizer and full-text fetcher go straight to the method that works (e.g. Playwright
+for sites whose plain HTML is a consent wall), re-probing cheaper methods now and then
+"""
+
+import os
+import time
+import random
+import sqlite3
+from threading import Lock
+from urllib.parse import urlsplit
+
+
+DEFAULT_STRATEGY_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fetch_strategy.sqlite')
+
+# Cheapest first; this is also the order used for unknown domains
+METHODS = ('requests', 'playwright', 'google_cache')
+
+# Starting knowledge for domains we have not measured yet. Yahoo is no longer seeded to
+# Playwright: a direct fetch reads the article JSON embedded in its HTML (structured_data),
+# and the table still learns Playwright for any domain where that keeps failing
+SEED_STRATEGIES = {}
+
+# Second-level labels that belong to the public suffix (example.co.uk -> example.co.uk)
+_SHARED_SLDS = {'co', 'com', 'org', 'net', 'ac', 'gov', 'edu'}
+
+# Pseudo-domain aggregating every fetch, used to spot methods that fail everywhere
+ALL_DOMAINS = '*'
+
+
+class FetchStrategyTable:
+    """Per-domain success/latency stats and the method order derived from them"""
+
+    def __init__(self, path=None):
+        self.enabled = os.getenv('FETCH_STRATEGY_ENABLED', '1') != '0'
+        self.path = path or os.getenv('FETCH_STRATEGY_PATH', DEFAULT_STRATEGY_PATH)
+        self.reprobe_rate = self._env_float('FETCH_REPROBE_RATE', 0.1)
+        self.min_attempts = int(self._env_float('FETCH_STRATEGY_MIN_ATTEMPTS', 3))
+        self.alpha = self._env_float('FETCH_STRATEGY_EWMA_ALPHA', 0.3)
+        # A fallback whose EWMA success rate sinks below this (~10 straight failures) is skipped
+        self.dead_rate = self._env_float('FETCH_DEAD_SUCCESS_RATE', 0.02)
+        self.dead_min_attempts = int(self._env_float('FETCH_DEAD_MIN_ATTEMPTS', 10))
+
+        self.lock = Lock()
+        self.rows = {}  # domain -> {method: stats}
+        self.stats = {'direct': 0, 'reprobes': 0, 'dead_skips': 0}
+        self.conn = None
+
+        if self.enabled:
+            try:
+                self.conn = sqlite3.connect(self.path, timeout=10, check_same_thread=False,
+                                            isolation_level=None)
+                self.conn.execute("PRAGMA journal_mode=WAL")
+                self.conn.execute("""
+                    CREATE TABLE IF NOT EXISTS fetch_strategy (
+                        domain TEXT NOT NULL,
+                        method TEXT NOT NULL,
+                        attempts INTEGER NOT NULL DEFAULT 0,
+                        successes INTEGER NOT NULL DEFAULT 0,
+                        success_rate REAL NOT NULL DEFAULT 0,
+                        latency REAL NOT NULL DEFAULT 0,
+                        last_success_at REAL,
+                        updated_at REAL NOT NULL,
+                        PRIMARY KEY (domain, method)
+                    )
+                """)
+                self._load()
+            except sqlite3.Error as e:
+                print(f"⚠ Fetch strategy table disabled ({e})")
+                self.enabled = False
+                self.conn = None
+
+    @staticmethod
+    def _env_float(name, default):
+        try:
+            value = float(os.getenv(name, default))
+            return value if value >= 0 else default
+        except ValueError:
+            return default
+
+    def _load(self):
+        for domain, method, attempts, successes, rate, latency, last_success in self.conn.execute(
+            "SELECT domain, method, attempts, successes, success_rate, latency, last_success_at FROM fetch_strategy"
+        ):
+            self.rows.setdefault(domain, {})[method] = {
+                'attempts': attempts, 'successes': successes, 'success_rate': rate,
+                'latency': latency, 'last_success_at': last_success,
+            }
+
+    @staticmethod
+    def domain_of(url):
+        """Registrable domain of a URL (finance.yahoo.com -> yahoo.com)"""
+        host = (urlsplit(url).hostname or '').lower()
+        labels = host.split('.')
+        if len(labels) >= 3 and len(labels[-1]) == 2 and labels[-2] in _SHARED_SLDS:
+            return '.'.join(labels[-3:])
+        return '.'.join(labels[-2:])
+
+    def order(self, url, available=METHODS):
+        """Return (methods, reason): the order to try fetch methods for this URL"""
+        default = [m for m in METHODS if m in available]
+        domain = self.domain_of(url)
+        known = {m: s for m, s in self.rows.get(domain, {}).items()
+                 if m in available and s['attempts'] >= self.min_attempts}
+
+        if not known:
+            seed = SEED_STRATEGIES.get(domain)
+            if seed in available:
+                return [seed] + [m for m in default if m != seed], "seeded"
+            return default, "default"
+
+        ranked = sorted(known, key=lambda m: (-known[m]['success_rate'], known[m]['latency']))
+        best = ranked[0]
+        if known[best]['success_rate'] < 0.5 or best == default[0]:
+            return default, "default"
+
+        if random.random() < self.reprobe_rate:
+            with self.lock:
+                self.stats['reprobes'] += 1
+            return default, "re-probe"
+
+        with self.lock:
+            self.stats['direct'] += 1
+        rest = ranked[1:] + [m for m in default if m not in known]
+        return [best] + rest, f"{known[best]['success_rate'] * 100:.0f}% success"
+
+    def record(self, url, method, success, latency):
+        """Fold one fetch outcome into the domain's (and the all-domains) EWMA success rate and latency"""
+        if not self.enabled:
+            return
+        now = time.time()
+        with self.lock:
+            try:
+                # IMMEDIATE: other processes' updates to the same rows wait instead of being overwritten
+                self.conn.execute("BEGIN IMMEDIATE")
+                for domain in (self.domain_of(url), ALL_DOMAINS):
+                    self._update(domain, method, success, latency, now)
+                self.conn.execute("COMMIT")
+            except sqlite3.Error:
+                try:
+                    self.conn.execute("ROLLBACK")
+                except sqlite3.Error:
+                    pass
+
+    def _update(self, domain, method, success, latency, now):
+        # Counters and EWMAs are updated from the stored row, so other processes' outcomes are kept
+        outcome = 1.0 if success else 0.0
+        self.conn.execute("""
+            INSERT INTO fetch_strategy
+                (domain, method, attempts, successes, success_rate, latency, last_success_at, updated_at)
+            VALUES (?, ?, 1, ?, ?, ?, ?, ?)
+            ON CONFLICT (domain, method) DO UPDATE SET
+                attempts = attempts + 1,
+                successes = successes + excluded.successes,
+                success_rate = (1 - ?) * success_rate + ? * excluded.success_rate,
+                latency = (1 - ?) * latency + ? * excluded.latency,
+                last_success_at = COALESCE(excluded.last_success_at, last_success_at),
+                updated_at = excluded.updated_at
+        """, (domain, method, int(outcome), outcome, latency, now if success else None, now,
+              self.alpha, self.alpha, self.alpha, self.alpha))
+        attempts, successes, rate, latency, last_success = self.conn.execute("""
+            SELECT attempts, successes, success_rate, latency, last_success_at
+            FROM fetch_strategy WHERE domain = ? AND method = ?
+        """, (domain, method)).fetchone()
+        self.rows.setdefault(domain, {})[method] = {
+            'attempts': attempts, 'successes': successes, 'success_rate': rate,
+            'latency': latency, 'last_success_at': last_success,
+        }
+
+    def is_failing(self, url, method):
+        """True when a fallback has recently stopped working, for this domain or everywhere.
+        A small share of calls (FETCH_REPROBE_RATE) still get through so recovery is noticed."""
+        for domain in (self.domain_of(url), ALL_DOMAINS):
+            row = self.rows.get(domain, {}).get(method)
+            if row and row['attempts'] >= self.dead_min_attempts and row['success_rate'] < self.dead_rate:
+                if random.random() < self.reprobe_rate:
+                    return False
+                with self.lock:
+                    self.stats['dead_skips'] += 1
+                return True
+        return False
+
+    def summary_line(self):
+        domains = len(self.rows) - (ALL_DOMAINS in self.rows)
+        return (f"Fetch strategy: {domains} domains learned, "
+                f"{self.stats['direct']} fetches skipped straight to a better method, "
+                f"{self.stats['reprobes']} re-probes, {self.stats['dead_skips']} failing fallbacks skipped")
+
+    def close(self):
+        if self.conn is not None:
+            with self.lock:
+                self.conn.close()
+                self.conn = None
+            self.enabled = False
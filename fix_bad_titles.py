@@ -10,6 +10,7 @@ import mysql.connector
 from mysql.connector import Error
 import env_loader
 import requests
+from llm_cache import LLMCache
 
 class TitleFixer:
     def __init__(self):
@@ -40,6 +41,7 @@ class TitleFixer:
             print(f"✓ Anthropic configured ({self.anthropic_model})")
 
         self.connection = None
+        self.llm_cache = LLMCache()
 
     def connect_db(self):
         """Establish database connection"""
@@ -195,10 +197,16 @@ Write ONLY the headline, nothing else:"""
             result = None
 
             if provider == 'deepseek' and self.deepseek_key:
-                result = self.call_deepseek(prompt, max_tokens=50)
+                result = self.llm_cache.get_or_call(
+                    provider, self.deepseek_model, prompt, 50,
+                    lambda: self.call_deepseek(prompt, max_tokens=50)
+                )
                 provider_name = "DeepSeek"
             elif provider == 'anthropic' and self.anthropic_key:
-                result = self.call_anthropic(prompt, max_tokens=50)
+                result = self.llm_cache.get_or_call(
+                    provider, self.anthropic_model, prompt, 50,
+                    lambda: self.call_anthropic(prompt, max_tokens=50)
+                )
                 provider_name = "Claude"
             else:
                 continue
@@ -300,8 +308,10 @@ Write ONLY the headline, nothing else:"""
         print("\n" + "=" * 80)
         print(f"✓ Fixed: {fixed} titles")
         print(f"  Skipped: {skipped} titles")
+        print(f"  {self.llm_cache.summary_line()}")
         print("=" * 80)
 
+        self.llm_cache.close()
         if self.connection and self.connection.is_connected():
             self.connection.close()
 
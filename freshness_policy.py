@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Freshness Policy - decides whether an article's stored fullArticle is good enough
+to summarize directly, skipping the page fetch (and any Playwright render)
+"""
+
+import os
+
+
+class FreshnessPolicy:
+    """Age/length/quality/source rules for reusing existing fullArticle text"""
+
+    SUMMARIZABLE_CHARS = 100
+
+    def __init__(self):
+        self.enabled = os.getenv('FRESHNESS_ENABLED', '1') != '0'
+        self.max_age_minutes = self._env_number('FRESHNESS_MAX_AGE_HOURS', 12, float) * 60
+        self.min_chars = max(self._env_number('FRESHNESS_MIN_CHARS', 1500, int), self.SUMMARIZABLE_CHARS)
+        self.min_quality = self._env_number('FRESHNESS_MIN_QUALITY', 0.6, float)
+        # Sources whose stored text is never trusted (always refetch)
+        self.refetch_sources = {
+            name.strip().lower() for name in os.getenv('FRESHNESS_REFETCH_SOURCES', '').split(',') if name.strip()
+        }
+        # Per-source minimum length, e.g. "The Information:400,CNBC:2000"; never below the
+        # 100 chars the summarizer needs, so shorter stored text is always refetched
+        self.source_min_chars = {}
+        for item in os.getenv('FRESHNESS_SOURCE_MIN_CHARS', '').split(','):
+            name, _, value = item.rpartition(':')
+            if name.strip() and value.strip().isdigit():
+                self.source_min_chars[name.strip().lower()] = max(int(value), self.SUMMARIZABLE_CHARS)
+
+    @staticmethod
+    def _env_number(name, default, cast):
+        try:
+            value = cast(os.getenv(name, default))
+            return value if value > 0 else default
+        except ValueError:
+            return default
+
+    @staticmethod
+    def quality_score(text):
+        """0-1 estimate of how much of the text is article prose"""
+        if not text:
+            return 0.0
+        sample = text[:5000]
+        control = sum(1 for c in sample if ord(c) < 32 and c not in '\n\r\t')
+        if control / len(sample) > 0.05:
+            return 0.0  # Binary garbage from a failed decompression
+
+        paragraphs = [p.strip() for p in text.split('\n') if p.strip()]
+        if not paragraphs:
+            return 0.0
+        prose = [p for p in paragraphs
+                 if len(p.split()) >= 12 and p.rstrip('"\'”’)').endswith(('.', '!', '?'))]
+        prose_ratio = sum(len(p) for p in prose) / sum(len(p) for p in paragraphs)
+        avg_words = sum(len(p.split()) for p in paragraphs) / len(paragraphs)
+        length_score = min(avg_words / 40, 1.0)
+        return round(0.7 * prose_ratio + 0.3 * length_score, 3)
+
+    def decide(self, article, rejectors=()):
+        """Return (use_existing, reason). `rejectors` are callables flagging unusable text
+        (cookie walls, paywalls) that force a refetch."""
+        if not self.enabled:
+            return False, "policy disabled"
+
+        text = article.get('fullArticle') or ''
+        source = (article.get('source_name') or '').lower()
+        if source in self.refetch_sources:
+            return False, "source always refetched"
+
+        min_chars = self.source_min_chars.get(source, self.min_chars)
+        if len(text) < min_chars:
+            return False, f"too short ({len(text)} < {min_chars} chars)"
+
+        age = article.get('age_minutes')
+        if age is not None and age > self.max_age_minutes:
+            return False, f"stale ({age / 60:.0f}h old)"
+
+        if any(reject(text) for reject in rejectors):
+            return False, "blocked content"
+
+        quality = self.quality_score(text)
+        if quality < self.min_quality:
+            return False, f"low quality ({quality:.2f})"
+
+        return True, f"fresh, quality {quality:.2f}"
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+LLM Response Cache - content-addressed cache of provider responses in a local SQLite file
+Keyed on provider, model and a hash of the normalized prompt; shared by the summarizer,
+recategorizer and title fixer so retries and reruns do not pay for identical prompts twice
+"""
+
+import os
+import time
+import sqlite3
+import hashlib
+from threading import Lock, Event
+
+
+DEFAULT_CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'llm_cache.sqlite')
+
+
+class LLMCache:
+    """Persistent prompt -> response cache with TTL/size eviction and single-flight coalescing"""
+
+    def __init__(self, path=None, ttl_hours=None, max_entries=None):
+        self.enabled = os.getenv('LLM_CACHE_ENABLED', '1') != '0'
+        self.path = path or os.getenv('LLM_CACHE_PATH', DEFAULT_CACHE_PATH)
+        self.ttl = (ttl_hours or self._env_int('LLM_CACHE_TTL_HOURS', 72)) * 3600
+        self.max_entries = max_entries or self._env_int('LLM_CACHE_MAX_ENTRIES', 20000)
+
+        self.lock = Lock()
+        self.inflight_lock = Lock()
+        self.inflight = {}
+        self.stats = {'hits': 0, 'misses': 0, 'coalesced': 0}
+        self._writes_since_evict = 0
+        self.conn = None
+
+        if self.enabled:
+            try:
+                self.conn = sqlite3.connect(self.path, timeout=10, check_same_thread=False)
+                self.conn.execute("PRAGMA journal_mode=WAL")
+                self.conn.execute("""
+                    CREATE TABLE IF NOT EXISTS llm_cache (
+                        key TEXT PRIMARY KEY,
+                        provider TEXT NOT NULL,
+                        model TEXT NOT NULL,
+                        response TEXT NOT NULL,
+                        created_at REAL NOT NULL,
+                        accessed_at REAL NOT NULL
+                    )
+                """)
+                self.conn.execute("CREATE INDEX IF NOT EXISTS idx_llm_cache_accessed ON llm_cache (accessed_at)")
+                self.conn.commit()
+            except sqlite3.Error as e:
+                print(f"⚠ LLM cache disabled ({e})")
+                self.enabled = False
+                self.conn = None
+
+    @staticmethod
+    def _env_int(name, default):
+        try:
+            value = int(os.getenv(name, default))
+            return value if value > 0 else default
+        except ValueError:
+            return default
+
+    @staticmethod
+    def normalize(prompt):
+        """Collapse whitespace so trivially different prompts share an entry"""
+        return ' '.join((prompt or '').split())
+
+    def make_key(self, provider, model, prompt, max_tokens=None):
+        digest = hashlib.sha256(f"{max_tokens}\n{self.normalize(prompt)}".encode('utf-8')).hexdigest()
+        return f"{provider}:{model}:{digest}"
+
+    def get(self, provider, model, prompt, max_tokens=None):
+        if not self.enabled:
+            return None
+        key = self.make_key(provider, model, prompt, max_tokens)
+        now = time.time()
+        try:
+            with self.lock:
+                row = self.conn.execute(
+                    "SELECT response, created_at FROM llm_cache WHERE key = ?", (key,)
+                ).fetchone()
+                if row is None or now - row[1] > self.ttl:
+                    return None
+                self.conn.execute("UPDATE llm_cache SET accessed_at = ? WHERE key = ?", (now, key))
+                self.conn.commit()
+            return row[0]
+        except sqlite3.Error:
+            return None
+
+    def put(self, provider, model, prompt, response, max_tokens=None):
+        if not self.enabled or not response:
+            return
+        key = self.make_key(provider, model, prompt, max_tokens)
+        now = time.time()
+        try:
+            with self.lock:
+                self.conn.execute("""
+                    INSERT OR REPLACE INTO llm_cache (key, provider, model, response, created_at, accessed_at)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                """, (key, provider, model, response, now, now))
+                self.conn.commit()
+                self._writes_since_evict += 1
+                if self._writes_since_evict >= 100:
+                    self._evict(now)
+        except sqlite3.Error:
+            pass
+
+    def delete(self, provider, model, prompt, max_tokens=None):
+        """Drop an entry (e.g. a response later judged unusable)"""
+        if not self.enabled:
+            return
+        key = self.make_key(provider, model, prompt, max_tokens)
+        try:
+            with self.lock:
+                self.conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                self.conn.commit()
+        except sqlite3.Error:
+            pass
+
+    def _evict(self, now):
+        """Remove expired entries, then the least recently used beyond max_entries (lock held)"""
+        self._writes_since_evict = 0
+        self.conn.execute("DELETE FROM llm_cache WHERE created_at < ?", (now - self.ttl,))
+        count = self.conn.execute("SELECT COUNT(*) FROM llm_cache").fetchone()[0]
+        if count > self.max_entries:
+            self.conn.execute("""
+                DELETE FROM llm_cache WHERE key IN (
+                    SELECT key FROM llm_cache ORDER BY accessed_at ASC LIMIT ?
+                )
+            """, (count - self.max_entries,))
+        self.conn.commit()
+
+    def get_or_call(self, provider, model, prompt, max_tokens, call):
+        """Return a cached response or run call(); concurrent identical prompts share one call"""
+        if not self.enabled:
+            return call()
+
+        cached = self.get(provider, model, prompt, max_tokens)
+        if cached is not None:
+            with self.inflight_lock:
+                self.stats['hits'] += 1
+            return cached
+
+        key = self.make_key(provider, model, prompt, max_tokens)
+        with self.inflight_lock:
+            waiter = self.inflight.get(key)
+            if waiter is None:
+                waiter = {'event': Event(), 'result': None}
+                self.inflight[key] = waiter
+                leader = True
+                self.stats['misses'] += 1
+            else:
+                leader = False
+                self.stats['coalesced'] += 1
+
+        if not leader:
+            waiter['event'].wait()
+            return waiter['result']
+
+        result = None
+        try:
+            result = call()
+            if result:
+                self.put(provider, model, prompt, result, max_tokens)
+            return result
+        finally:
+            waiter['result'] = result
+            with self.inflight_lock:
+                self.inflight.pop(key, None)
+            waiter['event'].set()
+
+    def summary_line(self):
+        s = self.stats
+        return f"LLM cache: {s['hits']} hits, {s['misses']} misses, {s['coalesced']} coalesced"
+
+    def close(self):
+        if self.conn is not None:
+            with self.lock:
+                self.conn.close()
+            self.conn = None
+            self.enabled = False
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+LLM Usage - token accounting for provider calls
+Reads the usage block of each provider response (input, output and cached prompt tokens),
+rolls it up per provider, model, source and purpose for the run, prices it from
+MODEL_PRICES and writes the totals to the llm_usage table (sql/004_llm_usage.sql)
+in one multi-row INSERT per flush
+"""
+
+import os
+import time
+import socket
+from threading import Lock
+from mysql.connector import Error
+
+
+# USD per million tokens: (input, output, cached input), matched on model-name prefix,
+# longest prefix first. Override or extend with LLM_PRICES="model=in/out/cached,..."
+MODEL_PRICES = {
+    'claude-opus-4': (15.0, 75.0, 1.50),
+    'claude-sonnet-4': (3.0, 15.0, 0.30),
+    'claude-haiku-4': (1.0, 5.0, 0.10),
+    'claude-3-5-haiku': (0.80, 4.0, 0.08),
+    'gpt-4o-mini': (0.15, 0.60, 0.075),
+    'gpt-4o': (2.50, 10.0, 1.25),
+    'gpt-4.1-mini': (0.40, 1.60, 0.10),
+    'gpt-4.1': (2.0, 8.0, 0.50),
+    'deepseek-chat': (0.28, 0.42, 0.028),
+    'deepseek-reasoner': (0.28, 0.42, 0.028),
+}
+
+
+def parse_usage(provider, result):
+    """(input, output, cached) tokens from a decoded provider response, or None if it
+    carries no usage block. Input includes cached prompt tokens for every provider."""
+    usage = result.get('usage') if isinstance(result, dict) else None
+    if not isinstance(usage, dict):
+        return None
+    if provider == 'anthropic':
+        # input_tokens excludes cache reads and writes; fold them in so input means the whole prompt
+        cached = usage.get('cache_read_input_tokens') or 0
+        prompt = (usage.get('input_tokens') or 0) + cached + (usage.get('cache_creation_input_tokens') or 0)
+        return prompt, usage.get('output_tokens') or 0, cached
+    # OpenAI-compatible (OpenAI, DeepSeek): prompt_tokens already includes the cached part
+    details = usage.get('prompt_tokens_details') or {}
+    cached = usage.get('prompt_cache_hit_tokens') or details.get('cached_tokens') or 0
+    return usage.get('prompt_tokens') or 0, usage.get('completion_tokens') or 0, cached
+
+
+class UsageLedger:
+    """Thread-safe per-run rollup of provider token usage"""
+
+    def __init__(self, run_id=None, prices=None):
+        self.enabled = os.getenv('LLM_USAGE_ENABLED', '1') != '0'
+        self.run_id = (run_id or f"{socket.gethostname()}:{os.getpid()}:{int(time.time())}")[:64]
+        self.prices = dict(MODEL_PRICES if prices is None else prices)
+        self.prices.update(self._env_prices())
+        self.lock = Lock()
+        self.totals = {}    # (provider, model, source_id, purpose) -> [calls, estimated, input, output, cached, ms]
+        self.pending = {}   # same, since the last flush
+        self.source_names = {}
+        self.period_start = time.time()
+        self.table_missing = False
+
+    @staticmethod
+    def _env_prices():
+        prices = {}
+        for entry in os.getenv('LLM_PRICES', '').split(','):
+            model, _, values = entry.partition('=')
+            try:
+                parts = [float(v) for v in values.split('/')]
+            except ValueError:
+                continue
+            if model.strip() and len(parts) in (2, 3):
+                prices[model.strip()] = (parts[0], parts[1], parts[2] if len(parts) == 3 else parts[0])
+        return prices
+
+    def price(self, model):
+        """(input, output, cached) USD per million tokens for a model, or None if unknown"""
+        matches = [prefix for prefix in self.prices if (model or '').startswith(prefix)]
+        return self.prices[max(matches, key=len)] if matches else None
+
+    def cost(self, model, input_tokens, output_tokens, cached_tokens):
+        price = self.price(model)
+        if price is None:
+            return None
+        return ((input_tokens - cached_tokens) * price[0] + output_tokens * price[1]
+                + cached_tokens * price[2]) / 1_000_000
+
+    def record(self, provider, model, input_tokens, output_tokens, cached_tokens=0,
+               seconds=0.0, source_id=None, source_name=None, purpose=None, estimated=False):
+        """Add one provider call; `estimated` marks token counts that did not come from the provider"""
+        if not self.enabled:
+            return
+        key = (provider, model, source_id, purpose or 'other')
+        values = (1, 1 if estimated else 0, input_tokens, output_tokens, cached_tokens, int(seconds * 1000))
+        with self.lock:
+            if source_id is not None and source_name:
+                self.source_names[source_id] = source_name
+            for table in (self.totals, self.pending):
+                row = table.setdefault(key, [0] * len(values))
+                for index, value in enumerate(values):
+                    row[index] += value
+
+    def flush(self, connection):
+        """Insert usage accumulated since the last flush; rows are kept for the next try on error"""
+        if not self.enabled or self.table_missing:
+            return 0
+        with self.lock:
+            pending, self.pending = self.pending, {}
+            period_start, self.period_start = self.period_start, time.time()
+        if not pending:
+            return 0
+
+        rows = []
+        for (provider, model, source_id, purpose), (calls, estimated, inp, out, cached, ms) in pending.items():
+            cost = self.cost(model, inp, out, cached)
+            rows.append((self.run_id, time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(period_start)),
+                         provider, model, source_id, purpose, calls, estimated, inp, out, cached, ms,
+                         None if cost is None else round(cost, 6)))
+        cursor = connection.cursor()
+        try:
+            cursor.execute(f"""
+                INSERT INTO llm_usage
+                    (run_id, period_start, period_end, provider, model, source_id, purpose, calls,
+                     estimated_calls, input_tokens, output_tokens, cached_tokens, latency_ms, cost_usd)
+                VALUES {', '.join(['(%s, %s, NOW(), %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)'] * len(rows))}
+            """, [value for row in rows for value in row])
+            connection.commit()
+            return len(rows)
+        except Error as e:
+            connection.rollback()
+            if e.errno == 1146:  # ER_NO_SUCH_TABLE
+                self.table_missing = True
+                print("⚠ llm_usage table missing (apply sql/004_llm_usage.sql); usage kept in the run report only")
+            else:
+                print(f"⚠ LLM usage write failed: {e}")
+                with self.lock:
+                    for key, values in pending.items():
+                        row = self.pending.setdefault(key, [0] * len(values))
+                        for index, value in enumerate(values):
+                            row[index] += value
+            return 0
+        finally:
+            cursor.close()
+
+    def summary_lines(self, top_sources=5):
+        """Run totals by provider/model, then the most expensive sources"""
+        with self.lock:
+            totals = {key: list(values) for key, values in self.totals.items()}
+            names = dict(self.source_names)
+        if not totals:
+            return ["LLM usage: no provider calls"]
+
+        by_model, by_source = {}, {}
+        for (provider, model, source_id, _), values in totals.items():
+            for table, key in ((by_model, (provider, model)), (by_source, source_id)):
+                row = table.setdefault(key, [0] * len(values) + [0.0])
+                for index, value in enumerate(values):
+                    row[index] += value
+                row[-1] += self.cost(model, values[2], values[3], values[4]) or 0.0
+
+        lines = []
+        for (provider, model), (calls, estimated, inp, out, cached, ms, cost) in sorted(by_model.items()):
+            note = f", {estimated} estimated" if estimated else ""
+            lines.append(f"LLM usage {provider} ({model}): {calls} calls{note}, {inp} in / {out} out / "
+                         f"{cached} cached tokens, {ms / max(calls, 1) / 1000:.1f}s avg, ${cost:.4f}")
+        ranked = sorted(by_source.items(), key=lambda item: (item[1][-1], item[1][2]), reverse=True)
+        lines.append("Top sources by cost: " + ", ".join(
+            f"{names.get(source_id, 'unknown') if source_id is not None else 'none'} "
+            f"${row[-1]:.4f} ({row[2] + row[3]} tokens)"
+            for source_id, row in ranked[:top_sources]))
+        return lines
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Metrics - per-stage timers, counters and latency histograms for the summarizer
+Every observation is appended to a JSON-lines file (METRICS_JSONL_PATH) and folded into
+Prometheus histograms written to a node_exporter textfile-collector file
+(METRICS_TEXTFILE_PATH); summary_lines() gives a per-run p50/p95/p99 table by stage
+"""
+
+import os
+import json
+import time
+import random
+from contextlib import contextmanager
+from threading import Lock
+
+
+# Histogram bucket upper bounds in seconds (provider calls, fetches and renders all fit)
+BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 20, 30, 60, 120)
+
+# Samples kept per series for percentiles (reservoir sampled beyond this)
+MAX_SAMPLES = 5000
+
+
+class _Series:
+    """One (stage, labels) latency series"""
+    __slots__ = ('count', 'total', 'buckets', 'samples')
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.buckets = [0] * len(BUCKETS)
+        self.samples = []
+
+    def add(self, seconds):
+        self.count += 1
+        self.total += seconds
+        for index, bound in enumerate(BUCKETS):
+            if seconds <= bound:
+                self.buckets[index] += 1
+                break
+        if len(self.samples) < MAX_SAMPLES:
+            self.samples.append(seconds)
+        else:
+            slot = random.randrange(self.count)
+            if slot < MAX_SAMPLES:
+                self.samples[slot] = seconds
+
+
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    rank = max(int(round(fraction * len(sorted_values) + 0.5)) - 1, 0)
+    return sorted_values[min(rank, len(sorted_values) - 1)]
+
+
+class Metrics:
+    """Thread-safe registry shared by all worker threads of one process"""
+
+    def __init__(self, prefix='summarizer', jsonl_path=None, textfile_path=None):
+        self.prefix = prefix
+        self.enabled = os.getenv('METRICS_ENABLED', '1') != '0'
+        log_dir = os.getenv('LOG_DIR', '/var/log/scraper')
+        self.jsonl_path = jsonl_path or os.getenv('METRICS_JSONL_PATH',
+                                                  os.path.join(log_dir, f'{prefix}_metrics.jsonl'))
+        # Point this at node_exporter's --collector.textfile.directory to have it scraped
+        self.textfile_path = textfile_path or os.getenv('METRICS_TEXTFILE_PATH',
+                                                        os.path.join(log_dir, f'{prefix}.prom'))
+        self.lock = Lock()
+        self.series = {}     # (stage, labels) -> _Series
+        self.counters = {}   # (name, labels) -> value
+        self.started_at = time.time()
+        self._last_write = 0
+        self.jsonl = None
+        if self.enabled and self.jsonl_path:
+            try:
+                self.jsonl = open(self.jsonl_path, 'a', buffering=1)
+            except OSError as e:
+                print(f"⚠ Metrics JSON lines disabled ({e})")
+
+    @staticmethod
+    def _key(name, labels):
+        return name, tuple(sorted((k, str(v)) for k, v in labels.items() if v is not None))
+
+    def _emit(self, record):
+        if self.jsonl is not None:
+            try:
+                self.jsonl.write(json.dumps(record, separators=(',', ':')) + '\n')
+            except (OSError, ValueError):
+                pass
+
+    def observe(self, stage, seconds, **labels):
+        """Record one duration for a stage, e.g. observe('provider', 1.2, provider='anthropic', outcome='ok')"""
+        if not self.enabled:
+            return
+        key = self._key(stage, labels)
+        with self.lock:
+            series = self.series.get(key)
+            if series is None:
+                series = self.series[key] = _Series()
+            series.add(seconds)
+            self._emit({'ts': round(time.time(), 3), 'stage': stage, 'seconds': round(seconds, 4), **dict(key[1])})
+
+    @contextmanager
+    def timer(self, stage, **labels):
+        """Time a block; labels may be filled in inside it (e.g. outcome) via the yielded dict"""
+        start = time.perf_counter()
+        try:
+            yield labels
+        finally:
+            self.observe(stage, time.perf_counter() - start, **labels)
+
+    def count(self, name, value=1, **labels):
+        """Increment a counter, e.g. count('articles', outcome='summarized')"""
+        if not self.enabled:
+            return
+        key = self._key(name, labels)
+        with self.lock:
+            self.counters[key] = self.counters.get(key, 0) + value
+            self._emit({'ts': round(time.time(), 3), 'counter': name, 'value': value, **dict(key[1])})
+
+    def write_textfile(self, force=False):
+        """Write all series and counters in Prometheus text format (atomic rename; throttled unless forced)"""
+        if not self.enabled or not self.textfile_path:
+            return
+        now = time.time()
+        if not force and now - self._last_write < 10:
+            return
+        self._last_write = now
+        with self.lock:
+            series = sorted(self.series.items())
+            counters = sorted(self.counters.items())
+
+        def label_text(labels, extra=()):
+            pairs = list(labels) + list(extra)
+            if not pairs:
+                return ''
+            return '{' + ','.join(f'{k}="{v}"' for k, v in pairs) + '}'
+
+        lines = []
+        seen = set()
+        for (stage, labels), s in series:
+            name = f"{self.prefix}_{stage}_seconds"
+            if name not in seen:
+                seen.add(name)
+                lines.append(f"# HELP {name} Duration of the {stage} stage")
+                lines.append(f"# TYPE {name} histogram")
+            cumulative = 0
+            for bound, count in zip(BUCKETS, s.buckets):
+                cumulative += count
+                lines.append(f"{name}_bucket{label_text(labels, [('le', bound)])} {cumulative}")
+            lines.append(f"{name}_bucket{label_text(labels, [('le', '+Inf')])} {s.count}")
+            lines.append(f"{name}_sum{label_text(labels)} {s.total:.6f}")
+            lines.append(f"{name}_count{label_text(labels)} {s.count}")
+        for (counter, labels), value in counters:
+            name = f"{self.prefix}_{counter}_total"
+            if name not in seen:
+                seen.add(name)
+                lines.append(f"# TYPE {name} counter")
+            lines.append(f"{name}{label_text(labels)} {value}")
+        lines.append(f"# TYPE {self.prefix}_last_write_timestamp gauge")
+        lines.append(f"{self.prefix}_last_write_timestamp {time.time():.0f}")
+
+        tmp_path = f"{self.textfile_path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, 'w') as f:
+                f.write('\n'.join(lines) + '\n')
+            os.replace(tmp_path, self.textfile_path)
+        except OSError:
+            pass
+
+    def summary_lines(self, group_by=('provider', 'method')):
+        """p50/p95/p99 table per stage, split by the first of `group_by` labels a series carries"""
+        rows = {}
+        with self.lock:
+            for (stage, labels), s in self.series.items():
+                label_map = dict(labels)
+                detail = next((label_map[k] for k in group_by if k in label_map), '')
+                row = rows.setdefault((stage, detail), {'count': 0, 'total': 0.0, 'samples': []})
+                row['count'] += s.count
+                row['total'] += s.total
+                row['samples'].extend(s.samples)
+
+        lines = [f"{'stage':<24} {'n':>6} {'p50':>7} {'p95':>7} {'p99':>7} {'total s':>9}"]
+        for (stage, detail), row in sorted(rows.items()):
+            values = sorted(row['samples'])
+            name = f"{stage}:{detail}" if detail else stage
+            lines.append(f"{name[:24]:<24} {row['count']:>6} {percentile(values, 0.5):>7.2f} "
+                         f"{percentile(values, 0.95):>7.2f} {percentile(values, 0.99):>7.2f} {row['total']:>9.1f}")
+        with self.lock:
+            counters = sorted(self.counters.items())
+        if counters:
+            lines.append(', '.join(
+                f"{name}{'[' + ','.join(v for _, v in labels) + ']' if labels else ''}={value}"
+                for (name, labels), value in counters))
+        return lines
+
+    def close(self):
+        self.write_textfile(force=True)
+        if self.jsonl is not None:
+            try:
+                self.jsonl.close()
+            except OSError:
+                pass
+            self.jsonl = None
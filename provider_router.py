@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+"""
+Provider Router - latency/health-aware ordering of AI providers with circuit breakers
+Shared by all worker threads; state is persisted to a JSON status file between runs
+"""
+
+import os
+import json
+import time
+from collections import deque
+from threading import Lock
+
+
+class ProviderHealth:
+    """Mutable health record for one provider (guarded by the router lock)"""
+
+    def __init__(self, name):
+        self.name = name
+        self.state = ProviderRouter.CLOSED
+        self.ewma_latency = None
+        self.ewma_error_rate = 0.0
+        self.consecutive_failures = 0
+        self.cooldown = 0
+        self.open_until = 0
+        self.rate_limited_until = 0
+        self.probe_in_flight = False
+        self.successes = 0
+        self.failures = 0
+        self.rate_limits = 0
+        self.last_error = None
+        # Recent successful latencies for percentile estimates (hedging)
+        self.latency_samples = deque(maxlen=50)
+
+    def to_dict(self):
+        return {
+            'state': self.state,
+            'ewma_latency': round(self.ewma_latency, 3) if self.ewma_latency is not None else None,
+            'ewma_error_rate': round(self.ewma_error_rate, 3),
+            'consecutive_failures': self.consecutive_failures,
+            'cooldown': self.cooldown,
+            'open_until': self.open_until,
+            'rate_limited_until': self.rate_limited_until,
+            'successes': self.successes,
+            'failures': self.failures,
+            'rate_limits': self.rate_limits,
+            'last_error': self.last_error,
+        }
+
+
+class ProviderRouter:
+    """Orders providers by health within the configured AI_PROVIDER_ORDER policy.
+
+    Providers are never used unless they appear in the policy list. Within it,
+    healthy providers keep their configured order, degraded ones (high error
+    rate or much slower than the fastest healthy provider) move behind them,
+    and providers with an open breaker or an active rate limit are skipped.
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, providers, status_file=None):
+        self.providers = list(providers)
+        self.status_file = status_file
+        self.lock = Lock()
+        self.health = {p: ProviderHealth(p) for p in self.providers}
+
+        self.failure_threshold = self._env_number('AI_ROUTER_FAILURE_THRESHOLD', 3, int)
+        self.base_cooldown = self._env_number('AI_ROUTER_COOLDOWN_SECONDS', 60, float)
+        self.max_cooldown = self._env_number('AI_ROUTER_MAX_COOLDOWN_SECONDS', 900, float)
+        self.ewma_alpha = self._env_number('AI_ROUTER_EWMA_ALPHA', 0.3, float)
+        self.slow_factor = self._env_number('AI_ROUTER_SLOW_FACTOR', 2.5, float)
+        self.degraded_error_rate = self._env_number('AI_ROUTER_DEGRADED_ERROR_RATE', 0.5, float)
+        self.reorder = os.getenv('AI_ROUTER_REORDER', '1') != '0'
+
+        # Serializes status writes (and their throttle) across worker threads
+        self.write_lock = Lock()
+        self._last_write = 0
+        self.load_status()
+
+    @staticmethod
+    def _env_number(name, default, cast):
+        try:
+            value = cast(os.getenv(name, default))
+            return value if value > 0 else default
+        except (TypeError, ValueError):
+            return default
+
+    # ---- ordering ----
+
+    def order(self):
+        """Providers to try for the next request, best first"""
+        now = time.time()
+        with self.lock:
+            latencies = [h.ewma_latency for h in self.health.values()
+                         if h.state == self.CLOSED and h.ewma_latency is not None]
+            fastest = min(latencies) if latencies else None
+
+            ranked = []
+            for index, provider in enumerate(self.providers):
+                h = self.health[provider]
+                if h.rate_limited_until > now:
+                    continue
+                if h.state == self.OPEN and h.open_until > now:
+                    continue
+                tier = 0
+                if self.reorder:
+                    if h.state != self.CLOSED:
+                        tier = 1
+                    elif h.ewma_error_rate >= self.degraded_error_rate:
+                        tier = 1
+                    elif fastest and h.ewma_latency and h.ewma_latency > fastest * self.slow_factor:
+                        tier = 1
+                ranked.append((tier, index, provider))
+
+        return [provider for _, _, provider in sorted(ranked)]
+
+    def latency_percentile(self, provider, pct, min_samples=5):
+        """Observed latency percentile (0-1) of recent successes, or None with too few samples"""
+        with self.lock:
+            h = self.health.get(provider)
+            if h is None or len(h.latency_samples) < min_samples:
+                return None
+            samples = sorted(h.latency_samples)
+        index = min(len(samples) - 1, int(round(pct * (len(samples) - 1))))
+        return samples[index]
+
+    def acquire(self, provider):
+        """Claim permission to call a provider; only one half-open probe runs at a time"""
+        now = time.time()
+        with self.lock:
+            h = self.health.get(provider)
+            if h is None:
+                return False
+            if h.rate_limited_until > now:
+                return False
+            if h.state == self.OPEN:
+                if h.open_until > now:
+                    return False
+                h.state = self.HALF_OPEN
+                h.probe_in_flight = False
+            if h.state == self.HALF_OPEN:
+                if h.probe_in_flight:
+                    return False
+                h.probe_in_flight = True
+            return True
+
+    def release(self, provider):
+        """Give back an acquired slot whose call never started"""
+        with self.lock:
+            h = self.health.get(provider)
+            if h is not None:
+                h.probe_in_flight = False
+
+    # ---- outcome recording ----
+
+    def _observe_latency(self, h, latency):
+        if latency is None:
+            return
+        if h.ewma_latency is None:
+            h.ewma_latency = latency
+        else:
+            h.ewma_latency = self.ewma_alpha * latency + (1 - self.ewma_alpha) * h.ewma_latency
+
+    def record_success(self, provider, latency):
+        with self.lock:
+            h = self.health.get(provider)
+            if h is None:
+                return
+            self._observe_latency(h, latency)
+            if latency is not None:
+                h.latency_samples.append(latency)
+            h.ewma_error_rate = (1 - self.ewma_alpha) * h.ewma_error_rate
+            h.consecutive_failures = 0
+            h.successes += 1
+            if h.state != self.CLOSED:
+                print(f"  ↺ {provider} circuit closed")
+            h.state = self.CLOSED
+            h.cooldown = 0
+            h.probe_in_flight = False
+        self.write_status()
+
+    def record_failure(self, provider, latency, reason=None):
+        now = time.time()
+        with self.lock:
+            h = self.health.get(provider)
+            if h is None:
+                return
+            self._observe_latency(h, latency)
+            h.ewma_error_rate = self.ewma_alpha + (1 - self.ewma_alpha) * h.ewma_error_rate
+            h.consecutive_failures += 1
+            h.failures += 1
+            h.last_error = reason
+            h.probe_in_flight = False
+            if h.state == self.HALF_OPEN or h.consecutive_failures >= self.failure_threshold:
+                if h.state == self.HALF_OPEN:
+                    h.cooldown = min(max(h.cooldown, self.base_cooldown) * 2, self.max_cooldown)
+                else:
+                    h.cooldown = h.cooldown or self.base_cooldown
+                if h.state != self.OPEN:
+                    print(f"  ⊗ {provider} circuit open for {h.cooldown:.0f}s ({reason or 'failures'})")
+                h.state = self.OPEN
+                h.open_until = now + h.cooldown
+        self.write_status()
+
+    def record_rate_limit(self, provider, retry_after=None):
+        """A 429 pauses the provider without counting against its breaker"""
+        try:
+            delay = float(retry_after) if retry_after else self.base_cooldown
+        except ValueError:
+            delay = self.base_cooldown
+        with self.lock:
+            h = self.health.get(provider)
+            if h is None:
+                return
+            h.rate_limits += 1
+            h.rate_limited_until = time.time() + min(delay, self.max_cooldown)
+            h.probe_in_flight = False
+        print(f"  ⏸ {provider} rate limited for {min(delay, self.max_cooldown):.0f}s")
+        self.write_status()
+
+    # ---- status file ----
+
+    def snapshot(self):
+        with self.lock:
+            return {p: h.to_dict() for p, h in self.health.items()}
+
+    def write_status(self, force=False):
+        """Write router state to the status file (throttled unless forced)"""
+        if not self.status_file:
+            return
+        # A thread finding another one mid-write skips: that write is at most moments old
+        if not self.write_lock.acquire(blocking=force):
+            return
+        try:
+            now = time.time()
+            if not force and now - self._last_write < 5:
+                return
+            self._last_write = now
+            data = {'updated_at': now, 'pid': os.getpid(), 'providers': self.snapshot()}
+            tmp_path = f"{self.status_file}.{os.getpid()}.tmp"
+            with open(tmp_path, 'w') as f:
+                json.dump(data, f, indent=2)
+            os.replace(tmp_path, self.status_file)
+        except OSError:
+            pass
+        finally:
+            self.write_lock.release()
+
+    def load_status(self):
+        """Restore open breakers and rate limits left by a recent run"""
+        if not self.status_file or not os.path.exists(self.status_file):
+            return
+        try:
+            with open(self.status_file) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if time.time() - data.get('updated_at', 0) > self.max_cooldown:
+            return
+        for provider, saved in data.get('providers', {}).items():
+            h = self.health.get(provider)
+            if h is None:
+                continue
+            h.ewma_latency = saved.get('ewma_latency')
+            h.ewma_error_rate = saved.get('ewma_error_rate', 0.0)
+            h.rate_limited_until = saved.get('rate_limited_until', 0)
+            if saved.get('state') in (self.OPEN, self.HALF_OPEN):
+                # Resume as open; the next request after cooldown becomes the probe
+                h.state = self.OPEN
+                h.cooldown = saved.get('cooldown') or self.base_cooldown
+                h.open_until = saved.get('open_until', 0)
@@ -0,0 +1,371 @@
+#!/usr/bin/env python3
+"""
+Rate Limiter - per-provider, per-key request and token buckets shared across processes
+Each API key has a requests-per-minute and a tokens-per-minute bucket stored in a local
+SQLite file, so every worker thread and every summarizer process on the host draws from
+the same budget. Limits come from AI_RPM_<PROVIDER>/AI_TPM_<PROVIDER> or are learned from
+the providers' rate-limit response headers; a 429 blocks only the key that hit it. Callers
+wait for capacity (up to AI_RATE_MAX_WAIT_SECONDS) instead of failing over, and several
+keys per provider (<PROVIDER>_API_KEYS=key:weight,...) are rotated by weight.
+"""
+
+import os
+import re
+import time
+import sqlite3
+import hashlib
+from email.utils import parsedate_to_datetime
+from datetime import datetime
+from threading import Lock
+
+
+DEFAULT_LIMITS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'rate_limits.sqlite')
+
+# Environment prefix of each provider's key variables (<PREFIX>_API_KEY / <PREFIX>_API_KEYS)
+KEY_ENV_PREFIXES = {'anthropic': 'ANTHROPIC', 'minai': 'MINAI', 'deepseek': 'DEEPSEEK', 'openai': 'OPENAI'}
+
+# Rate-limit headers: (requests limit, requests remaining, requests reset,
+#                      tokens limit, tokens remaining, tokens reset)
+ANTHROPIC_HEADERS = ('anthropic-ratelimit-requests-limit', 'anthropic-ratelimit-requests-remaining',
+                     'anthropic-ratelimit-requests-reset', 'anthropic-ratelimit-tokens-limit',
+                     'anthropic-ratelimit-tokens-remaining', 'anthropic-ratelimit-tokens-reset')
+OPENAI_HEADERS = ('x-ratelimit-limit-requests', 'x-ratelimit-remaining-requests',
+                  'x-ratelimit-reset-requests', 'x-ratelimit-limit-tokens',
+                  'x-ratelimit-remaining-tokens', 'x-ratelimit-reset-tokens')
+
+# OpenAI-style reset durations: "1s", "6m0s", "20ms", "1h2m3.5s"
+DURATION_PART = re.compile(r'(\d+(?:\.\d+)?)(ms|h|m|s)')
+DURATION_UNITS = {'ms': 0.001, 's': 1, 'm': 60, 'h': 3600}
+
+
+class ApiKey:
+    """One configured key: the secret, its rotation weight and a stable id for the shared store"""
+
+    def __init__(self, secret, weight=1):
+        self.secret = secret
+        self.weight = max(weight, 1)
+        self.key_id = hashlib.sha256(secret.encode('utf-8')).hexdigest()[:12]
+
+    def __repr__(self):
+        return f"ApiKey({self.key_id}, weight={self.weight})"
+
+
+def keys_from_env(provider):
+    """Keys for a provider from <PREFIX>_API_KEYS ("key:weight,key,...") plus <PREFIX>_API_KEY"""
+    prefix = KEY_ENV_PREFIXES.get(provider, provider.upper())
+    keys = []
+    for entry in os.getenv(f'{prefix}_API_KEYS', '').split(','):
+        secret, _, weight = entry.strip().rpartition(':')
+        if not secret or not weight.isdigit():
+            secret, weight = entry.strip(), '1'
+        if secret and secret not in [k.secret for k in keys]:
+            keys.append(ApiKey(secret, int(weight)))
+    single = os.getenv(f'{prefix}_API_KEY')
+    if single and single not in [k.secret for k in keys]:
+        keys.append(ApiKey(single))
+    return keys
+
+
+def _seconds_until(value, now):
+    """Seconds from now until a reset header value (RFC 3339 time, duration, or seconds)"""
+    value = (value or '').strip()
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    parts = DURATION_PART.findall(value)
+    if parts and ''.join(n + u for n, u in parts) == value:
+        return sum(float(n) * DURATION_UNITS[u] for n, u in parts)
+    try:
+        return max(datetime.fromisoformat(value.replace('Z', '+00:00')).timestamp() - now, 0.0)
+    except ValueError:
+        return None
+
+
+def retry_after_seconds(headers, now=None):
+    """Delay requested by a 429 (retry-after-ms, retry-after seconds or HTTP date), or None"""
+    now = now or time.time()
+    if headers.get('retry-after-ms'):
+        try:
+            return float(headers['retry-after-ms']) / 1000
+        except ValueError:
+            pass
+    value = headers.get('retry-after')
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - now, 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+def _int_header(headers, name):
+    try:
+        return int(float(headers.get(name)))
+    except (TypeError, ValueError):
+        return None
+
+
+class Lease:
+    """Permission to send one request with a specific key"""
+    __slots__ = ('provider', 'key', 'tokens', 'waited')
+
+    def __init__(self, provider, key, tokens, waited):
+        self.provider = provider
+        self.key = key
+        self.tokens = tokens
+        self.waited = waited
+
+
+class RateLimiter:
+    """Token buckets per (provider, key) in a SQLite file shared by all summarizer processes"""
+
+    def __init__(self, provider_keys, path=None):
+        self.keys = {provider: list(keys) for provider, keys in provider_keys.items() if keys}
+        self.enabled = os.getenv('AI_RATE_LIMIT_ENABLED', '1') != '0'
+        self.path = path or os.getenv('AI_RATE_LIMIT_PATH', DEFAULT_LIMITS_PATH)
+        self.max_wait = self._env_float('AI_RATE_MAX_WAIT_SECONDS', 20)
+        # Configured per-key limits; 0/unset means "learn from headers"
+        self.configured = {
+            provider: (self._env_float(f'AI_RPM_{provider.upper()}', 0),
+                       self._env_float(f'AI_TPM_{provider.upper()}', 0))
+            for provider in self.keys
+        }
+
+        self.lock = Lock()
+        self.rotation = {provider: {k.key_id: 0 for k in keys} for provider, keys in self.keys.items()}
+        self.stats = {'requests': 0, 'delayed': 0, 'wait_seconds': 0.0, 'rate_limited': 0, 'gave_up': 0}
+        self.conn = None
+
+        if self.enabled:
+            try:
+                self.conn = sqlite3.connect(self.path, timeout=10, check_same_thread=False,
+                                            isolation_level=None)
+                self.conn.execute("PRAGMA journal_mode=WAL")
+                self.conn.execute("""
+                    CREATE TABLE IF NOT EXISTS rate_buckets (
+                        provider TEXT NOT NULL,
+                        key_id TEXT NOT NULL,
+                        rpm_limit REAL NOT NULL DEFAULT 0,
+                        tpm_limit REAL NOT NULL DEFAULT 0,
+                        requests REAL NOT NULL DEFAULT 0,
+                        tokens REAL NOT NULL DEFAULT 0,
+                        blocked_until REAL NOT NULL DEFAULT 0,
+                        updated_at REAL NOT NULL,
+                        PRIMARY KEY (provider, key_id)
+                    )
+                """)
+            except sqlite3.Error as e:
+                print(f"⚠ Rate limiter disabled ({e})")
+                self.enabled = False
+                self.conn = None
+
+    @staticmethod
+    def _env_float(name, default):
+        try:
+            value = float(os.getenv(name, default))
+            return value if value >= 0 else default
+        except ValueError:
+            return default
+
+    def key_count(self, provider):
+        return len(self.keys.get(provider, ()))
+
+    def _rotation_order(self, provider):
+        """Smooth weighted round robin: the key due next first, the rest by their running credit"""
+        keys = self.keys[provider]
+        credit = self.rotation[provider]
+        total = sum(k.weight for k in keys)
+        for k in keys:
+            credit[k.key_id] += k.weight
+        ordered = sorted(keys, key=lambda k: credit[k.key_id], reverse=True)
+        credit[ordered[0].key_id] -= total
+        return ordered
+
+    def _limits(self, provider, row):
+        rpm, tpm = self.configured.get(provider, (0, 0))
+        return rpm or row['rpm_limit'], tpm or row['tpm_limit']
+
+    def _refill(self, provider, row, now):
+        rpm, tpm = self._limits(provider, row)
+        elapsed = max(now - row['updated_at'], 0)
+        if rpm:
+            row['requests'] = min(rpm, row['requests'] + elapsed * rpm / 60)
+        if tpm:
+            row['tokens'] = min(tpm, row['tokens'] + elapsed * tpm / 60)
+        row['updated_at'] = now
+
+    def _wait_for(self, provider, row, tokens, now):
+        """Seconds until this key can take a request of `tokens` (0 = now)"""
+        rpm, tpm = self._limits(provider, row)
+        wait = max(row['blocked_until'] - now, 0)
+        if rpm and row['requests'] < 1:
+            wait = max(wait, (1 - row['requests']) * 60 / rpm)
+        if tpm and row['tokens'] < min(tokens, tpm):
+            wait = max(wait, (min(tokens, tpm) - row['tokens']) * 60 / tpm)
+        return wait
+
+    def _load_rows(self, provider, keys, now):
+        rows = {}
+        for key in keys:
+            found = self.conn.execute("""
+                SELECT rpm_limit, tpm_limit, requests, tokens, blocked_until, updated_at
+                FROM rate_buckets WHERE provider = ? AND key_id = ?
+            """, (provider, key.key_id)).fetchone()
+            if found is None:
+                rpm, tpm = self.configured.get(provider, (0, 0))
+                found = (0, 0, rpm, tpm, 0, now)
+            rows[key.key_id] = dict(zip(
+                ('rpm_limit', 'tpm_limit', 'requests', 'tokens', 'blocked_until', 'updated_at'), found))
+        return rows
+
+    def _save_row(self, provider, key_id, row):
+        self.conn.execute("""
+            INSERT OR REPLACE INTO rate_buckets
+                (provider, key_id, rpm_limit, tpm_limit, requests, tokens, blocked_until, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        """, (provider, key_id, row['rpm_limit'], row['tpm_limit'], row['requests'], row['tokens'],
+              row['blocked_until'], row['updated_at']))
+
+    def _try_take(self, provider, tokens):
+        """Take capacity from the first key (in rotation order) that has it.
+        Returns (key, 0) on success, or (None, seconds until the soonest key frees up)."""
+        with self.lock:
+            keys = self._rotation_order(provider)
+            now = time.time()
+            try:
+                # IMMEDIATE: other processes wait on the file lock instead of racing the read
+                self.conn.execute("BEGIN IMMEDIATE")
+                rows = self._load_rows(provider, keys, now)
+                soonest = None
+                taken = None
+                for key in keys:
+                    row = rows[key.key_id]
+                    self._refill(provider, row, now)
+                    wait = self._wait_for(provider, row, tokens, now)
+                    if wait == 0:
+                        row['requests'] -= 1
+                        row['tokens'] -= tokens
+                        taken = key
+                        self._save_row(provider, key.key_id, row)
+                        break
+                    soonest = wait if soonest is None else min(soonest, wait)
+                self.conn.execute("COMMIT")
+            except sqlite3.Error as e:
+                try:
+                    self.conn.execute("ROLLBACK")
+                except sqlite3.Error:
+                    pass
+                print(f"⚠ Rate limiter store error ({e}), not throttling")
+                return keys[0], 0
+        return (taken, 0) if taken else (None, soonest)
+
+    def acquire(self, provider, tokens=0, cancel_event=None):
+        """Wait until some key of `provider` has room for one request of ~`tokens` tokens.
+        Returns a Lease, or None when no key frees up within AI_RATE_MAX_WAIT_SECONDS
+        (or cancel_event is set while waiting)."""
+        keys = self.keys.get(provider)
+        if not keys:
+            return None
+        if not self.enabled or self.conn is None:
+            with self.lock:
+                return Lease(provider, self._rotation_order(provider)[0], tokens, 0.0)
+
+        start = time.time()
+        while True:
+            key, wait = self._try_take(provider, tokens)
+            waited = time.time() - start
+            if key is not None:
+                with self.lock:
+                    self.stats['requests'] += 1
+                    if waited > 0.05:
+                        self.stats['delayed'] += 1
+                        self.stats['wait_seconds'] += waited
+                return Lease(provider, key, tokens, waited)
+            if waited + wait > self.max_wait:
+                with self.lock:
+                    self.stats['gave_up'] += 1
+                return None
+            # Short slices so a freed bucket (or a cancelled hedge) is noticed promptly
+            delay = min(max(wait, 0.05), 1.0)
+            if cancel_event is not None:
+                if cancel_event.wait(delay):
+                    return None
+            else:
+                time.sleep(delay)
+
+    def observe(self, lease, status_code, headers):
+        """Fold a response's rate-limit headers (and a 429) into the lease's key bucket.
+        Returns the seconds the key is blocked for after a 429, else 0."""
+        if lease is None or not self.enabled or self.conn is None:
+            return 0
+        names = ANTHROPIC_HEADERS if lease.provider == 'anthropic' else OPENAI_HEADERS
+        req_limit, req_left = _int_header(headers, names[0]), _int_header(headers, names[1])
+        tok_limit, tok_left = _int_header(headers, names[3]), _int_header(headers, names[4])
+        blocked = 0
+        if status_code == 429:
+            blocked = retry_after_seconds(headers) or 0
+        if not any(v is not None for v in (req_limit, req_left, tok_limit, tok_left)) and not blocked \
+                and status_code != 429:
+            return 0
+
+        with self.lock:
+            now = time.time()
+            key_id = lease.key.key_id
+            try:
+                self.conn.execute("BEGIN IMMEDIATE")
+                row = self._load_rows(lease.provider, [lease.key], now)[key_id]
+                self._refill(lease.provider, row, now)
+                # Until a limit is known requests are not metered, only counted down below zero
+                rpm_known, tpm_known = self._limits(lease.provider, row)
+                if req_limit:
+                    row['rpm_limit'] = req_limit
+                if tok_limit:
+                    row['tpm_limit'] = tok_limit
+                # The provider's count is authoritative when it is lower than ours (or ours is unmetered)
+                if req_left is not None:
+                    row['requests'] = min(row['requests'], req_left) if rpm_known else req_left
+                    if req_left <= 0:
+                        reset = _seconds_until(headers.get(names[2]), now)
+                        blocked = max(blocked, reset or 0)
+                if tok_left is not None:
+                    row['tokens'] = min(row['tokens'], tok_left) if tpm_known else tok_left
+                    if tok_left <= 0:
+                        reset = _seconds_until(headers.get(names[5]), now)
+                        blocked = max(blocked, reset or 0)
+                if status_code == 429:
+                    # No usable hint: back off one bucket-refill interval
+                    blocked = blocked or 60 / max(self._limits(lease.provider, row)[0], 1)
+                    row['requests'] = min(row['requests'], 0)
+                if blocked:
+                    row['blocked_until'] = max(row['blocked_until'], now + blocked)
+                self._save_row(lease.provider, key_id, row)
+                self.conn.execute("COMMIT")
+            except sqlite3.Error:
+                try:
+                    self.conn.execute("ROLLBACK")
+                except sqlite3.Error:
+                    pass
+            if status_code == 429:
+                self.stats['rate_limited'] += 1
+        return blocked
+
+    def summary_line(self):
+        s = self.stats
+        keys = ', '.join(f"{p} x{len(k)}" for p, k in self.keys.items())
+        return (f"Rate limiter: {s['requests']} requests, {s['delayed']} delayed "
+                f"({s['wait_seconds']:.0f}s waiting), {s['rate_limited']} 429s, "
+                f"{s['gave_up']} handed to the next provider [{keys}]")
+
+    def close(self):
+        if self.conn is not None:
+            with self.lock:
+                self.conn.close()
+                self.conn = None
+            self.enabled = False
@@ -20,6 +20,8 @@ import requests
 import mysql.connector
 from mysql.connector import Error
 import env_loader  # Auto-loads .env and ~/.env_AI
+from category_index import CategoryIndex
+from llm_cache import LLMCache
 import time
 
 
@@ -55,7 +57,8 @@ class ArticleRecategorizer:
             sys.exit(1)
 
         self.connection = None
-        self.categories_cache = {}
+        self.category_index = CategoryIndex([])
+        self.llm_cache = LLMCache()
 
     def connect_db(self):
         """Establish database connection"""
@@ -73,20 +76,15 @@ class ArticleRecategorizer:
             return False
 
     def load_categories(self):
-        """Load categories into cache"""
-        cursor = self.connection.cursor(dictionary=True)
-        cursor.execute("SELECT id, name, description, level, parentID FROM categories")
-        for row in cursor.fetchall():
-            self.categories_cache[row['name']] = row
-        cursor.close()
-        level2_count = sum(1 for c in self.categories_cache.values() if c.get('level') == 2)
-        print(f"Loaded {len(self.categories_cache)} categories ({level2_count} assignable)")
+        """Build the category index"""
+        self.category_index = CategoryIndex.load(self.connection)
+        print(f"Loaded {len(self.category_index)} categories ({self.category_index.assignable_count} assignable)")
 
     def get_parent_category(self, parent_id):
         """Get parent category info by ID"""
-        for name, data in self.categories_cache.items():
-            if data['id'] == parent_id and data.get('level') == 1:
-                return data
+        data = self.category_index.get_by_id(parent_id)
+        if data and data.get('level') == 1:
+            return data
         return None
 
     def get_articles_in_category_tree(self, parent_id, days=1):
@@ -232,32 +230,44 @@ class ArticleRecategorizer:
         except Exception:
             return None
 
+    def _provider_model(self, provider):
+        """Model name used for a provider (part of the response cache key)"""
+        return {
+            'anthropic': self.anthropic_model,
+            'minai': 'gpt-4o-mini',
+            'deepseek': self.deepseek_model,
+            'openai': self.openai_model,
+        }.get(provider, provider)
+
+    def _call_provider(self, provider, prompt, max_tokens=50):
+        """Call a configured provider by name, answering from the response cache when possible"""
+        calls = {
+            'anthropic': (self.anthropic_key, self.call_anthropic),
+            'minai': (self.minai_key, self.call_minai),
+            'deepseek': (self.deepseek_key, self.call_deepseek),
+            'openai': (self.openai_key, self.call_openai),
+        }
+        key, call = calls.get(provider, (None, None))
+        if not key:
+            return None
+        return self.llm_cache.get_or_call(
+            provider, self._provider_model(provider), prompt, max_tokens,
+            lambda: call(prompt, max_tokens=max_tokens)
+        )
+
     def _categorize_sports(self, title, summary):
         """Categorize sports-source articles with a sports-focused prompt"""
-        # Build only sports and business categories for the prompt
-        sports_cats = []
-        business_cats = []
-        for name, data in self.categories_cache.items():
-            if data.get('level') != 2:
-                continue
-            parent_id = data.get('parentID')
-            for pname, pdata in self.categories_cache.items():
-                if pdata.get('id') == parent_id and pdata.get('level') == 1:
-                    if pname == 'Sports':
-                        desc = data.get('description', '')
-                        sports_cats.append(f"{name}: {desc}" if desc else name)
-                    elif pname == 'Business':
-                        desc = data.get('description', '')
-                        business_cats.append(f"{name}: {desc}" if desc else name)
-                    break
+        # Only sports and business categories go into the prompt
+        sports_cats = self.category_index.prompt_fragment('Sports')
+        business_cats = self.category_index.prompt_fragment('Business')
 
         prompt = f"""You are a sports news classifier. Assign 1-2 categories to this sports article.
 
 SPORTS CATEGORIES (use EXACT names before the colon):
-{chr(10).join('  - ' + c for c in sorted(sports_cats))}
+{chr(10).join('  - ' + c for c in sports_cats)}
 
 BUSINESS CATEGORIES (use ONLY if article is primarily about business):
-{chr(10).join('  - ' + c for c in sorted(business_cats))}
+{chr(10).join('  - ' + c for c in business_cats)}
 
 RULES:
 1. Return 1-2 categories maximum. Prefer 1 specific category.
@@ -278,24 +288,11 @@ Article Summary: {summary}
 Return ONLY category names separated by commas (1-2 categories):"""
 
         for provider in self.provider_order:
-            result = None
-            if provider == 'anthropic' and self.anthropic_key:
-                result = self.call_anthropic(prompt, max_tokens=50)
-            elif provider == 'minai' and self.minai_key:
-                result = self.call_minai(prompt, max_tokens=50)
-            elif provider == 'deepseek' and self.deepseek_key:
-                result = self.call_deepseek(prompt, max_tokens=50)
-            elif provider == 'openai' and self.openai_key:
-                result = self.call_openai(prompt, max_tokens=50)
-            else:
-                continue
+            result = self._call_provider(provider, prompt, max_tokens=50)
 
             if result:
-                suggested = [cat.strip() for cat in result.split(',')]
-                valid = [cat for cat in suggested
-                         if cat in self.categories_cache
-                         and self.categories_cache[cat].get('level') == 2]
-                return valid[:2] if valid else ['Sports News']
+                valid = self.category_index.validate(result, 2)
+                return valid if valid else ['Sports News']
 
         return ['Sports News']
 
@@ -309,30 +306,8 @@ Return ONLY category names separated by commas (1-2 categories):"""
         if main_category == 'Sports':
             return self._categorize_sports(title, summary)
 
-        # Build category list grouped by parent for clarity - only level 2 (assignable) categories
-        parent_groups = {}
-        for name, data in self.categories_cache.items():
-            if data.get('level') != 2:
-                continue
-            parent_id = data.get('parentID')
-            parent_name = None
-            for pname, pdata in self.categories_cache.items():
-                if pdata.get('id') == parent_id and pdata.get('level') == 1:
-                    parent_name = pname
-                    break
-            if parent_name:
-                if parent_name not in parent_groups:
-                    parent_groups[parent_name] = []
-                desc = data.get('description', '')
-                parent_groups[parent_name].append(f"{name}: {desc}" if desc else name)
-
-        # Build structured category listing
-        category_listing = ""
-        for parent in ['Business', 'Technology', 'Sports', 'General']:
-            if parent in parent_groups:
-                category_listing += f"\n[{parent}]\n"
-                for cat in sorted(parent_groups[parent]):
-                    category_listing += f"  - {cat}\n"
+        # Structured listing of level-2 (assignable) categories grouped by parent
+        category_listing = self.category_index.prompt_listing()
 
         prompt = f"""You are a strict news article classifier. Assign 1-3 categories to this article. You MUST follow ALL rules below.
 
@@ -412,25 +387,11 @@ Article Summary: {summary}
 Return ONLY the category names separated by commas (1-3 categories, exact names only):"""
 
         for provider in self.provider_order:
-            result = None
-
-            if provider == 'anthropic' and self.anthropic_key:
-                result = self.call_anthropic(prompt, max_tokens=50)
-            elif provider == 'minai' and self.minai_key:
-                result = self.call_minai(prompt, max_tokens=50)
-            elif provider == 'deepseek' and self.deepseek_key:
-                result = self.call_deepseek(prompt, max_tokens=50)
-            elif provider == 'openai' and self.openai_key:
-                result = self.call_openai(prompt, max_tokens=50)
-            else:
-                continue
+            result = self._call_provider(provider, prompt, max_tokens=50)
 
             if result:
-                suggested = [cat.strip() for cat in result.split(',')]
-                valid = [cat for cat in suggested
-                         if cat in self.categories_cache
-                         and self.categories_cache[cat].get('level') == 2]
-                return valid[:3] if valid else ['Global Business']
+                valid = self.category_index.validate(result, 3)
+                return valid if valid else ['Global Business']
 
         return ['Global Business']
 
@@ -441,8 +402,8 @@ Return ONLY the category names separated by commas (1-3 categories, exact names
         cursor.execute("DELETE FROM article_categories WHERE article_id = %s", (article_id,))
         # Insert new ones
         for category_name in new_categories:
-            if category_name in self.categories_cache:
-                category_id = self.categories_cache[category_name]['id']
+            category_id = self.category_index.id_for(category_name)
+            if category_id is not None:
                 cursor.execute(
                     "INSERT IGNORE INTO article_categories (article_id, category_id) VALUES (%s, %s)",
                     (article_id, category_id)
@@ -463,9 +424,8 @@ Return ONLY the category names separated by commas (1-3 categories, exact names
         if not parent:
             print(f"ERROR: No level-1 category found with ID {parent_id}")
             print("\nAvailable level-1 categories:")
-            for name, data in sorted(self.categories_cache.items(), key=lambda x: x[1]['id']):
-                if data.get('level') == 1:
-                    print(f"  [{data['id']}] {name}")
+            for data in self.category_index.parents():
+                print(f"  [{data['id']}] {data['name']}")
             return
 
         print(f"Parent category: [{parent['id']}] {parent['name']}")
@@ -533,10 +493,12 @@ Return ONLY the category names separated by commas (1-3 categories, exact names
         print(f"  Changed:   {changed}")
         print(f"  Unchanged: {unchanged}")
         print(f"  Errors:    {errors}")
+        print(f"  {self.llm_cache.summary_line()}")
         if dry_run:
             print(f"  (DRY RUN - no changes were saved)")
         print("=" * 60)
 
+        self.llm_cache.close()
         if self.connection and self.connection.is_connected():
             self.connection.close()
 
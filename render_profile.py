@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Render Profile - lean Playwright settings shared by every browser path
+Blocks resource types and tracker domains we never read (images, fonts, video,
+ads, analytics) via route interception, sets the viewport, and meters the bytes
+each page actually downloads
+"""
+
+import os
+import time
+from urllib.parse import urlsplit
+
+
+DEFAULT_BLOCKED_TYPES = 'image,media,font'
+DEFAULT_VIEWPORT = '1920x1080'
+
+# Ad, analytics and tag-manager hosts (suffix match, so subdomains are covered)
+TRACKER_DOMAINS = frozenset("""
+doubleclick.net googlesyndication.com googleadservices.com google-analytics.com googletagmanager.com
+googletagservices.com adservice.google.com amazon-adsystem.com facebook.net scorecardresearch.com
+quantserve.com quantcount.com chartbeat.com chartbeat.net taboola.com outbrain.com criteo.com criteo.net
+adnxs.com rubiconproject.com pubmatic.com openx.net casalemedia.com moatads.com hotjar.com segment.io
+segment.com nr-data.net optimizely.com krxd.net bluekai.com demdex.net omtrdc.net permutive.com
+adsrvr.org bidswitch.net sharethrough.com teads.tv yieldmo.com zemanta.com media.net
+""".split())
+
+
+class PageMeter:
+    """Per-page counters filled in by the profile's route and response hooks"""
+
+    def __init__(self):
+        self.started = time.time()
+        self.requests = 0
+        self.blocked = 0
+        self.bytes = 0
+
+    def on_request(self, request):
+        self.requests += 1
+
+    def on_request_finished(self, request):
+        # Bytes on the wire (headers plus the possibly compressed body), so chunked responses
+        # without a content-length header count too
+        try:
+            sizes = request.sizes()
+            self.bytes += max(sizes['responseBodySize'], 0) + max(sizes['responseHeadersSize'], 0)
+        except Exception:
+            pass  # Page or context already closed
+
+    def result(self):
+        return {
+            'requests': self.requests,
+            'blocked': self.blocked,
+            'bytes': self.bytes,
+            'seconds': time.time() - self.started,
+        }
+
+
+class RenderProfile:
+    """Resource blocking and viewport for a Playwright page or context"""
+
+    def __init__(self, block=None):
+        if block is None:
+            block = os.getenv('RENDER_BLOCKING', '1') != '0'
+        self.block = block
+        self.blocked_types = {
+            t.strip().lower() for t in os.getenv('RENDER_BLOCK_RESOURCES', DEFAULT_BLOCKED_TYPES).split(',') if t.strip()
+        }
+        self.blocked_domains = set(TRACKER_DOMAINS) if os.getenv('RENDER_BLOCK_TRACKERS', '1') != '0' else set()
+        self.blocked_domains.update(
+            d.strip().lower().lstrip('.') for d in os.getenv('RENDER_BLOCK_DOMAINS', '').split(',') if d.strip()
+        )
+        self.viewport = self.parse_viewport(os.getenv('RENDER_VIEWPORT', DEFAULT_VIEWPORT))
+
+    @staticmethod
+    def parse_viewport(value):
+        """'1280x800' -> {'width': 1280, 'height': 800}; falls back to 1920x1080"""
+        try:
+            width, height = (int(part) for part in value.lower().split('x'))
+            if width > 0 and height > 0:
+                return {'width': width, 'height': height}
+        except ValueError:
+            pass
+        return {'width': 1920, 'height': 1080}
+
+    def is_tracker(self, url):
+        host = (urlsplit(url).hostname or '').lower()
+        while host:
+            if host in self.blocked_domains:
+                return True
+            _, _, host = host.partition('.')
+        return False
+
+    def should_block(self, resource_type, url):
+        return self.block and (resource_type in self.blocked_types or self.is_tracker(url))
+
+    def apply(self, target):
+        """Install blocking and metering on a page or browser context; returns its PageMeter"""
+        meter = PageMeter()
+
+        def handle(route):
+            request = route.request
+            if self.should_block(request.resource_type, request.url):
+                meter.blocked += 1
+                route.abort()
+            else:
+                route.continue_()
+
+        if self.block:
+            target.route('**/*', handle)
+        target.on('request', meter.on_request)
+        target.on('requestfinished', meter.on_request_finished)
+        return meter
+
+    def describe(self):
+        if not self.block:
+            return f"blocking off, viewport {self.viewport['width']}x{self.viewport['height']}"
+        return (f"blocking {','.join(sorted(self.blocked_types)) or 'no types'} + "
+                f"{len(self.blocked_domains)} tracker domains, "
+                f"viewport {self.viewport['width']}x{self.viewport['height']}")
+
+    @staticmethod
+    def format_stats(stats):
+        return (f"{stats['bytes'] / 1024:.0f} KB, {stats['requests']} requests "
+                f"({stats['blocked']} blocked), {stats['seconds']:.1f}s")
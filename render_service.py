@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+Render Service - long-lived headless Chromium processes serving page renders
+Worker threads submit URLs through a queue; each render process owns one browser,
+gives every request a fresh context (with the lean RenderProfile applied) and
+recycles the browser after N pages or when its process tree exceeds a memory limit
+"""
+
+import os
+import time
+import itertools
+import multiprocessing
+from threading import Lock, Event, Thread
+
+from render_profile import RenderProfile
+
+
+DEFAULT_USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+LAUNCH_ARGS = ['--no-sandbox', '--disable-blink-features=AutomationControlled']
+
+
+def _process_tree_rss_mb(root_pid):
+    """Resident memory of a process and all its descendants (Linux /proc), 0 if unavailable"""
+    try:
+        children = {}
+        for entry in os.listdir('/proc'):
+            if not entry.isdigit():
+                continue
+            try:
+                with open(f'/proc/{entry}/stat') as f:
+                    fields = f.read().rsplit(')', 1)[1].split()
+                children.setdefault(int(fields[1]), []).append(int(entry))
+            except (OSError, IndexError, ValueError):
+                continue
+        page_kb = os.sysconf('SC_PAGE_SIZE') / 1024
+        total_kb = 0
+        stack = [root_pid]
+        while stack:
+            pid = stack.pop()
+            stack.extend(children.get(pid, []))
+            try:
+                with open(f'/proc/{pid}/statm') as f:
+                    total_kb += int(f.read().split()[1]) * page_kb
+            except (OSError, IndexError, ValueError):
+                continue
+        return total_kb / 1024
+    except (OSError, ValueError):
+        return 0
+
+
+def _render_worker(worker_id, jobs, results, recycle_pages, max_rss_mb, user_agent, profile):
+    """Render process main loop: one browser, one fresh context per request"""
+    from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeout
+
+    with sync_playwright() as p:
+        browser = None
+        pages = 0
+        while True:
+            job = jobs.get()
+            if job is None:
+                break
+            job_id, url, timeout_ms, wait_selector, expires_at = job
+            if time.time() > expires_at:
+                # Caller already gave up while this job was queued
+                results.put((job_id, '', 'expired', {'requests': 0, 'blocked': 0, 'bytes': 0, 'seconds': 0.0}, worker_id))
+                continue
+            html, error = '', None
+            context = None
+            meter = None
+            try:
+                if browser is None:
+                    browser = p.chromium.launch(headless=True, args=LAUNCH_ARGS)
+                context = browser.new_context(user_agent=user_agent, viewport=profile.viewport)
+                meter = profile.apply(context)
+                page = context.new_page()
+                page.goto(url, wait_until='domcontentloaded', timeout=timeout_ms)
+                if wait_selector:
+                    try:
+                        page.wait_for_selector(wait_selector, timeout=5000)
+                    except PlaywrightTimeout:
+                        pass  # Continue even if selector not found
+                html = page.content()
+            except PlaywrightTimeout:
+                error = 'timeout'
+            except Exception as e:
+                error = str(e)[:100]
+                if browser is not None and not browser.is_connected():
+                    browser = None  # Crashed; relaunch on next job
+            finally:
+                if context is not None:
+                    try:
+                        context.close()
+                    except Exception:
+                        pass
+
+            pages += 1
+            page_stats = meter.result() if meter else {'requests': 0, 'blocked': 0, 'bytes': 0, 'seconds': 0.0}
+            results.put((job_id, html, error, page_stats, worker_id))
+
+            if browser is not None and (pages >= recycle_pages or _process_tree_rss_mb(os.getpid()) > max_rss_mb):
+                try:
+                    browser.close()
+                except Exception:
+                    pass
+                browser = None
+                pages = 0
+
+        if browser is not None:
+            browser.close()
+
+
+class RenderService:
+    """Thread-safe front end to a pool of render processes (started lazily on first use)"""
+
+    def __init__(self, workers=None, user_agent=DEFAULT_USER_AGENT, profile=None):
+        self.workers = workers or self._env_int('RENDER_WORKERS', 1)
+        self.recycle_pages = self._env_int('RENDER_RECYCLE_PAGES', 50)
+        self.max_rss_mb = self._env_int('RENDER_MAX_RSS_MB', 1500)
+        self.user_agent = user_agent
+        self.profile = profile or RenderProfile()
+
+        self.lock = Lock()
+        self.started = False
+        self.processes = []
+        self.jobs = None
+        self.results = None
+        self.dispatcher = None
+        self.waiters = {}
+        self.job_ids = itertools.count(1)
+        self.stats = {'pages': 0, 'errors': 0, 'expired': 0, 'render_seconds': 0.0, 'bytes': 0, 'blocked': 0,
+                      'first_request': None}
+
+    @staticmethod
+    def _env_int(name, default):
+        try:
+            value = int(os.getenv(name, default))
+            return value if value > 0 else default
+        except ValueError:
+            return default
+
+    def start(self):
+        with self.lock:
+            if self.started:
+                return
+            ctx = multiprocessing.get_context('spawn')
+            self.jobs = ctx.Queue()
+            self.results = ctx.Queue()
+            for worker_id in range(self.workers):
+                process = ctx.Process(
+                    target=_render_worker,
+                    args=(worker_id, self.jobs, self.results, self.recycle_pages,
+                          self.max_rss_mb, self.user_agent, self.profile),
+                    daemon=True
+                )
+                process.start()
+                self.processes.append(process)
+            self.dispatcher = Thread(target=self._dispatch_results, daemon=True)
+            self.dispatcher.start()
+            self.started = True
+            print(f"✓ Render service started ({self.workers} browser process{'es' if self.workers > 1 else ''}, "
+                  f"{self.profile.describe()})")
+
+    def _dispatch_results(self):
+        while True:
+            item = self.results.get()
+            if item is None:
+                break
+            job_id, html, error, page_stats, _worker_id = item
+            with self.lock:
+                if error == 'expired':
+                    self.stats['expired'] += 1
+                else:
+                    self.stats['pages'] += 1
+                    self.stats['render_seconds'] += page_stats['seconds']
+                    self.stats['bytes'] += page_stats['bytes']
+                    self.stats['blocked'] += page_stats['blocked']
+                    if error:
+                        self.stats['errors'] += 1
+                waiter = self.waiters.pop(job_id, None)
+            if waiter is not None:
+                waiter['result'] = (html, error)
+                waiter['event'].set()
+
+    def render(self, url, timeout=60, wait_selector='article, p', max_wait=None):
+        """Render a URL and return (html, error); html is '' on failure.
+        max_wait caps the total time spent waiting, including queueing (default timeout + 30s)."""
+        if not self.started:
+            self.start()
+        waiter = {'event': Event(), 'result': ('', 'render service timeout')}
+        with self.lock:
+            job_id = next(self.job_ids)
+            self.waiters[job_id] = waiter
+            if self.stats['first_request'] is None:
+                self.stats['first_request'] = time.time()
+        # Allow for queueing behind other renders before giving up
+        deadline = time.time() + (max_wait if max_wait is not None else timeout + 30)
+        self.jobs.put((job_id, url, int(timeout * 1000), wait_selector, deadline))
+        while not waiter['event'].wait(1):
+            if time.time() > deadline or not any(p.is_alive() for p in self.processes):
+                with self.lock:
+                    self.waiters.pop(job_id, None)
+                if not any(p.is_alive() for p in self.processes):
+                    return '', 'render service unavailable'
+                break
+        return waiter['result']
+
+    def summary_line(self):
+        s = self.stats
+        if not s['pages']:
+            return "Render service: no pages rendered"
+        wall = max(time.time() - s['first_request'], 1e-6)
+        return (f"Render service: {s['pages']} pages ({s['errors']} errors), "
+                f"avg {s['render_seconds'] / s['pages']:.2f}s/page, {s['bytes'] / s['pages'] / 1024:.0f} KB/page, "
+                f"{s['blocked']} requests blocked, {s['expired']} expired in queue, "
+                f"{s['pages'] / wall * 60:.1f} pages/min")
+
+    def close(self):
+        """Stop render processes and report throughput"""
+        with self.lock:
+            if not self.started:
+                return
+            self.started = False
+        for _ in self.processes:
+            self.jobs.put(None)
+        for process in self.processes:
+            process.join(timeout=15)
+            if process.is_alive():
+                process.terminate()
+        self.results.put(None)
+        self.dispatcher.join(timeout=5)
+        self.processes = []
+        print(f"  {self.summary_line()}")
@@ -0,0 +1,329 @@
+#!/usr/bin/env python3
+"""
+Result Writer - one background thread owns the summarizer's MySQL writes
+Workers enqueue summary/paywall/failure results instead of opening a connection each;
+the writer keeps a single connection, folds queued results into multi-row UPDATEs
+(a JOIN against a derived table of values) plus one executemany for categories, and
+commits every DB_WRITE_BATCH_SIZE results or DB_WRITE_FLUSH_MS milliseconds
+"""
+
+import os
+import time
+import queue
+import atexit
+import threading
+import mysql.connector
+from mysql.connector import Error
+from article_queue import RETRY_MAX_AGE_HOURS
+
+
+_STOP = object()
+
+
+class ResultWriter:
+    """Queue-fed batching writer for article results"""
+
+    def __init__(self, db_config, batch_size=None, flush_ms=None, metrics=None):
+        self.db_config = db_config
+        self.metrics = metrics
+        self.batch_size = batch_size or self._env_int('DB_WRITE_BATCH_SIZE', 25)
+        self.flush_seconds = (flush_ms or self._env_int('DB_WRITE_FLUSH_MS', 500)) / 1000
+
+        # Also maintain summary_state/next_retry_at (set once sql/002_summary_queue_state.sql is applied)
+        self.queue_state = False
+        # Drop the article's lease with its result (sql/001_article_claims.sql), so a retry is
+        # claimable again without waiting for the worker to exit. Results are only written for
+        # articles worker_id still holds: an expired lease re-claimed elsewhere is not touched
+        self.claims = False
+        self.worker_id = None
+        # Also store cluster_hash/canonical_article_id (sql/005_article_clusters.sql)
+        self.clusters = False
+        # Also maintain isSummaryProvisional (sql/006_provisional_summaries.sql)
+        self.provisional = False
+
+        self.queue = queue.Queue()
+        self.conn = None
+        self.stats = {'results': 0, 'batches': 0, 'statements': 0, 'errors': 0, 'stale': 0}
+        self.thread = None
+        self.closed = False
+        self.start_lock = threading.Lock()
+
+    @staticmethod
+    def _env_int(name, default):
+        try:
+            value = int(os.getenv(name, default))
+            return value if value > 0 else default
+        except ValueError:
+            return default
+
+    # -- producer side (worker threads) --
+
+    def summary(self, article_id, summary, category_ids=(), fulltext=None, has_paywall=None,
+                cluster_hash=None, canonical_id=None, replace_categories=False):
+        """Store a summary; fulltext/has_paywall/cluster_hash are left untouched when None.
+        canonical_id links a near-duplicate to the article whose summary it copied;
+        replace_categories drops the article's previous categories first."""
+        self._put(('summary', article_id, summary, fulltext, has_paywall, tuple(category_ids),
+                   cluster_hash, canonical_id, replace_categories))
+
+    def provisional(self, article_id, summary, category_ids, fulltext, retry_count, retry_delay_minutes=None):
+        """Store a stand-in (extractive) summary and keep the article queued for an LLM retry,
+        scheduled like failed() with the new retry_count and backoff"""
+        self._put(('provisional', article_id, summary, fulltext, 'N' if fulltext else None,
+                   tuple(category_ids), None, None, False, retry_count, retry_delay_minutes))
+
+    def paywalled(self, article_id):
+        """Clear summary/fullArticle and flag the article as paywalled and failed"""
+        self._put(('paywall', article_id))
+
+    def failed(self, article_id, retry_count, retry_delay_minutes=None):
+        """Mark a failed attempt; retry_count is the new summary_retry_count and
+        retry_delay_minutes the backoff before the next one (None: no more retries)"""
+        self._put(('failed', article_id, retry_count, retry_delay_minutes))
+
+    def deferred(self, article_id, delay_seconds):
+        """Hand a claimed article back to the queue untouched, claimable again after delay_seconds
+        (only with leases: claimed_until holds it back while claimed_by no longer names a worker)"""
+        self._put(('deferred', article_id, delay_seconds))
+
+    def _put(self, item):
+        if self.closed:
+            raise RuntimeError("ResultWriter is closed")
+        with self.start_lock:
+            if self.thread is None:
+                self.thread = threading.Thread(target=self._run, name='result-writer', daemon=True)
+                self.thread.start()
+                # Daemon thread so a crash cannot hang exit, but queued results still get written
+                atexit.register(self.close)
+        self.queue.put(item)
+
+    def close(self):
+        """Flush everything queued so far and stop the writer thread"""
+        with self.start_lock:
+            if self.closed:
+                return
+            self.closed = True
+            thread = self.thread
+        if thread is not None:
+            self.queue.put(_STOP)
+            thread.join()
+
+    def summary_line(self):
+        s = self.stats
+        return (f"DB writer: {s['results']} results in {s['batches']} batches "
+                f"({s['statements']} statements, {s['errors']} errors"
+                + (f", {s['stale']} dropped for a lost lease" if s['stale'] else "") + ")")
+
+    # -- writer thread --
+
+    def _run(self):
+        pending = []
+        deadline = None
+        stopping = False
+        while not stopping:
+            timeout = None if deadline is None else max(deadline - time.time(), 0)
+            try:
+                item = self.queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+
+            if item is _STOP:
+                stopping = True
+            elif item is not None:
+                pending.append(item)
+                if deadline is None:
+                    deadline = time.time() + self.flush_seconds
+
+            if pending and (stopping or len(pending) >= self.batch_size or time.time() >= deadline):
+                self._flush(pending)
+                pending = []
+                deadline = None
+
+        if self.conn is not None:
+            try:
+                self.conn.close()
+            except Error:
+                pass
+            self.conn = None
+
+    def _connection(self):
+        if self.conn is not None:
+            try:
+                self.conn.ping(reconnect=True, attempts=2, delay=1)
+                return self.conn
+            except Error:
+                self.conn = None
+        self.conn = mysql.connector.connect(**self.db_config)
+        cursor = self.conn.cursor()
+        cursor.execute("SET time_zone = '-08:00'")
+        cursor.close()
+        return self.conn
+
+    def _flush(self, items):
+        start = time.perf_counter()
+        try:
+            self._write(items)
+            self.stats['batches'] += 1
+            self.stats['results'] += len(items)
+            if self.metrics:
+                self.metrics.observe('db_write', time.perf_counter() - start, outcome='ok')
+            return
+        except Exception as e:
+            if self.metrics:
+                self.metrics.observe('db_write', time.perf_counter() - start, outcome='error')
+            self.stats['errors'] += 1
+            print(f"  ⚠ DB batch of {len(items)} failed ({str(e)[:80]}), writing one by one")
+            self._rollback()
+
+        # One bad row should not cost the rest of the batch
+        for item in items:
+            try:
+                self._write([item])
+                self.stats['results'] += 1
+            except Exception as e:
+                self.stats['errors'] += 1
+                print(f"  ⚠ DB write failed for article {item[1]}: {str(e)[:80]}")
+                self._rollback()
+
+    def _rollback(self):
+        try:
+            if self.conn is not None:
+                self.conn.rollback()
+        except Error:
+            self.conn = None
+
+    def _drop_lost_leases(self, latest):
+        """Remove results for articles this worker no longer holds; the rest stay locked until commit"""
+        ids = list(latest)
+        cursor = self._connection().cursor()
+        try:
+            cursor.execute(f"""
+                SELECT id FROM articles
+                WHERE id IN ({', '.join(['%s'] * len(ids))}) AND claimed_by = %s
+                FOR UPDATE
+            """, ids + [self.worker_id])
+            held = {row[0] for row in cursor.fetchall()}
+        finally:
+            cursor.close()
+        lost = [article_id for article_id in ids if article_id not in held]
+        for article_id in lost:
+            del latest[article_id]
+        if lost:
+            self.stats['stale'] += len(lost)
+            print(f"  ⚠ Lease lost for article(s) {', '.join(map(str, lost))}, result not written")
+
+    def _write(self, items):
+        # Last result wins if an article shows up twice in one batch
+        latest = {}
+        for item in items:
+            latest[item[1]] = item
+        # An expired lease re-claimed by another worker: its result (and lease) belong to that worker
+        if self.claims:
+            self._drop_lost_leases(latest)
+        summaries = [i for i in latest.values() if i[0] in ('summary', 'provisional')]
+        paywalled = [i[1] for i in latest.values() if i[0] == 'paywall']
+        deferred = [i for i in latest.values() if i[0] == 'deferred'] if self.claims else []
+        # A provisional summary is written like a summary, then its retry is scheduled like a failure
+        # (without isSummaryFailed: the reports count it as summarized)
+        failed = [i for i in latest.values() if i[0] == 'failed']
+        failed += [(i[0], i[1], i[9], i[10]) for i in latest.values() if i[0] == 'provisional']
+
+        release_sql = ", {0}claimed_by = NULL, {0}claimed_until = NULL" if self.claims else ""
+
+        conn = self._connection()
+        cursor = conn.cursor()
+        statements = 0
+        try:
+            if summaries:
+                replaced = [i[1] for i in summaries if i[8]]
+                if replaced:
+                    cursor.execute(f"""
+                        DELETE FROM article_categories
+                        WHERE article_id IN ({', '.join(['%s'] * len(replaced))})
+                    """, replaced)
+                    statements += 1
+
+                rows = ' UNION ALL '.join(
+                    ["SELECT %s AS id, %s AS summary, %s AS fullArticle, %s AS hasPaywall, "
+                     "%s AS cluster_hash, %s AS canonical_id, %s AS provisional"] * len(summaries))
+                cursor.execute(f"""
+                    UPDATE articles a
+                    JOIN ({rows}) v ON a.id = v.id
+                    SET a.summary = v.summary,
+                        a.`fullArticle` = COALESCE(v.fullArticle, a.`fullArticle`),
+                        a.hasPaywall = COALESCE(v.hasPaywall, a.hasPaywall),
+                        a.summary_date = NOW(),
+                        a.isSummaryFailed = 'N',
+                        a.summary_retry_count = 0,
+                        a.summary_last_attempt = NULL
+                        {", a.summary_state = 'done', a.next_retry_at = NULL" if self.queue_state else ""}
+                        {", a.cluster_hash = COALESCE(v.cluster_hash, a.cluster_hash), "
+                         "a.canonical_article_id = v.canonical_id" if self.clusters else ""}
+                        {", a.isSummaryProvisional = v.provisional" if self.provisional else ""}
+                        {release_sql.format('a.')}
+                """, [value for i in summaries
+                      for value in (i[1], i[2], i[3], i[4], i[6], i[7], 'Y' if i[0] == 'provisional' else 'N')])
+                statements += 1
+
+                categories = [(i[1], category_id) for i in summaries for category_id in i[5]]
+                if categories:
+                    cursor.executemany("""
+                        INSERT IGNORE INTO article_categories (article_id, category_id)
+                        VALUES (%s, %s)
+                    """, categories)
+                    statements += 1
+
+            if paywalled:
+                cursor.execute(f"""
+                    UPDATE articles
+                    SET summary = NULL,
+                        `fullArticle` = NULL,
+                        hasPaywall = 'Y',
+                        summary_date = NULL,
+                        isSummaryFailed = 'Y'
+                        {", summary_state = 'dead', next_retry_at = NULL" if self.queue_state else ""}
+                        {release_sql.format('')}
+                    WHERE id IN ({', '.join(['%s'] * len(paywalled))})
+                """, paywalled)
+                statements += 1
+
+            if deferred:
+                rows = ' UNION ALL '.join(["SELECT %s AS id, %s AS delay_seconds"] * len(deferred))
+                cursor.execute(f"""
+                    UPDATE articles a
+                    JOIN ({rows}) v ON a.id = v.id
+                    SET a.claimed_by = NULL,
+                        a.claimed_until = DATE_ADD(NOW(), INTERVAL v.delay_seconds SECOND)
+                """, [value for i in deferred for value in (i[1], i[2])])
+                statements += 1
+
+            if failed:
+                rows = ' UNION ALL '.join(
+                    ["SELECT %s AS id, %s AS retry_count, %s AS delay_minutes, %s AS failed"] * len(failed))
+                params = [value for i in failed
+                          for value in (i[1], i[2], i[3], 'N' if i[0] == 'provisional' else 'Y')]
+                state_sql = ""
+                if self.queue_state:
+                    # Out of attempts, or the next attempt would land past the retry age limit
+                    state_sql = """,
+                        a.summary_state = CASE
+                            WHEN v.delay_minutes IS NULL
+                              OR DATE_ADD(NOW(), INTERVAL v.delay_minutes MINUTE)
+                                 > DATE_ADD(a.scraped_at, INTERVAL %s HOUR)
+                            THEN 'dead' ELSE 'retry' END,
+                        a.next_retry_at = DATE_ADD(NOW(), INTERVAL v.delay_minutes MINUTE)"""
+                    params.append(RETRY_MAX_AGE_HOURS)
+                cursor.execute(f"""
+                    UPDATE articles a
+                    JOIN ({rows}) v ON a.id = v.id
+                    SET a.isSummaryFailed = v.failed,
+                        a.summary_retry_count = v.retry_count,
+                        a.summary_last_attempt = NOW(){state_sql}
+                        {release_sql.format('a.')}
+                """, params)
+                statements += 1
+
+            conn.commit()
+            self.stats['statements'] += statements
+        finally:
+            cursor.close()
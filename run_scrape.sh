@@ -39,6 +39,9 @@ python3 cleanup_old_records.py
 python3 scrapers/scraper_curl.py
 python3 scrapers/scraper_marketwatch_rss.py
 
+# Wake a summarizer running in --watch mode right away instead of at its next poll
+touch "${SUMMARIZER_WAKE_FILE:-/tmp/summarizer.wake}" 2>/dev/null
+
 echo "======================================"
 echo "Deal Scrapers"
 echo "======================================"
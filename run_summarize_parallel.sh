@@ -3,13 +3,15 @@
 
 cd "$(dirname "$0")"
 
-# Lock file to prevent multiple instances
-LOCKFILE="/tmp/summarizer.lock"
+# One lock per instance name; articles are leased in the database, so differently named
+# instances (SUMMARIZER_INSTANCE=2 ./run_summarize_parallel.sh) can run side by side
+INSTANCE="${SUMMARIZER_INSTANCE:-default}"
+LOCKFILE="/tmp/summarizer.${INSTANCE}.lock"
 
 if [ -f "$LOCKFILE" ]; then
     PID=$(cat "$LOCKFILE")
     if ps -p "$PID" > /dev/null 2>&1; then
-        echo "Summarizer already running (PID: $PID). Exiting."
+        echo "Summarizer instance '$INSTANCE' already running (PID: $PID). Exiting."
         exit 0
     else
         echo "Removing stale lock file"
@@ -24,6 +26,8 @@ cleanup() {
 }
 trap cleanup EXIT
 
+export SUMMARIZER_WORKER_ID="${SUMMARIZER_WORKER_ID:-$(hostname):${INSTANCE}}"
+
 # Run parallel summarizer
 # Args: batch_size (default 76), max_workers (default 5)
 python3 summarizer_parallel.py ${1:-76} ${2:-5}
@@ -5,15 +5,19 @@ Fetch and save fullArticle for recent articles
 
 import os
 import sys
+import time
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 import env_loader  # Auto-loads .env and ~/.env_AI
+from render_service import RenderService
+from fetch_strategy import FetchStrategyTable
+from content_extractor import extract_content
+from extraction_rules import ExtractionRules
+import text_classifier
 sys.path.insert(0, os.path.dirname(__file__))
 from simhash_util import SimHash
 import mysql.connector
 from mysql.connector import Error
 import requests
-from bs4 import BeautifulSoup
-from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeout
 
 class FullTextFetcher:
     def __init__(self):
@@ -30,6 +34,23 @@ class FullTextFetcher:
             'password': os.getenv('DB_PASS')
         }
 
+        # Long-lived browser processes for JavaScript-rendered pages (started on first use)
+        self.render_service = RenderService(user_agent=self.headers['User-Agent'])
+
+        # Learned per-domain order of fetch methods (shared with the summarizer)
+        self.fetch_strategy = FetchStrategyTable()
+        try:
+            self.fetch_budget = max(int(os.getenv('ARTICLE_FETCH_BUDGET', 45)), 1)
+        except ValueError:
+            self.fetch_budget = 45
+        self.fetch_methods = {
+            'requests': self._fetch_via_requests,
+            'playwright': self.get_article_content_playwright,
+        }
+
+        # Per-domain article body selectors (extraction_rules.json)
+        self.extraction_rules = ExtractionRules.load()
+
     def connect_db(self):
         """Establish database connection"""
         try:
@@ -69,120 +90,73 @@ class FullTextFetcher:
         return non_printable / len(sample) < 0.05
 
     def get_article_content(self, url):
-        """Fetch comprehensive article content"""
+        """Fetch comprehensive article content, trying methods in the learned per-domain order
+        within one ARTICLE_FETCH_BUDGET deadline"""
+        methods, reason = self.fetch_strategy.order(url, available=tuple(self.fetch_methods))
+        if methods[0] != 'requests':
+            print(f"  → Using {methods[0]} first ({reason})")
+
+        deadline = time.time() + self.fetch_budget
+        content = ""
+        for index, method in enumerate(methods):
+            remaining = deadline - time.time()
+            if remaining < 3:
+                print(f"  ⊘ Fetch budget spent, skipping {method}")
+                break
+            if index:
+                if self.fetch_strategy.is_failing(url, method):
+                    print(f"  ⊘ Skipping {method} (recent success rate ~0%)")
+                    continue
+                print(f"  → Trying {method}...")
+            start = time.time()
+            content = self.fetch_methods[method](url, timeout=remaining)
+            elapsed = time.time() - start
+            usable = bool(content) and len(content) >= 200 and self._is_valid_text(content)
+            self.fetch_strategy.record(url, method, usable, elapsed)
+            print(f"  ⏱ {method}: {elapsed:.1f}s ({'ok' if usable else 'failed'})")
+            if usable:
+                break
+
+        return content[:50000] if content else ""
+
+    def _fetch_via_requests(self, url, timeout=20):
+        """Fetch and extract article text with a plain HTTP request"""
         try:
-            # First try with requests
-            response = requests.get(url, headers=self.headers, timeout=20)
+            response = requests.get(url, headers=self.headers, timeout=min(timeout, 20))
             response.raise_for_status()
 
             # Validate response is decompressed text, not raw compressed bytes
             if not response.text or not response.text.strip().startswith('<'):
                 print(f"  ⚠ Response may not be valid HTML (possible compression issue)")
-                print(f"  → Trying Playwright...")
-                return self.get_article_content_playwright(url)
-
-            soup = BeautifulSoup(response.content, 'html.parser')
-
-            # Remove unwanted elements
-            for element in soup(['script', 'style', 'nav', 'header', 'footer', 'aside', 'iframe']):
-                element.decompose()
-
-            content = ""
-
-            # Method 1: Look for article tag
-            article_body = soup.find('article')
-            if article_body:
-                paragraphs = article_body.find_all('p')
-                content = '\n\n'.join([p.get_text(strip=True) for p in paragraphs if len(p.get_text(strip=True)) > 50])
-
-            # Method 2: Look for main content containers
-            if not content or len(content) < 500:
-                containers = soup.find_all(['div', 'section', 'main'], class_=lambda x: x and any(
-                    term in str(x).lower() for term in ['content', 'article', 'post', 'body', 'text', 'story']
-                ))
-                for container in containers[:8]:
-                    paragraphs = container.find_all('p')
-                    if paragraphs:
-                        temp_content = '\n\n'.join([p.get_text(strip=True) for p in paragraphs if len(p.get_text(strip=True)) > 50])
-                        if len(temp_content) > len(content):
-                            content = temp_content
-                        if len(content) > 500:
-                            break
-
-            # Method 3: Get all substantial paragraphs
-            if not content or len(content) < 500:
-                all_paragraphs = soup.find_all('p')
-                good_paragraphs = [
-                    p.get_text(strip=True)
-                    for p in all_paragraphs
-                    if len(p.get_text(strip=True)) > 50
-                ]
-                content = '\n\n'.join(good_paragraphs)
-
-            # If still insufficient, try Playwright
-            if not content or len(content) < 200:
-                print(f"  → Trying Playwright...")
-                content = self.get_article_content_playwright(url)
+                return ""
+
+            content, _ = extract_content(
+                response.content, rule=self.extraction_rules.for_url(url), min_paragraph_chars=50, max_chars=50000
+            )
 
             # Validate content is readable text, not binary garbage
             if content and not self._is_valid_text(content):
-                print(f"  ⚠ Extracted content appears to be binary/corrupted, trying Playwright...")
-                content = self.get_article_content_playwright(url)
+                print(f"  ⚠ Extracted content appears to be binary/corrupted")
+                return ""
 
-            return content[:50000] if content else ""
+            return content
 
         except Exception as e:
             print(f"  ⚠ Error fetching content: {str(e)[:50]}")
-            # Try Playwright as backup
-            print(f"  → Trying Playwright backup...")
-            return self.get_article_content_playwright(url)
+            return ""
 
-    def get_article_content_playwright(self, url):
-        """Fetch article content using Playwright"""
+    def get_article_content_playwright(self, url, timeout=30):
+        """Fetch article content using the Playwright render service"""
         try:
-            with sync_playwright() as p:
-                browser = p.chromium.launch(
-                    headless=True,
-                    args=['--no-sandbox', '--disable-blink-features=AutomationControlled']
-                )
-                page = browser.new_page(
-                    user_agent=self.headers['User-Agent'],
-                    viewport={'width': 1920, 'height': 1080}
-                )
-
-                page.goto(url, wait_until='domcontentloaded', timeout=30000)
-
-                # Wait for content
-                try:
-                    page.wait_for_selector('article, p', timeout=5000)
-                except:
-                    pass
-
-                html = page.content()
-                browser.close()
-
-                soup = BeautifulSoup(html, 'html.parser')
-
-                # Remove unwanted elements
-                for element in soup(['script', 'style', 'nav', 'header', 'footer', 'aside', 'iframe']):
-                    element.decompose()
-
-                # Get article content
-                article_body = soup.find('article')
-                if article_body:
-                    paragraphs = article_body.find_all('p')
-                    content = '\n\n'.join([p.get_text(strip=True) for p in paragraphs if len(p.get_text(strip=True)) > 50])
-                    return content[:50000] if content else ""
-
-                # Fallback: get all good paragraphs
-                all_paragraphs = soup.find_all('p')
-                good_paragraphs = [
-                    p.get_text(strip=True)
-                    for p in all_paragraphs
-                    if len(p.get_text(strip=True)) > 50
-                ]
-                content = '\n\n'.join(good_paragraphs)
-                return content[:50000] if content else ""
+            html, error = self.render_service.render(url, timeout=min(timeout, 30), max_wait=timeout)
+            if not html:
+                print(f"  ⚠ Playwright error: {(error or 'empty page')[:50]}")
+                return ""
+
+            content, _ = extract_content(
+                html, rule=self.extraction_rules.for_url(url), min_paragraph_chars=50, max_chars=50000
+            )
+            return content
 
         except Exception as e:
             print(f"  ⚠ Playwright error: {str(e)[:50]}")
@@ -190,28 +164,7 @@ class FullTextFetcher:
 
     def has_paywall(self, content):
         """Detect if content indicates a paywall"""
-        if not content:
-            return False
-
-        content_lower = content.lower()
-        paywall_patterns = [
-            'subscribe to read', 'subscribers only', 'subscriber exclusive',
-            'premium content', 'create a free account', 'sign in to continue',
-            'subscription required', 'become a member', 'unlock this article',
-            'register to read', 'paywall', 'exclusive to subscribers',
-            'log in to view', 'free trial to read'
-        ]
-
-        for pattern in paywall_patterns:
-            if pattern in content_lower:
-                return True
-
-        # Very short content with account/signin keywords
-        if len(content) < 300:
-            if any(kw in content_lower for kw in ['subscribe', 'sign in', 'log in', 'member only']):
-                return True
-
-        return False
+        return text_classifier.has_paywall(content)
 
     def update_fulltext(self, article_id, fulltext):
         """Update article with fullArticle, check for duplicates, and detect paywall"""
@@ -316,6 +269,9 @@ class FullTextFetcher:
         print(f"✓ Updated {successful}/{len(articles)} articles with full text")
         print("=" * 70)
 
+        print(self.fetch_strategy.summary_line())
+        self.render_service.close()
+        self.fetch_strategy.close()
         if self.connection and self.connection.is_connected():
             self.connection.close()
 
@@ -8,6 +8,7 @@ import os
 import sys
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 import env_loader
+from render_profile import RenderProfile
 
 import mysql.connector
 from mysql.connector import Error
@@ -20,6 +21,7 @@ class BeFrugalScraper:
         self.source_id = 50  # BeFrugal source ID
         self.base_url = "https://www.befrugal.com"
         self.deals_url = "https://www.befrugal.com/deals/"
+        self.render_profile = RenderProfile()
 
         self.db_config = {
             'host': os.getenv('DB_HOST'),
@@ -309,9 +311,11 @@ class BeFrugalScraper:
 
                 page = browser.new_page(
                     user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-                    viewport={'width': 1920, 'height': 1080}
+                    viewport=self.render_profile.viewport
                 )
 
+                meter = self.render_profile.apply(page)
+
                 print(f"📡 Loading {self.deals_url}...")
                 page.goto(self.deals_url, wait_until='domcontentloaded', timeout=60000)
 
@@ -323,6 +327,7 @@ class BeFrugalScraper:
                     print("  ⚠ Deal selector timeout, continuing...")
 
                 page.wait_for_timeout(3000)
+                print(f"  📊 Page load: {RenderProfile.format_stats(meter.result())}")
 
                 print("🔍 Extracting deals from page...")
 
@@ -8,6 +8,7 @@ import os
 import sys
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 import env_loader  # Auto-loads .env and ~/.env_AI
+from structured_data import component_data
 import subprocess
 from bs4 import BeautifulSoup
 from datetime import datetime
@@ -15,7 +16,6 @@ from zoneinfo import ZoneInfo
 import mysql.connector
 from mysql.connector import Error
 import re
-import json
 import requests
 from xml.etree import ElementTree as ET
 import html as html_module
@@ -647,12 +647,8 @@ class CurlScraper:
                 return re.sub(r'\s+', ' ', html_module.unescape(t)).strip()
 
             # Full article page
-            match = re.search(
-                r'<script[^>]+data-component-name="Article"[^>]*>(.*?)</script>',
-                html, re.DOTALL
-            )
-            if match:
-                data = json.loads(match.group(1))
+            data = component_data(html, 'Article')
+            if data:
                 blurb_html = (data.get('article') or {}).get('freeBlurb', '')
                 if blurb_html:
                     text = strip_html(blurb_html)
@@ -666,12 +662,8 @@ class CurlScraper:
                     return text if len(text) > 100 else None
 
             # Briefing page
-            match = re.search(
-                r'<script[^>]+data-component-name="Briefing"[^>]*>(.*?)</script>',
-                html, re.DOTALL
-            )
-            if match:
-                data = json.loads(match.group(1))
+            data = component_data(html, 'Briefing')
+            if data:
                 briefing = data.get('briefing') or {}
                 parts = [strip_html(briefing.get('dek', '')), strip_html(data.get('teaser', ''))]
                 text = ' '.join(p for p in parts if p)
@@ -8,6 +8,7 @@ import os
 import sys
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 import env_loader
+from render_profile import RenderProfile
 
 import mysql.connector
 from mysql.connector import Error
@@ -35,6 +36,7 @@ class FreebieGuyScraper:
         self.source_id = 51  # freebie Guy source ID
         self.base_url = "https://thefreebieguy.com"
         self.deals_url = "https://thefreebieguy.com/"
+        self.render_profile = RenderProfile()
 
         self.db_config = {
             'host': os.getenv('DB_HOST'),
@@ -348,9 +350,11 @@ class FreebieGuyScraper:
 
                 page = browser.new_page(
                     user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-                    viewport={'width': 1920, 'height': 1080}
+                    viewport=self.render_profile.viewport
                 )
 
+                meter = self.render_profile.apply(page)
+
                 logger.info(f"Loading {self.deals_url}...")
                 page.goto(self.deals_url, wait_until='domcontentloaded', timeout=60000)
 
@@ -362,6 +366,7 @@ class FreebieGuyScraper:
                     logger.warning("Article selector timeout, continuing...")
 
                 page.wait_for_timeout(3000)
+                logger.info(f"Page load: {RenderProfile.format_stats(meter.result())}")
 
                 logger.info("Extracting deals from page...")
 
@@ -9,6 +9,7 @@ import os
 import sys
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 import env_loader  # Auto-loads .env and ~/.env_AI
+from render_profile import RenderProfile
 
 import mysql.connector
 from mysql.connector import Error
@@ -37,6 +38,7 @@ class SlickdealsScraper:
         self.source_id = 49  # Slickdeals source ID in sources table
         self.source_name = "Slickdeals"
         self.base_url = "https://www.slickdeals.net"
+        self.render_profile = RenderProfile()
 
         self.db_config = {
             'host': os.getenv('DB_HOST'),
@@ -552,9 +554,11 @@ class SlickdealsScraper:
 
                 page = browser.new_page(
                     user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                    viewport={'width': 1920, 'height': 1080}
+                    viewport=self.render_profile.viewport
                 )
 
+                meter = self.render_profile.apply(page)
+
                 logger.info(f"Loading {self.base_url}...")
                 page.goto(self.base_url, wait_until='domcontentloaded', timeout=60000)
 
@@ -570,6 +574,7 @@ class SlickdealsScraper:
 
                 # Allow dynamic content to finish loading
                 page.wait_for_timeout(3000)
+                logger.info(f"Page load: {RenderProfile.format_stats(meter.result())}")
 
                 # Scrape main deal grid
                 main_deals = self.scrape_main_deals(page)
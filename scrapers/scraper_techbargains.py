@@ -8,6 +8,7 @@ import os
 import sys
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 import env_loader
+from render_profile import RenderProfile
 
 import mysql.connector
 from mysql.connector import Error
@@ -22,6 +23,7 @@ class TechBargainsScraper:
         self.source_id = 52  # Tech Bargains source ID
         self.base_url = "https://www.techbargains.com"
         self.deals_url = "https://www.techbargains.com/"
+        self.render_profile = RenderProfile()
 
         self.db_config = {
             'host': os.getenv('DB_HOST'),
@@ -317,9 +319,11 @@ class TechBargainsScraper:
 
                 context = browser.new_context(
                     user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                    viewport={'width': 1920, 'height': 1080}
+                    viewport=self.render_profile.viewport
                 )
 
+                meter = self.render_profile.apply(context)
+
                 page = context.new_page()
 
                 print(f"📡 Loading {self.deals_url}...")
@@ -344,6 +348,7 @@ class TechBargainsScraper:
                         print("  ⚠ Deal selector timeout, continuing...")
 
                     page.wait_for_timeout(3000)
+                    print(f"  📊 Page load: {RenderProfile.format_stats(meter.result())}")
 
                     print("🔍 Extracting deals from page...")
 
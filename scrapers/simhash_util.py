@@ -2,14 +2,22 @@
 SimHash utility for content fingerprinting and duplicate detection
 """
 
+import re
 import hashlib
 
 
+WORD_RE = re.compile(r"[a-z0-9]+(?:'[a-z]+)?")
+
+
 class SimHash:
     """Simple SimHash implementation for near-duplicate detection"""
 
-    def __init__(self, text, hashbits=64):
+    def __init__(self, text, hashbits=64, shingle_size=None):
         self.hashbits = hashbits
+        # None: whitespace words of 3+ chars (the fingerprint stored in articles.content_hash);
+        # N: overlapping N-word shingles of normalized words, which keep word order and so
+        # separate different stories on the same topic better
+        self.shingle_size = shingle_size
         self.hash = self.compute(text)
 
     def compute(self, text):
@@ -17,8 +25,11 @@ class SimHash:
         if not text:
             return 0
 
-        # Tokenize into features (words 3+ chars)
-        tokens = [w.lower() for w in text.split() if len(w) >= 3]
+        if self.shingle_size:
+            tokens = self.shingles(text, self.shingle_size)
+        else:
+            # Tokenize into features (words 3+ chars)
+            tokens = [w.lower() for w in text.split() if len(w) >= 3]
 
         if not tokens:
             return 0
@@ -47,6 +58,14 @@ class SimHash:
 
         return fingerprint
 
+    @staticmethod
+    def shingles(text, size):
+        """Overlapping `size`-word shingles of lowercased words (punctuation dropped)"""
+        words = WORD_RE.findall(text.lower())
+        if len(words) <= size:
+            return [' '.join(words)] if words else []
+        return [' '.join(words[i:i + size]) for i in range(len(words) - size + 1)]
+
     def distance(self, other):
         """Calculate Hamming distance between two hashes"""
         x = (self.hash ^ other.hash) & ((1 << self.hashbits) - 1)
@@ -1,7 +1,11 @@
 #!/usr/bin/env python3
 """
 Daily Reset Script for Failed Article Summary Retries
-Resets summary_retry_count to 0 for all failed articles to allow fresh retry attempts
+Gives failed articles fresh retry attempts according to SUMMARY_RETRY_RESET_POLICY:
+  requeue (default) - recent articles that ran out of attempts go back on the queue
+                      (summary_state = 'retry', due now); needs sql/002_summary_queue_state.sql
+  legacy            - reset summary_retry_count for every failed article (old mass UPDATE)
+  off               - do nothing
 Runs daily at midnight via cron
 """
 
@@ -24,12 +28,34 @@ class RetryCountResetter:
             'user': os.getenv('DB_USER'),
             'password': os.getenv('DB_PASS')
         }
+        self.policy = os.getenv('SUMMARY_RETRY_RESET_POLICY', 'requeue').strip().lower()
+        try:
+            self.requeue_hours = max(int(os.getenv('SUMMARY_RETRY_RESET_HOURS', 24)), 1)
+        except ValueError:
+            self.requeue_hours = 24
 
     def log(self, message):
         """Print timestamped log message"""
         timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         print(f"[{timestamp}] {message}")
 
+    def requeue_recent(self, connection, cursor):
+        """Put recent articles that ran out of attempts back on the queue (index range on summary_state)"""
+        cursor.execute("""
+            UPDATE articles
+            SET summary_state = 'retry',
+                next_retry_at = NOW(),
+                summary_retry_count = 0,
+                summary_last_attempt = NULL
+            WHERE summary_state = 'dead'
+              AND isSummaryFailed = 'Y'
+              AND (hasPaywall IS NULL OR hasPaywall != 'Y')
+              AND scraped_at >= DATE_SUB(NOW(), INTERVAL %s HOUR)
+        """, (self.requeue_hours,))
+        connection.commit()
+        self.log(f"Requeued {cursor.rowcount} failed articles from the last {self.requeue_hours} hours")
+        return True
+
     def connect_db(self):
         """Establish database connection"""
         try:
@@ -42,7 +68,14 @@ class RetryCountResetter:
             return None
 
     def reset_retry_counts(self):
-        """Reset retry counts for all failed articles"""
+        """Apply the configured reset policy"""
+        if self.policy == 'off':
+            self.log("SUMMARY_RETRY_RESET_POLICY=off. Nothing to do.")
+            return True
+        if self.policy not in ('requeue', 'legacy'):
+            self.log(f"Unknown SUMMARY_RETRY_RESET_POLICY '{self.policy}' (expected requeue, legacy or off)")
+            return False
+
         connection = None
 
         try:
@@ -56,6 +89,13 @@ class RetryCountResetter:
             # Set timezone to PST
             cursor.execute("SET time_zone = '-08:00'")
 
+            if self.policy == 'requeue':
+                cursor.execute("SHOW COLUMNS FROM articles LIKE 'next_retry_at'")
+                if cursor.fetchone() is not None:
+                    return self.requeue_recent(connection, cursor)
+                self.log("summary_state/next_retry_at missing (apply sql/002_summary_queue_state.sql); "
+                         "falling back to the legacy reset")
+
             # First, count how many articles will be reset
             count_query = """
                 SELECT COUNT(*) as count
@@ -0,0 +1,8 @@
+-- Lease-based claiming for summarizer processes (article_queue.py)
+-- claimed_by: worker id (host:pid or SUMMARIZER_WORKER_ID) holding the article
+-- claimed_until: lease expiry; an expired lease is free to claim again
+
+ALTER TABLE articles
+    ADD COLUMN claimed_by VARCHAR(64) NULL DEFAULT NULL,
+    ADD COLUMN claimed_until DATETIME NULL DEFAULT NULL,
+    ADD INDEX idx_articles_claimed_by (claimed_by);
@@ -0,0 +1,40 @@
+-- Explicit summarization queue state (article_queue.py)
+-- summary_state: pending (never attempted), retry (failed, due at next_retry_at),
+--                done (summarized), dead (out of attempts, too old, or paywalled)
+-- The claim query becomes a range scan on idx_articles_summary_queue instead of
+-- evaluating the retry-window OR/CASE predicate over every recent article.
+
+ALTER TABLE articles
+    ADD COLUMN summary_state ENUM('pending', 'retry', 'done', 'dead') NOT NULL DEFAULT 'pending',
+    ADD COLUMN next_retry_at DATETIME NULL DEFAULT NULL,
+    ADD INDEX idx_articles_summary_queue (summary_state, next_retry_at, scraped_at, source_id);
+
+SET time_zone = '-08:00';
+
+-- Backfill from the legacy columns (same schedule as article_queue.RETRY_BACKOFF_HOURS)
+UPDATE articles
+SET summary_state = 'done'
+WHERE summary IS NOT NULL AND summary != '';
+
+UPDATE articles
+SET summary_state = 'dead'
+WHERE summary_state = 'pending'
+  AND (summary_retry_count >= 5
+       OR (isSummaryFailed = 'Y' AND scraped_at < DATE_SUB(NOW(), INTERVAL 1 DAY)));
+
+UPDATE articles
+SET summary_state = 'retry',
+    next_retry_at = CASE summary_retry_count
+        WHEN 1 THEN DATE_ADD(summary_last_attempt, INTERVAL 1 HOUR)
+        WHEN 2 THEN DATE_ADD(summary_last_attempt, INTERVAL 6 HOUR)
+        WHEN 3 THEN DATE_ADD(summary_last_attempt, INTERVAL 12 HOUR)
+        ELSE DATE_ADD(summary_last_attempt, INTERVAL 24 HOUR)
+    END
+WHERE summary_state = 'pending'
+  AND isSummaryFailed = 'Y'
+  AND summary_retry_count BETWEEN 1 AND 4;
+
+-- Failed rows the legacy query could never pick again (retry count reset to 0)
+UPDATE articles
+SET summary_state = 'dead'
+WHERE summary_state = 'pending' AND isSummaryFailed = 'Y';
@@ -0,0 +1,12 @@
+-- Priority-weighted summarization scheduling (article_queue.py, requires 002_summary_queue_state.sql)
+-- sources.priority_weight: editorial weight per source (1.00 = neutral)
+-- articles.priority_score: claim order, in minutes since the epoch of scraped_at plus bonuses for
+--   source weight and readership (users_sources, or every active user for base sources) minus a
+--   penalty per failed attempt; maintained by ArticleQueue.refresh_priorities()
+
+ALTER TABLE sources
+    ADD COLUMN priority_weight DECIMAL(5,2) NOT NULL DEFAULT 1.00;
+
+ALTER TABLE articles
+    ADD COLUMN priority_score INT NOT NULL DEFAULT 0,
+    ADD INDEX idx_articles_summary_priority (summary_state, priority_score);
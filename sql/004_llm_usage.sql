@@ -0,0 +1,25 @@
+-- Provider token usage per summarizer run (llm_usage.py)
+-- One row per (run, flush period, provider, model, source, purpose); purpose is summary,
+-- categorize, last_resort or other. input_tokens includes cached_tokens; estimated_calls
+-- counts calls whose provider returned no usage block (tokens estimated from text length).
+-- cost_usd is priced from llm_usage.MODEL_PRICES at write time (NULL for unknown models).
+
+CREATE TABLE IF NOT EXISTS llm_usage (
+    id BIGINT UNSIGNED NOT NULL AUTO_INCREMENT PRIMARY KEY,
+    run_id VARCHAR(64) NOT NULL,
+    period_start DATETIME NOT NULL,
+    period_end DATETIME NOT NULL,
+    provider VARCHAR(32) NOT NULL,
+    model VARCHAR(64) NOT NULL,
+    source_id INT NULL DEFAULT NULL,
+    purpose VARCHAR(16) NOT NULL,
+    calls INT UNSIGNED NOT NULL DEFAULT 0,
+    estimated_calls INT UNSIGNED NOT NULL DEFAULT 0,
+    input_tokens BIGINT UNSIGNED NOT NULL DEFAULT 0,
+    output_tokens BIGINT UNSIGNED NOT NULL DEFAULT 0,
+    cached_tokens BIGINT UNSIGNED NOT NULL DEFAULT 0,
+    latency_ms BIGINT UNSIGNED NOT NULL DEFAULT 0,
+    cost_usd DECIMAL(12,6) NULL DEFAULT NULL,
+    INDEX idx_llm_usage_period (period_end, provider),
+    INDEX idx_llm_usage_source (source_id, period_end)
+);
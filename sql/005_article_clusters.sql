@@ -0,0 +1,11 @@
+-- Near-duplicate clustering of summarized articles (article_clusters.py)
+-- cluster_hash: 64-bit SimHash over 3-word shingles of the extracted text (separate from
+--   content_hash, the word-level SimHash fetch_fulltext.py uses to drop exact reposts)
+-- canonical_article_id: the article whose summary and categories this one copied;
+--   NULL for articles summarized on their own (cluster representatives)
+
+ALTER TABLE articles
+    ADD COLUMN cluster_hash BIGINT UNSIGNED NULL DEFAULT NULL,
+    ADD COLUMN canonical_article_id INT NULL DEFAULT NULL,
+    ADD INDEX idx_articles_canonical (canonical_article_id),
+    ADD INDEX idx_articles_summary_date (summary_date);
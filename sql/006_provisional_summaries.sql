@@ -0,0 +1,10 @@
+-- Provisional (extractive) summaries written when every AI provider fails (extractive_summarizer.py,
+--   requires 002_summary_queue_state.sql; without it no provisional summaries are written)
+-- isSummaryProvisional = 'Y': the summary is a local sentence extract shown until an LLM
+--   summary replaces it. The article stays in the summarization queue as a retry
+--   (summary_state/next_retry_at from 002_summary_queue_state.sql) with isSummaryFailed = 'N',
+--   so error reports count it as summarized, and the LLM result replaces both the summary
+--   and the default category.
+
+ALTER TABLE articles
+    ADD COLUMN isSummaryProvisional ENUM('Y', 'N') NOT NULL DEFAULT 'N';
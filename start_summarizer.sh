@@ -21,7 +21,7 @@ LOG_DIR="${LOG_DIR:-/var/log/scraper}"
 
 LOG_FILE="$LOG_DIR/summarize_$(date +%Y%m%d%H%M%S).log"
 
-# Run summarizer in background
+# Run summarizer in background (articles are leased per process, so this can overlap a cron run)
 python3 summarizer_parallel.py 50 5 > "$LOG_FILE" 2>&1 &
 
 # Output the log filename for API response
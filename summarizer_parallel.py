@@ -8,17 +8,36 @@ With Playwright backup for JavaScript-rendered pages
 import os
 import sys
 import requests
-from bs4 import BeautifulSoup
 import mysql.connector
 from mysql.connector import Error
 # from google import genai  # Gemini disabled
 # from google.genai import types
 import env_loader  # Auto-loads .env and ~/.env_AI
+from category_index import CategoryIndex
+from provider_router import ProviderRouter
+from llm_cache import LLMCache
+from content_compressor import ContentCompressor
+from freshness_policy import FreshnessPolicy
+from render_service import RenderService
+from fetch_strategy import FetchStrategyTable
+from content_extractor import extract_content
+from extraction_rules import ExtractionRules
+from access_gate import AccessGate, markup_signals
+from result_writer import ResultWriter
+from article_queue import ArticleQueue, retry_delay_minutes
+from metrics import Metrics
+from llm_usage import UsageLedger, parse_usage
+from rate_limiter import RateLimiter, keys_from_env, KEY_ENV_PREFIXES
+from article_clusters import ArticleClusters
+from extractive_summarizer import ExtractiveSummarizer
+import text_classifier
 import time
 import json
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from threading import Lock
-from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeout
+import signal
+import argparse
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait, FIRST_COMPLETED
+from concurrent.futures import TimeoutError as FutureTimeout
+from threading import Lock, Event, local
 
 class ParallelSummarizer:
     def __init__(self):
@@ -47,11 +66,13 @@ class ParallelSummarizer:
         provider_order = os.getenv('AI_PROVIDER_ORDER', 'anthropic,minai,deepseek').split(',')
         self.provider_order = [p.strip() for p in provider_order]
 
-        # API Keys configuration
-        self.minai_key = os.getenv('MINAI_API_KEY')
-        self.anthropic_key = os.getenv('ANTHROPIC_API_KEY')
-        self.deepseek_key = os.getenv('DEEPSEEK_API_KEY')
-        self.openai_key = os.getenv('OPENAI_API_KEY')
+        # API Keys configuration: <PROVIDER>_API_KEY, or several as <PROVIDER>_API_KEYS="key:weight,..."
+        self.api_keys = {provider: keys_from_env(provider) for provider in KEY_ENV_PREFIXES}
+        first_key = lambda provider: self.api_keys[provider][0].secret if self.api_keys[provider] else None
+        self.minai_key = first_key('minai')
+        self.anthropic_key = first_key('anthropic')
+        self.deepseek_key = first_key('deepseek')
+        self.openai_key = first_key('openai')
 
         # Model configuration from environment
         self.anthropic_model = os.getenv('ANTHROPIC_MODEL', 'claude-sonnet-4-6')
@@ -80,10 +101,101 @@ class ParallelSummarizer:
             sys.exit(1)
 
         self.connection = None
-        self.categories_cache = {}
-        self.db_lock = Lock()
+        self.category_index = CategoryIndex([])
+        # Per-stage timings, provider latency histograms and outcome counters
+        self.metrics = Metrics('summarizer')
+        # All worker writes go through one batching writer thread and connection
+        self.result_writer = ResultWriter(self.db_config, metrics=self.metrics)
+        # Lease-based claiming so several summarizer processes can share the backlog
+        self.article_queue = None
         self.gemini_rate_limited = False
 
+        # Health-aware routing across the configured providers (shared by all workers)
+        configured = [p for p in self.provider_order if self._provider_key(p)]
+        log_dir = os.getenv('LOG_DIR', '/var/log/scraper')
+        status_file = os.getenv('AI_ROUTER_STATUS_FILE', os.path.join(log_dir, 'provider_status.json'))
+        self.router = ProviderRouter(configured, status_file=status_file)
+
+        # Per-key RPM/TPM buckets shared with other summarizer processes; calls wait for
+        # capacity (and rotate keys by weight) rather than failing over on a 429. Every provider
+        # with a key gets buckets, routed or not (the last-resort summary always uses Anthropic)
+        self.rate_limiter = RateLimiter({p: keys for p, keys in self.api_keys.items() if keys})
+        for provider in self.rate_limiter.keys:
+            if self.rate_limiter.key_count(provider) > 1:
+                print(f"✓ {self.PROVIDER_LABELS.get(provider, provider)}: "
+                      f"{self.rate_limiter.key_count(provider)} API keys in weighted rotation")
+
+        # Opt-in hedging: race the next healthy provider once the primary passes its p90 latency
+        self.hedge_enabled = os.getenv('AI_HEDGE_ENABLED', '0') == '1'
+        self.hedge_budget = self._get_positive_int_env('AI_HEDGE_MAX_PER_RUN', 10)
+        # The budget refills every window, so a long-running watch process keeps hedging
+        self.hedge_window = self._get_positive_int_env('AI_HEDGE_WINDOW_SECONDS', 3600)
+        self.hedge_min_delay = self._get_positive_int_env('AI_HEDGE_MIN_DELAY', 2)
+        self.hedge_executor = None
+        self.hedge_lock = Lock()
+        self.hedge_stats = {'fired': 0, 'won': 0, 'lost': 0}
+        self.hedge_window_start = time.time()
+        self.hedge_window_fired = 0
+        if self.hedge_enabled:
+            print(f"✓ Request hedging enabled (budget {self.hedge_budget} per run, "
+                  f"refilled every {self.hedge_window}s)")
+
+        # 429s re-queued on the rate limiter before the provider is paused and skipped
+        self.rate_limit_retries = self._get_positive_int_env('AI_RATE_LIMIT_RETRIES', 2)
+
+        # Per-thread HTTP sessions so provider connections are reused across articles
+        self.http_sessions = local()
+
+        # Token usage per provider/source/purpose; workers keep the article's source and the
+        # call purpose in a per-thread context (copied onto hedge threads)
+        self.usage = UsageLedger()
+        self.usage_context = local()
+
+        # Persistent response cache consulted before any provider call
+        self.llm_cache = LLMCache()
+
+        # Pre-LLM compression of article text to a per-provider token budget
+        self.compressor = ContentCompressor()
+        self.stats_lock = Lock()
+        self.compression_stats = {'articles': 0, 'input_tokens': 0, 'output_tokens': 0}
+
+        # Reuse a good, recent fullArticle instead of refetching the page
+        self.freshness = FreshnessPolicy()
+        self.fetches_skipped = 0
+
+        # Long-lived browser processes for JavaScript-rendered pages (started on first use)
+        self.render_service = RenderService(user_agent=self.headers['User-Agent'])
+
+        # Learned per-domain order of fetch methods (shared with the full-text fetcher)
+        self.fetch_strategy = FetchStrategyTable()
+        self.fetch_budget = self._get_positive_int_env('ARTICLE_FETCH_BUDGET', 45)
+        self.fetch_methods = {
+            'requests': self._fetch_via_requests,
+            'playwright': self.get_article_content_playwright,
+            'google_cache': self.get_article_from_google_cache,
+        }
+
+        # Per-domain article body selectors (extraction_rules.json) and the confidence floor for direct fetches
+        self.extraction_rules = ExtractionRules.load()
+        try:
+            self.extract_min_confidence = float(os.getenv('EXTRACT_MIN_CONFIDENCE', 0.15))
+        except ValueError:
+            self.extract_min_confidence = 0.15
+
+        # Paywall/consent gate applied before any provider call; fetch methods leave the
+        # page's markup signals in a per-thread context for it
+        self.access_gate = AccessGate()
+        self.fetch_context = local()
+
+        # Near-duplicate wire copies reuse one representative's summary and categories
+        self.article_clusters = ArticleClusters()
+
+        # Local sentence-extraction tier used when every provider fails; its summaries are
+        # stored as provisional and stay queued for an LLM retry
+        self.extractive = ExtractiveSummarizer(word_limit=self.summary_word_limit)
+        self.provisional_count = 0
+        self.gate_stats = {'paywall': 0, 'consent': 0, 'llm_calls_saved': 0}
+
     def _get_positive_int_env(self, name, default):
         """Read a positive integer env var, falling back to default when invalid."""
         raw_value = os.getenv(name)
@@ -95,6 +207,39 @@ class ParallelSummarizer:
         except ValueError:
             return default
 
+    PROVIDER_LABELS = {
+        'anthropic': "Claude",
+        'minai': "1min.ai (GPT-4o-mini)",
+        'deepseek': "DeepSeek",
+        'openai': "OpenAI",
+    }
+
+    # Header carrying each provider's API key, filled from the rate limiter's lease
+    PROVIDER_AUTH = {
+        'anthropic': ('x-api-key', '{}'),
+        'minai': ('API-KEY', '{}'),
+        'deepseek': ('Authorization', 'Bearer {}'),
+        'openai': ('Authorization', 'Bearer {}'),
+    }
+
+    def _provider_key(self, provider):
+        """API key for a provider name, or None if it is not configured"""
+        return {
+            'anthropic': self.anthropic_key,
+            'minai': self.minai_key,
+            'deepseek': self.deepseek_key,
+            'openai': self.openai_key,
+        }.get(provider)
+
+    def _provider_model(self, provider):
+        """Model name used for a provider (part of the response cache key)"""
+        return {
+            'anthropic': self.anthropic_model,
+            'minai': 'gpt-4o-mini',
+            'deepseek': self.deepseek_model,
+            'openai': self.openai_model,
+        }.get(provider, provider)
+
     def _trim_summary_to_word_limit(self, summary):
         summary = ' '.join((summary or '').split())
         words = summary.split()
@@ -120,432 +265,393 @@ class ParallelSummarizer:
             return False
 
     def load_categories(self):
-        """Load categories into cache (level 1 = parent, level 2 = child)"""
-        cursor = self.connection.cursor(dictionary=True)
-        cursor.execute("SELECT id, name, description, level, parentID FROM categories")
-        for row in cursor.fetchall():
-            self.categories_cache[row['name']] = row
-        cursor.close()
-        level2_count = sum(1 for c in self.categories_cache.values() if c.get('level') == 2)
-        print(f"✓ Loaded {len(self.categories_cache)} categories ({level2_count} assignable)")
+        """Build the category index (level 1 = parent, level 2 = child)"""
+        self.category_index = CategoryIndex.load(self.connection)
+        print(f"✓ Loaded {len(self.category_index)} categories ({self.category_index.assignable_count} assignable)")
 
     def get_unsummarized_articles(self, limit=10):
-        """Get articles that need summaries, including failed articles eligible for retry with exponential backoff (max 5 attempts)"""
-        cursor = self.connection.cursor(dictionary=True)
-        cursor.execute("""
-            SELECT a.id, a.title, a.url, a.fullArticle, a.summary_retry_count, s.mainCategory, s.name as source_name
-            FROM articles a
-            LEFT JOIN sources s ON a.source_id = s.id
-            WHERE (a.summary IS NULL OR a.summary = '')
-            AND (s.isActive = 'Y' OR s.id IS NULL)
-            AND (a.summary_retry_count IS NULL OR a.summary_retry_count < 5)
-            AND (
-                -- Never attempted or not marked as failed
-                (a.isSummaryFailed IS NULL OR a.isSummaryFailed != 'Y')
-                OR
-                -- Failed but eligible for retry (only if article is less than 1 day old, max 5 attempts)
-                (a.isSummaryFailed = 'Y'
-                    AND a.scraped_at >= DATE_SUB(NOW(), INTERVAL 1 DAY)
-                    AND (
-                        -- Retry 1: after 1 hour (retry_count = 1)
-                        (a.summary_retry_count = 1 AND a.summary_last_attempt < DATE_SUB(NOW(), INTERVAL 1 HOUR))
-                        OR
-                        -- Retry 2: after 6 hours (retry_count = 2)
-                        (a.summary_retry_count = 2 AND a.summary_last_attempt < DATE_SUB(NOW(), INTERVAL 6 HOUR))
-                        OR
-                        -- Retry 3: after 12 hours (retry_count = 3)
-                        (a.summary_retry_count = 3 AND a.summary_last_attempt < DATE_SUB(NOW(), INTERVAL 12 HOUR))
-                        OR
-                        -- Retry 4: after 24 hours (retry_count = 4, final attempt)
-                        (a.summary_retry_count = 4 AND a.summary_last_attempt < DATE_SUB(NOW(), INTERVAL 24 HOUR))
-                    )
-                )
-            )
-            ORDER BY
-                -- First-time articles first (never failed), retries last
-                CASE WHEN (a.isSummaryFailed IS NULL OR a.isSummaryFailed != 'Y') THEN 0 ELSE 1 END,
-                -- Within each group, newest articles first
-                a.scraped_at DESC
-            LIMIT %s
-        """, (limit,))
-        articles = cursor.fetchall()
-        cursor.close()
-        return articles
-
-    def get_article_from_google_cache(self, url):
+        """Claim articles that need summaries, including failed articles eligible for retry with exponential backoff (max 5 attempts)"""
+        if self.article_queue is None:
+            self.article_queue = ArticleQueue(self.connection)
+            self.result_writer.queue_state = self.article_queue.state_enabled
+            self.result_writer.claims = self.article_queue.claims_enabled
+            self.result_writer.worker_id = self.article_queue.worker_id
+            self.result_writer.provisional = self.article_queue.provisional_enabled
+        self.article_clusters.refresh(self.connection)
+        self.result_writer.clusters = bool(self.article_clusters.columns_enabled)
+        return self.article_queue.claim(limit)
+
+    def get_article_from_google_cache(self, url, timeout=20):
         """Fetch article content from Google Cache as last resort"""
         try:
             # Google Cache URL format
             cache_url = f"https://webcache.googleusercontent.com/search?q=cache:{url}"
 
-            response = requests.get(cache_url, headers=self.headers, timeout=20)
+            response = requests.get(cache_url, headers=self.headers, timeout=min(timeout, 20))
             response.raise_for_status()
 
-            soup = BeautifulSoup(response.content, 'html.parser')
-
-            # Remove script, style, and navigation elements
-            for element in soup(['script', 'style', 'nav', 'header', 'footer', 'aside']):
-                element.decompose()
-
-            content = ""
-
-            # Method 1: Look for article tag
-            article_body = soup.find('article')
-            if article_body:
-                paragraphs = article_body.find_all('p')
-                content = '\n\n'.join([p.get_text(strip=True) for p in paragraphs[:40]])
-
-            # Method 2: Look for main content containers
-            if not content or len(content) < 500:
-                containers = soup.find_all(['div', 'section', 'main'], class_=lambda x: x and any(
-                    term in str(x).lower() for term in ['content', 'article', 'post', 'body', 'text', 'story']
-                ))
-                for container in containers[:8]:
-                    paragraphs = container.find_all('p')
-                    if paragraphs:
-                        content = '\n\n'.join([p.get_text(strip=True) for p in paragraphs[:40]])
-                        if len(content) > 500:
-                            break
-
-            # Method 3: Get all substantial paragraphs
-            if not content or len(content) < 500:
-                all_paragraphs = soup.find_all('p')
-                good_paragraphs = [
-                    p.get_text(strip=True)
-                    for p in all_paragraphs
-                    if len(p.get_text(strip=True)) > 50
-                ]
-                content = '\n\n'.join(good_paragraphs[:40])
-
-            return content[:10000] if content else ""
+            with self.metrics.timer('extract', method='google_cache'):
+                content, _ = extract_content(response.content, max_paragraphs=40, max_chars=10000)
+            return content
 
         except Exception as e:
             return ""
 
-    def get_article_content_playwright(self, url):
-        """Fetch article content using Playwright (for JavaScript-rendered pages)"""
+    def get_article_content_playwright(self, url, timeout=60):
+        """Fetch article content using the Playwright render service (for JavaScript-rendered pages).
+        timeout bounds the whole render, leaving 5s of it for the content selector wait."""
         try:
-            with sync_playwright() as p:
-                browser = p.chromium.launch(
-                    headless=True,
-                    args=['--no-sandbox', '--disable-blink-features=AutomationControlled']
-                )
-                page = browser.new_page(
-                    user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                    viewport={'width': 1920, 'height': 1080}
-                )
+            with self.metrics.timer('render') as labels:
+                html, error = self.render_service.render(url, timeout=max(timeout - 5, 1), max_wait=timeout)
+                labels['outcome'] = 'ok' if html else (error or 'empty')[:20]
+            if error == 'timeout':
+                print(f"  ⚠ Playwright timeout")
+                return ""
+            if not html:
+                print(f"  ⚠ Playwright error: {(error or 'empty page')[:50]}")
+                return ""
 
-                # Set a longer timeout and go to the page
-                page.goto(url, wait_until='domcontentloaded', timeout=60000)
+            self._note_markup(html)
+            with self.metrics.timer('extract', method='playwright'):
+                content, _ = extract_content(
+                    html, rule=self.extraction_rules.for_url(url), max_paragraphs=40, max_chars=10000
+                )
+            return content
 
-                # Wait for content to load (or timeout after 5 seconds)
-                try:
-                    page.wait_for_selector('article, p', timeout=5000)
-                except:
-                    pass  # Continue even if selector not found
-
-                # Get the page content
-                html = page.content()
-                browser.close()
-
-                # Parse with BeautifulSoup
-                soup = BeautifulSoup(html, 'html.parser')
-
-                # Remove script, style, and navigation elements
-                for element in soup(['script', 'style', 'nav', 'header', 'footer', 'aside']):
-                    element.decompose()
-
-                content = ""
-
-                # Method 1: Look for article tag
-                article_body = soup.find('article')
-                if article_body:
-                    paragraphs = article_body.find_all('p')
-                    content = '\n\n'.join([p.get_text(strip=True) for p in paragraphs[:40]])
-
-                # Method 2: Look for main content containers
-                if not content or len(content) < 500:
-                    containers = soup.find_all(['div', 'section', 'main'], class_=lambda x: x and any(
-                        term in str(x).lower() for term in ['content', 'article', 'post', 'body', 'text', 'story']
-                    ))
-                    for container in containers[:8]:
-                        paragraphs = container.find_all('p')
-                        if paragraphs:
-                            content = '\n\n'.join([p.get_text(strip=True) for p in paragraphs[:40]])
-                            if len(content) > 500:
-                                break
-
-                # Method 3: Get all substantial paragraphs
-                if not content or len(content) < 500:
-                    all_paragraphs = soup.find_all('p')
-                    good_paragraphs = [
-                        p.get_text(strip=True)
-                        for p in all_paragraphs
-                        if len(p.get_text(strip=True)) > 50
-                    ]
-                    content = '\n\n'.join(good_paragraphs[:40])
-
-                return content[:10000] if content else ""
-
-        except PlaywrightTimeout:
-            print(f"  ⚠ Playwright timeout")
-            return ""
         except Exception as e:
             print(f"  ⚠ Playwright error: {str(e)[:50]}")
             return ""
 
-    def get_article_content(self, url):
-        """Fetch comprehensive article content for detailed summarization"""
-        # Force Playwright for JavaScript-heavy sites
-        if 'yahoo.com' in url.lower():
-            print(f"  → Using Playwright for JavaScript-heavy site")
-            return self.get_article_content_playwright(url)
-
-        try:
-            response = requests.get(url, headers=self.headers, timeout=20)
-            response.raise_for_status()
-
-            soup = BeautifulSoup(response.content, 'html.parser')
-
-            # Remove script, style, and navigation elements
-            for element in soup(['script', 'style', 'nav', 'header', 'footer', 'aside']):
-                element.decompose()
+    FETCH_METHOD_LABELS = {
+        'requests': "direct fetch",
+        'playwright': "Playwright",
+        'google_cache': "Google Cache",
+    }
 
-            content = ""
+    # Smallest remaining budget (seconds) worth starting another fetch method with
+    MIN_FETCH_SLICE = 3
 
-            # Method 1a: CNBC-specific selectors (high priority for CNBC articles)
-            if 'cnbc.com' in url.lower():
-                cnbc_selectors = [
-                    'div.ArticleBody-articleBody',
-                    'div.RenderKeyPoints-list',
-                    'div.group',
-                    'div[class*="ArticleBody"]',
-                    'div[class*="article-body"]',
-                ]
-                for selector in cnbc_selectors:
-                    elements = soup.select(selector)
-                    if elements:
-                        paragraphs = []
-                        for elem in elements:
-                            paragraphs.extend(elem.find_all('p'))
-                        if paragraphs:
-                            content = '\n\n'.join([p.get_text(strip=True) for p in paragraphs[:40]])
-                            if len(content) > 500:
-                                print(f"  → Using CNBC selector: {selector}")
-                                break
-
-            # Method 1b: Yahoo Finance-specific selectors
-            if not content and 'yahoo.com' in url.lower():
-                yahoo_selectors = [
-                    'div.caas-body',
-                    'div.article-body',
-                    'div[class*="caas-body"]',
-                    'div[class*="article-wrap"]',
-                    'article div.body',
-                ]
-                for selector in yahoo_selectors:
-                    elements = soup.select(selector)
-                    if elements:
-                        paragraphs = []
-                        for elem in elements:
-                            paragraphs.extend(elem.find_all('p'))
-                        if paragraphs:
-                            content = '\n\n'.join([p.get_text(strip=True) for p in paragraphs[:40]])
-                            if len(content) > 500:
-                                print(f"  → Using Yahoo Finance selector: {selector}")
-                                break
-
-            # Method 2: Look for article tag (most reliable)
-            if not content or len(content) < 500:
-                article_body = soup.find('article')
-                if article_body:
-                    paragraphs = article_body.find_all('p')
-                    content = '\n\n'.join([p.get_text(strip=True) for p in paragraphs[:40]])
-
-            # Method 4: Look for main content containers
-            if not content or len(content) < 500:
-                containers = soup.find_all(['div', 'section', 'main'], class_=lambda x: x and any(
-                    term in str(x).lower() for term in ['content', 'article', 'post', 'body', 'text', 'story']
-                ))
-                for container in containers[:8]:
-                    paragraphs = container.find_all('p')
-                    if paragraphs:
-                        content = '\n\n'.join([p.get_text(strip=True) for p in paragraphs[:40]])
-                        if len(content) > 500:
-                            break
-
-            # Method 5: Get all substantial paragraphs
-            if not content or len(content) < 500:
-                all_paragraphs = soup.find_all('p')
-                # Filter paragraphs - keep those with substantial content
-                good_paragraphs = [
-                    p.get_text(strip=True)
-                    for p in all_paragraphs
-                    if len(p.get_text(strip=True)) > 50
-                ]
-                content = '\n\n'.join(good_paragraphs[:40])
+    def get_article_content(self, url):
+        """Fetch comprehensive article content for detailed summarization.
+        Methods are tried in the order the strategy table has learned for the domain, sharing one
+        ARTICLE_FETCH_BUDGET deadline; fallbacks that have recently stopped working are skipped."""
+        methods, reason = self.fetch_strategy.order(url)
+        if methods[0] != 'requests':
+            print(f"  → Using {self.FETCH_METHOD_LABELS[methods[0]]} first ({reason})")
+
+        deadline = time.time() + self.fetch_budget
+        content = ""
+        self.fetch_context.signals = []
+        for index, method in enumerate(methods):
+            label = self.FETCH_METHOD_LABELS[method]
+            remaining = deadline - time.time()
+            if remaining < self.MIN_FETCH_SLICE:
+                print(f"  ⊘ Fetch budget spent, skipping {label}")
+                break
+            if index:
+                if self.fetch_strategy.is_failing(url, method):
+                    print(f"  ⊘ Skipping {label} (recent success rate ~0%)")
+                    continue
+                print(f"  → Trying {label} backup...")
+            start = time.time()
+            # Markup signals belong to the method whose content is returned, not to earlier attempts
+            self.fetch_context.signals = []
+            content = self.fetch_methods[method](url, timeout=remaining)
+            elapsed = time.time() - start
+            usable = bool(content) and len(content) >= 100 and not self.is_cookie_consent_content(content)
+            self.fetch_strategy.record(url, method, usable, elapsed)
+            self.metrics.observe('fetch', elapsed, method=method, outcome='ok' if usable else 'failed')
+            print(f"  ⏱ {label}: {elapsed:.1f}s ({'ok' if usable else 'failed'}), "
+                  f"{max(deadline - time.time(), 0):.0f}s of budget left")
+            if usable:
+                break
+
+        # Check if content is cookie consent/privacy policy text
+        if content and self.is_cookie_consent_content(content):
+            print(f"  ⊘ Cookie consent/privacy policy content detected, rejecting")
+            return ""
 
-            # If still no content, try Playwright as backup (for JavaScript-rendered pages)
-            if not content or len(content) < 100:
-                print(f"  → Trying Playwright backup...")
-                content = self.get_article_content_playwright(url)
+        # Return enough content for concise summaries while preserving key facts.
+        return content[:10000] if content else ""
 
-            # If Playwright failed, try Google Cache as last resort
-            if not content or len(content) < 100:
-                print(f"  → Trying Google Cache backup...")
-                content = self.get_article_from_google_cache(url)
+    def _fetch_via_requests(self, url, timeout=20):
+        """Fetch and extract article text with a plain HTTP request"""
+        try:
+            response = requests.get(url, headers=self.headers, timeout=min(timeout, 20))
+            response.raise_for_status()
+            self._note_markup(response.content, response.url)
 
-            # Check if content is cookie consent/privacy policy text
-            if content and self.is_cookie_consent_content(content):
-                print(f"  ⊘ Cookie consent/privacy policy content detected, rejecting")
+            with self.metrics.timer('extract', method='requests'):
+                content, confidence = extract_content(
+                    response.content, rule=self.extraction_rules.for_url(url), max_paragraphs=40, max_chars=10000
+                )
+            if content and confidence < self.extract_min_confidence:
+                print(f"  ⚠ Low-confidence extraction ({confidence:.2f}), treating as failed")
                 return ""
-
-            # Return enough content for concise summaries while preserving key facts.
-            return content[:10000] if content else ""
+            return content
 
         except Exception as e:
             print(f"  ⚠ Content fetch error: {str(e)[:50]}")
-            # Try Playwright as backup
-            print(f"  → Trying Playwright backup...")
-            content = self.get_article_content_playwright(url)
-
-            # If Playwright failed, try Google Cache as last resort
-            if not content or len(content) < 100:
-                print(f"  → Trying Google Cache backup...")
-                content = self.get_article_from_google_cache(url)
-
-            # Check if content is cookie consent/privacy policy text
-            if content and self.is_cookie_consent_content(content):
-                print(f"  ⊘ Cookie consent/privacy policy content detected, rejecting")
-                return ""
+            return ""
 
-            return content
+    def _note_markup(self, html, final_url=None):
+        """Remember paywall/consent signals from a fetched page for the access gate"""
+        signals = getattr(self.fetch_context, 'signals', None)
+        if signals is not None:
+            signals.extend(s for s in markup_signals(html, final_url) if s not in signals)
+
+    def _http_session(self):
+        """Per-thread requests session, so provider connections stay open between articles"""
+        session = getattr(self.http_sessions, 'session', None)
+        if session is None:
+            session = self.http_sessions.session = requests.Session()
+        return session
+
+    def _post_provider(self, provider, url, headers, payload, timeout=30, cancel_event=None):
+        """POST to a provider API and report latency/outcome to the router.
+        The request first waits for rate-limit capacity on one of the provider's keys, whose
+        header is added here; a 429 re-queues it on the limiter (another key, or the same one
+        once it resets) and the provider is only paused when no key frees up in time.
+        Returns the response on HTTP 200, otherwise None. Failures of a call whose
+        cancel_event is set (a hedge loser) are not held against the provider."""
+        estimate = (self.compressor.estimate_tokens(json.dumps(payload))
+                    + payload.get('max_tokens', 250))
+        header, value = self.PROVIDER_AUTH[provider]
+        recorded = False
+        try:
+            for attempt in range(self.rate_limit_retries + 1):
+                lease = self.rate_limiter.acquire(provider, estimate, cancel_event)
+                if lease is None:
+                    if not (cancel_event and cancel_event.is_set()):
+                        self.metrics.count('rate_limit_handoffs', provider=provider)
+                        recorded = True
+                        self.router.record_rate_limit(provider, self.rate_limiter.max_wait)
+                    return None
+                if lease.waited > 0.05:
+                    self.metrics.observe('rate_wait', lease.waited, provider=provider)
+
+                start = time.time()
+                try:
+                    response = self._http_session().post(
+                        url, headers={**headers, header: value.format(lease.key.secret)}, json=payload, timeout=timeout)
+                except Exception as e:
+                    cancelled = cancel_event and cancel_event.is_set()
+                    self.metrics.observe('provider', time.time() - start, provider=provider,
+                                         outcome='cancelled' if cancelled else type(e).__name__)
+                    if not cancelled:
+                        recorded = True
+                        self.router.record_failure(provider, time.time() - start, type(e).__name__)
+                    return None
+
+                elapsed = time.time() - start
+                blocked = self.rate_limiter.observe(lease, response.status_code, response.headers)
+                if cancel_event and cancel_event.is_set() and response.status_code != 200:
+                    self.metrics.observe('provider', elapsed, provider=provider, outcome='cancelled')
+                    return None
+                self.metrics.observe('provider', elapsed, provider=provider,
+                                     outcome='ok' if response.status_code == 200 else f"http_{response.status_code}")
+                if response.status_code == 429:
+                    if attempt < self.rate_limit_retries:
+                        print(f"  ⏸ {provider} key {lease.key.key_id[:6]} rate limited for {blocked:.0f}s, re-queued")
+                        continue
+                    recorded = True
+                    self.router.record_rate_limit(provider, response.headers.get('retry-after'))
+                    return None
+                if response.status_code != 200:
+                    recorded = True
+                    self.router.record_failure(provider, elapsed, f"HTTP {response.status_code}")
+                    return None
+
+                recorded = True
+                self.router.record_success(provider, elapsed)
+                return response
+            return None
+        finally:
+            if not recorded:
+                # No outcome reached the router (cancelled hedge, re-queued 429s): give back the
+                # slot acquired for this call so a half-open probe is not held forever
+                self.router.release(provider)
+
+    def _record_usage(self, provider, response, result, prompt, text):
+        """Account one completed provider call to the current article's source and purpose"""
+        usage = parse_usage(provider, result)
+        estimated = usage is None
+        if estimated:
+            usage = (self.compressor.estimate_tokens(prompt), self.compressor.estimate_tokens(text), 0)
+        context = self.usage_context
+        self.usage.record(provider, self._provider_model(provider), *usage,
+                          seconds=response.elapsed.total_seconds(),
+                          source_id=getattr(context, 'source_id', None),
+                          source_name=getattr(context, 'source_name', None),
+                          purpose=getattr(context, 'purpose', None), estimated=estimated)
+        self.metrics.count('llm_tokens', usage[0], provider=provider, kind='input')
+        self.metrics.count('llm_tokens', usage[1], provider=provider, kind='output')
+
+    def _in_usage_context(self, fn):
+        """Wrap fn so it runs with the calling thread's usage context (for hedge threads)"""
+        context = dict(vars(self.usage_context))
+
+        def run(*args):
+            vars(self.usage_context).update(context)
+            return fn(*args)
+        return run
+
+    def _call_provider(self, provider, prompt, max_tokens, cancel_event=None, acquired=True):
+        """Dispatch a prompt to one provider by name, answering from the response cache when possible.
+        acquired: the caller holds a router slot for the provider (given back on a cache hit)"""
+        dispatched = []
+
+        def dispatch():
+            dispatched.append(True)
+            return self._dispatch_provider(provider, prompt, max_tokens, cancel_event)
 
-    def call_minai(self, prompt, max_tokens=200):
-        """Call 1min.ai API (using GPT-4o-mini)"""
         try:
-            response = requests.post(
-                'https://api.1min.ai/api/features?isStreaming=false',
-                headers={
-                    'API-KEY': self.minai_key,
-                    'Content-Type': 'application/json'
-                },
-                json={
-                    'type': 'CHAT_WITH_AI',
-                    'model': 'gpt-4o-mini',
-                    'promptObject': {
-                        'prompt': prompt
-                    }
-                },
-                timeout=30
-            )
+            return self.llm_cache.get_or_call(provider, self._provider_model(provider), prompt, max_tokens, dispatch)
+        finally:
+            if acquired and not dispatched:
+                # Answered by the cache (or an identical in-flight call): no outcome reaches the
+                # router, so give back the slot acquired for it (a half-open probe included)
+                self.router.release(provider)
+
+    def _dispatch_provider(self, provider, prompt, max_tokens, cancel_event=None):
+        if provider == 'anthropic':
+            return self.call_anthropic(prompt, max_tokens=max_tokens, cancel_event=cancel_event)
+        if provider == 'minai':
+            return self.call_minai(prompt, max_tokens=max_tokens, cancel_event=cancel_event)
+        if provider == 'deepseek':
+            return self.call_deepseek(prompt, max_tokens=max_tokens, cancel_event=cancel_event)
+        if provider == 'openai':
+            return self.call_openai(prompt, max_tokens=max_tokens, cancel_event=cancel_event)
+        return None
 
-            if response.status_code == 200:
-                result = response.json()
-                # Extract response: aiRecord -> aiRecordDetail -> resultObject[0]
-                if 'aiRecord' in result:
-                    ai_record = result['aiRecord']
-                    if 'aiRecordDetail' in ai_record:
-                        detail = ai_record['aiRecordDetail']
-                        if 'resultObject' in detail:
-                            result_obj = detail['resultObject']
-                            if isinstance(result_obj, list) and len(result_obj) > 0:
-                                return result_obj[0].strip()
-                return None
-            else:
-                return None
+    def call_minai(self, prompt, max_tokens=200, cancel_event=None):
+        """Call 1min.ai API (using GPT-4o-mini)"""
+        response = self._post_provider(
+            'minai',
+            'https://api.1min.ai/api/features?isStreaming=false',
+            headers={
+                'Content-Type': 'application/json'
+            },
+            payload={
+                'type': 'CHAT_WITH_AI',
+                'model': 'gpt-4o-mini',
+                'promptObject': {
+                    'prompt': prompt
+                }
+            },
+            cancel_event=cancel_event
+        )
+        if response is None:
+            return None
 
+        try:
+            result = response.json()
+            text = None
+            # Extract response: aiRecord -> aiRecordDetail -> resultObject[0]
+            if 'aiRecord' in result:
+                ai_record = result['aiRecord']
+                if 'aiRecordDetail' in ai_record:
+                    detail = ai_record['aiRecordDetail']
+                    if 'resultObject' in detail:
+                        result_obj = detail['resultObject']
+                        if isinstance(result_obj, list) and len(result_obj) > 0:
+                            text = result_obj[0].strip()
         except Exception as e:
             return None
+        # 1min.ai reports credits, not tokens; usage is estimated from the text
+        self._record_usage('minai', response, result, prompt, text)
+        return text
 
-    def call_anthropic(self, prompt, max_tokens=200):
+    def call_anthropic(self, prompt, max_tokens=200, cancel_event=None):
         """Call Anthropic Claude API"""
-        try:
-            response = requests.post(
-                'https://api.anthropic.com/v1/messages',
-                headers={
-                    'x-api-key': self.anthropic_key,
-                    'anthropic-version': '2023-06-01',
-                    'Content-Type': 'application/json'
-                },
-                json={
-                    'model': self.anthropic_model,
-                    'max_tokens': max_tokens,
-                    'messages': [
-                        {'role': 'user', 'content': prompt}
-                    ]
-                },
-                timeout=30
-            )
-
-            if response.status_code == 200:
-                result = response.json()
-                if 'content' in result and len(result['content']) > 0:
-                    return result['content'][0]['text'].strip()
-                return None
-            else:
-                return None
+        response = self._post_provider(
+            'anthropic',
+            'https://api.anthropic.com/v1/messages',
+            headers={
+                'anthropic-version': '2023-06-01',
+                'Content-Type': 'application/json'
+            },
+            payload={
+                'model': self.anthropic_model,
+                'max_tokens': max_tokens,
+                'messages': [
+                    {'role': 'user', 'content': prompt}
+                ]
+            },
+            cancel_event=cancel_event
+        )
+        if response is None:
+            return None
 
+        try:
+            result = response.json()
+            text = None
+            if 'content' in result and len(result['content']) > 0:
+                text = result['content'][0]['text'].strip()
         except Exception as e:
             return None
+        self._record_usage('anthropic', response, result, prompt, text)
+        return text
 
-    def call_deepseek(self, prompt, max_tokens=200):
+    def call_deepseek(self, prompt, max_tokens=200, cancel_event=None):
         """Call DeepSeek API"""
-        try:
-            response = requests.post(
-                'https://api.deepseek.com/v1/chat/completions',
-                headers={
-                    'Authorization': f'Bearer {self.deepseek_key}',
-                    'Content-Type': 'application/json'
-                },
-                json={
-                    'model': self.deepseek_model,
-                    'messages': [
-                        {'role': 'system', 'content': 'You are a business news summarizer. Provide concise, factual summaries.'},
-                        {'role': 'user', 'content': prompt}
-                    ],
-                    'temperature': 0.3,
-                    'max_tokens': max_tokens
-                },
-                timeout=30
-            )
-
-            if response.status_code == 200:
-                return response.json()['choices'][0]['message']['content'].strip()
-            else:
-                return None
+        response = self._post_provider(
+            'deepseek',
+            'https://api.deepseek.com/v1/chat/completions',
+            headers={
+                'Content-Type': 'application/json'
+            },
+            payload={
+                'model': self.deepseek_model,
+                'messages': [
+                    {'role': 'system', 'content': 'You are a business news summarizer. Provide concise, factual summaries.'},
+                    {'role': 'user', 'content': prompt}
+                ],
+                'temperature': 0.3,
+                'max_tokens': max_tokens
+            },
+            cancel_event=cancel_event
+        )
+        if response is None:
+            return None
 
+        try:
+            result = response.json()
+            text = result['choices'][0]['message']['content'].strip()
         except Exception as e:
             return None
+        self._record_usage('deepseek', response, result, prompt, text)
+        return text
 
-    def call_openai(self, prompt, max_tokens=200):
+    def call_openai(self, prompt, max_tokens=200, cancel_event=None):
         """Call OpenAI API"""
-        try:
-            response = requests.post(
-                'https://api.openai.com/v1/chat/completions',
-                headers={
-                    'Authorization': f'Bearer {self.openai_key}',
-                    'Content-Type': 'application/json'
-                },
-                json={
-                    'model': self.openai_model,
-                    'messages': [
-                        {'role': 'system', 'content': 'You are a business news summarizer. Provide concise, factual summaries.'},
-                        {'role': 'user', 'content': prompt}
-                    ],
-                    'temperature': 0.3,
-                    'max_tokens': max_tokens
-                },
-                timeout=30
-            )
-
-            if response.status_code == 200:
-                return response.json()['choices'][0]['message']['content'].strip()
-            else:
-                return None
+        response = self._post_provider(
+            'openai',
+            'https://api.openai.com/v1/chat/completions',
+            headers={
+                'Content-Type': 'application/json'
+            },
+            payload={
+                'model': self.openai_model,
+                'messages': [
+                    {'role': 'system', 'content': 'You are a business news summarizer. Provide concise, factual summaries.'},
+                    {'role': 'user', 'content': prompt}
+                ],
+                'temperature': 0.3,
+                'max_tokens': max_tokens
+            },
+            cancel_event=cancel_event
+        )
+        if response is None:
+            return None
 
+        try:
+            result = response.json()
+            text = result['choices'][0]['message']['content'].strip()
         except Exception as e:
             return None
+        self._record_usage('openai', response, result, prompt, text)
+        return text
 
     def summarize_last_resort(self, title, content):
         """Last-resort summarization via Anthropic when full content is unavailable (paywall/block).
@@ -557,8 +663,14 @@ class ParallelSummarizer:
             prompt = f"Write a concise summary under {self.summary_word_limit} words based only on this title and excerpt.\nTitle: {title}\nExcerpt: {snippet[:500]}\nSummary:"
         else:
             prompt = f"Write a concise summary under {self.summary_word_limit} words based only on this article title.\nTitle: {title}\nSummary:"
+        # Anthropic outside AI_PROVIDER_ORDER has no breaker to respect; otherwise take a slot like any call
+        routed = 'anthropic' in self.router.providers
+        if routed and not self.router.acquire('anthropic'):
+            print(f"  ⊘ Anthropic unavailable (circuit open or rate limited), no last-resort summary")
+            return None
+        self.usage_context.purpose = 'last_resort'
         try:
-            result = self.call_anthropic(prompt, max_tokens=80)
+            result = self._call_provider('anthropic', prompt, max_tokens=80, acquired=routed)
             if result and len(result.strip()) > 10:
                 summary = self._trim_summary_to_word_limit(result)
                 print(f"  ↩ Last-resort Anthropic summary ({len(summary.split())} words)")
@@ -567,12 +679,8 @@ class ParallelSummarizer:
             print(f"  ✗ Last-resort Anthropic error: {e}")
         return None
 
-    def summarize_with_ai(self, title, content):
-        """Summarize using AI providers in configured order."""
-        if not content or len(content) < 100:
-            return None
-
-        prompt = f"""You are an expert business news analyst. Create a concise, informative summary of this article.
+    def _summary_prompt(self, title, content):
+        return f"""You are an expert business news analyst. Create a concise, informative summary of this article.
 
 Article Title: {title}
 
@@ -591,59 +699,42 @@ Instructions for the summary:
 
 Write a summary ({self.summary_word_limit} words or fewer):"""
 
-        # Try providers in configured order
-        for provider in self.provider_order:
-            result = None
-
-            if provider == 'anthropic' and self.anthropic_key:
-                result = self.call_anthropic(prompt, max_tokens=250)
-                provider_name = "Claude"
-            elif provider == 'minai' and self.minai_key:
-                result = self.call_minai(prompt, max_tokens=250)
-                provider_name = "1min.ai (GPT-4o-mini)"
-            elif provider == 'deepseek' and self.deepseek_key:
-                result = self.call_deepseek(prompt, max_tokens=250)
-                provider_name = "DeepSeek"
-            elif provider == 'openai' and self.openai_key:
-                result = self.call_openai(prompt, max_tokens=250)
-                provider_name = "OpenAI"
+    def summarize_with_ai(self, title, content, rejected=None):
+        """Summarize using AI providers in router order (configured order adjusted for health).
+        Providers that answered with a failure message instead of a summary are appended to rejected."""
+        if not content or len(content) < 100:
+            return None
+        self.usage_context.purpose = 'summary'
+
+        # Compress once per distinct provider token budget
+        prompts = {}
+        reported = []
+
+        def prompt_for(provider):
+            budget = self.compressor.budget_for(provider)
+            if budget not in prompts:
+                compressed, stats = self.compressor.compress(title, content, budget)
+                prompts[budget] = self._summary_prompt(title, compressed)
+                if not reported:
+                    reported.append(stats)
+                    self._record_compression(stats)
+            return prompts[budget]
+
+        # Try providers in router order (configured order adjusted for health)
+        providers = self.router.order()
+        tried = set()
+        for provider in providers:
+            if provider in tried or not self.router.acquire(provider):
+                continue  # Breaker open or probe already in flight, skip
+            tried.add(provider)
+
+            if self.hedge_executor:
+                result, provider = self._summarize_hedged(provider, providers, tried, prompt_for, rejected)
             else:
-                continue  # Provider not configured, skip
+                result = self._summary_attempt(provider, prompt_for(provider), rejected=rejected)
+            provider_name = self.PROVIDER_LABELS.get(provider, provider)
 
             if result:
-                # Check for AI failure patterns
-                failure_patterns = [
-                    'I apologize, but',
-                    'I cannot provide a summary',
-                    'I cannot create a summary',
-                    'cannot be created',
-                    'cannot be generated',
-                    'does not contain substantial information',
-                    'appears to be incomplete',
-                    'appears to be corrupted',
-                    'appears to be a privacy policy',
-                    'insufficient information',
-                    'privacy policy and consent form',
-                    'privacy policy or consent',
-                    'consent form',
-                    'corrupted or unreadable',
-                    'article content appears to be',
-                    'article text appears to be',
-                    'provided text appears to be',
-                    'provided text is not',
-                    'text is not the article',
-                    'is not the article content',
-                    'article content is absent',
-                    'actual article content is absent',
-                    'without the actual article',
-                    'article content is corrupted',
-                    'content is corrupted'
-                ]
-
-                if any(pattern.lower() in result.lower() for pattern in failure_patterns):
-                    print(f"  ⊘ {provider_name} returned failure message, trying next provider...")
-                    continue  # Try next provider
-
                 result = self._trim_summary_to_word_limit(result)
                 word_count = len(result.split())
                 print(f"  ✓ {provider_name} generated {word_count} word summary")
@@ -655,34 +746,107 @@ Write a summary ({self.summary_word_limit} words or fewer):"""
 
         return None
 
+    def _summary_attempt(self, provider, prompt, cancel_event=None, rejected=None):
+        """Ask one provider for a summary; None on error or an AI failure message
+        (the provider is then appended to rejected)"""
+        result = self._call_provider(provider, prompt, max_tokens=250, cancel_event=cancel_event)
+        if not result:
+            return None
+        if text_classifier.is_ai_failure(result):
+            self.llm_cache.delete(provider, self._provider_model(provider), prompt, 250)
+            if rejected is not None:
+                rejected.append(provider)
+            if not (cancel_event and cancel_event.is_set()):
+                print(f"  ⊘ {self.PROVIDER_LABELS.get(provider, provider)} returned failure message")
+            return None
+        return result
+
+    def _take_hedge_budget(self):
+        with self.hedge_lock:
+            now = time.time()
+            if now - self.hedge_window_start >= self.hedge_window:
+                self.hedge_window_start = now
+                self.hedge_window_fired = 0
+            if self.hedge_window_fired >= self.hedge_budget:
+                return False
+            self.hedge_window_fired += 1
+            self.hedge_stats['fired'] += 1
+            return True
+
+    def _record_compression(self, stats):
+        saved = stats['input_tokens'] - stats['output_tokens']
+        if saved > 0:
+            print(f"  ✂ Compressed content {stats['input_tokens']} → {stats['output_tokens']} tokens (saved {saved})")
+        with self.stats_lock:
+            self.compression_stats['articles'] += 1
+            self.compression_stats['input_tokens'] += stats['input_tokens']
+            self.compression_stats['output_tokens'] += stats['output_tokens']
+
+    def _summarize_hedged(self, primary, providers, tried, prompt_for, rejected=None):
+        """Call the primary provider; if it has not answered within its observed p90
+        latency, race the next healthy provider and keep whichever succeeds first.
+        Returns (summary or None, provider that produced it)."""
+        p90 = self.router.latency_percentile(primary, 0.9)
+        if p90 is None:
+            return self._summary_attempt(primary, prompt_for(primary), rejected=rejected), primary
+
+        cancels = {primary: Event()}
+        attempt = self._in_usage_context(self._summary_attempt)
+        primary_future = self.hedge_executor.submit(attempt, primary, prompt_for(primary), cancels[primary], rejected)
+        try:
+            return primary_future.result(timeout=max(p90, self.hedge_min_delay)), primary
+        except FutureTimeout:
+            pass
+
+        # First remaining provider that will take a request (breakers and probes permitting)
+        secondary = next((p for p in providers if p not in tried and self.router.acquire(p)), None)
+        if secondary is None:
+            return primary_future.result(), primary
+        if not self._take_hedge_budget():
+            self.router.release(secondary)
+            return primary_future.result(), primary
+        tried.add(secondary)
+
+        print(f"  ⑂ {self.PROVIDER_LABELS.get(primary, primary)} slower than p90 ({p90:.1f}s), "
+              f"hedging with {self.PROVIDER_LABELS.get(secondary, secondary)}")
+        cancels[secondary] = Event()
+        secondary_future = self.hedge_executor.submit(attempt, secondary, prompt_for(secondary),
+                                                      cancels[secondary], rejected)
+        owners = {primary_future: primary, secondary_future: secondary}
+
+        pending = set(owners)
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                result = future.result()
+                if not result:
+                    continue
+                winner = owners[future]
+                # Cancel the loser: drop it if not started, otherwise ignore its outcome
+                for loser in pending:
+                    cancels[owners[loser]].set()
+                    if loser.cancel():
+                        self.router.release(owners[loser])
+                with self.hedge_lock:
+                    self.hedge_stats['won' if winner == secondary else 'lost'] += 1
+                return result, winner
+
+        with self.hedge_lock:
+            self.hedge_stats['lost'] += 1
+        return None, secondary
+
     def _categorize_sports(self, title, summary):
         """Categorize sports-source articles with a sports-focused prompt"""
-        text = f"{title} {summary}".lower()
-
-        # Build only sports categories for the prompt
-        sports_cats = []
-        business_cats = []
-        for name, data in self.categories_cache.items():
-            if data.get('level') != 2:
-                continue
-            parent_id = data.get('parentID')
-            for pname, pdata in self.categories_cache.items():
-                if pdata.get('id') == parent_id and pdata.get('level') == 1:
-                    if pname == 'Sports':
-                        desc = data.get('description', '')
-                        sports_cats.append(f"{name}: {desc}" if desc else name)
-                    elif pname == 'Business':
-                        desc = data.get('description', '')
-                        business_cats.append(f"{name}: {desc}" if desc else name)
-                    break
+        sports_cats = self.category_index.prompt_fragment('Sports')
+        business_cats = self.category_index.prompt_fragment('Business')
 
         prompt = f"""You are a sports news classifier. Assign 1-2 categories to this sports article.
 
 SPORTS CATEGORIES (use EXACT names before the colon):
-{chr(10).join('  - ' + c for c in sorted(sports_cats))}
+{chr(10).join('  - ' + c for c in sports_cats)}
 
 BUSINESS CATEGORIES (use ONLY if article is primarily about business):
-{chr(10).join('  - ' + c for c in sorted(business_cats))}
+{chr(10).join('  - ' + c for c in business_cats)}
 
 RULES:
 1. Return 1-2 categories maximum. Prefer 1 specific category.
@@ -702,25 +866,14 @@ Article Summary: {summary}
 
 Return ONLY category names separated by commas (1-2 categories):"""
 
-        for provider in self.provider_order:
-            result = None
-            if provider == 'anthropic' and self.anthropic_key:
-                result = self.call_anthropic(prompt, max_tokens=50)
-            elif provider == 'minai' and self.minai_key:
-                result = self.call_minai(prompt, max_tokens=50)
-            elif provider == 'deepseek' and self.deepseek_key:
-                result = self.call_deepseek(prompt, max_tokens=50)
-            elif provider == 'openai' and self.openai_key:
-                result = self.call_openai(prompt, max_tokens=50)
-            else:
+        for provider in self.router.order():
+            if not self.router.acquire(provider):
                 continue
+            result = self._call_provider(provider, prompt, max_tokens=50)
 
             if result:
-                suggested = [cat.strip() for cat in result.split(',')]
-                valid = [cat for cat in suggested
-                         if cat in self.categories_cache
-                         and self.categories_cache[cat].get('level') == 2]
-                return valid[:2] if valid else ['Sports News']
+                valid = self.category_index.validate(result, 2)
+                return valid if valid else ['Sports News']
 
         return ['Sports News']
 
@@ -728,36 +881,14 @@ Return ONLY category names separated by commas (1-2 categories):"""
         """Categorize using AI providers in configured order (only assigns level-2 categories)"""
         if not summary:
             return ['Global Business']
+        self.usage_context.purpose = 'categorize'
 
         # For sports sources, use sports-specific categorization
         if main_category == 'Sports':
             return self._categorize_sports(title, summary)
 
-        # Build category list grouped by parent for clarity - only level 2 (assignable) categories
-        parent_groups = {}
-        for name, data in self.categories_cache.items():
-            if data.get('level') != 2:
-                continue
-            parent_id = data.get('parentID')
-            # Find parent name
-            parent_name = None
-            for pname, pdata in self.categories_cache.items():
-                if pdata.get('id') == parent_id and pdata.get('level') == 1:
-                    parent_name = pname
-                    break
-            if parent_name:
-                if parent_name not in parent_groups:
-                    parent_groups[parent_name] = []
-                desc = data.get('description', '')
-                parent_groups[parent_name].append(f"{name}: {desc}" if desc else name)
-
-        # Build structured category listing
-        category_listing = ""
-        for parent in ['Business', 'Technology', 'Sports', 'General']:
-            if parent in parent_groups:
-                category_listing += f"\n[{parent}]\n"
-                for cat in sorted(parent_groups[parent]):
-                    category_listing += f"  - {cat}\n"
+        # Structured listing of level-2 (assignable) categories grouped by parent
+        category_listing = self.category_index.prompt_listing()
 
         prompt = f"""You are a strict news article classifier. Assign 1-3 categories to this article. You MUST follow ALL rules below.
 
@@ -836,216 +967,114 @@ Article Summary: {summary}
 
 Return ONLY the category names separated by commas (1-3 categories, exact names only):"""
 
-        # Try providers in configured order
-        for provider in self.provider_order:
-            result = None
-
-            if provider == 'anthropic' and self.anthropic_key:
-                result = self.call_anthropic(prompt, max_tokens=50)
-            elif provider == 'minai' and self.minai_key:
-                result = self.call_minai(prompt, max_tokens=50)
-            elif provider == 'deepseek' and self.deepseek_key:
-                result = self.call_deepseek(prompt, max_tokens=50)
-            elif provider == 'openai' and self.openai_key:
-                result = self.call_openai(prompt, max_tokens=50)
-            else:
-                continue  # Provider not configured, skip
+        # Try providers in router order (configured order adjusted for health)
+        for provider in self.router.order():
+            if not self.router.acquire(provider):
+                continue  # Breaker open or probe already in flight, skip
+            result = self._call_provider(provider, prompt, max_tokens=50)
 
             if result:
-                suggested = [cat.strip() for cat in result.split(',')]
                 # Only accept level-2 categories
-                valid = [cat for cat in suggested
-                         if cat in self.categories_cache
-                         and self.categories_cache[cat].get('level') == 2]
-                return valid[:3] if valid else ['Global Business']
+                valid = self.category_index.validate(result, 3)
+                return valid if valid else ['Global Business']
 
         return ['Global Business']
 
     def is_cookie_consent_content(self, content):
         """Detect if content is primarily cookie consent/privacy policy text instead of article content"""
-        if not content:
-            return False
-
-        content_lower = content.lower()
-
-        # Strong indicators - directly cookie/consent related, unlikely in real articles
-        strong_patterns = [
-            'cookie consent', 'cookie policy', 'cookie settings', 'cookie preferences',
-            'manage cookies', 'accept cookies', 'reject cookies', 'accept all cookies',
-            'we use cookies', 'this site uses cookies', 'uses cookies to',
-            'consent to the use', 'consent preferences',
-            'third-party cookies', 'third party cookies',
-            'strictly necessary cookies', 'functional cookies',
-            'performance cookies', 'targeting cookies', 'advertising cookies',
-            'analytics cookies',
-            # Region blocks and access restrictions
-            'content not available in your region',
-            'not available in your location',
-            'access denied from your location',
-            'content is not available in',
-            'service is not available',
-            'this content is currently unavailable',
-            'yahoo is part of the yahoo family',
-            'oath and our partners',
-        ]
-
-        # Weaker indicators - may appear in legitimate privacy-related articles
-        weak_patterns = [
-            'privacy policy notice', 'privacy settings', 'your privacy choices',
-            'your privacy rights', 'manage your privacy',
-            'tracking technology', 'tracking technologies',
-            'opt-out instructions', 'opt out of',
-            'data processing', 'personal data',
-            'gdpr', 'ccpa', 'california consumer privacy',
-            'legitimate interest', 'legitimate business interest',
-            'continue to yahoo',
-            'sign in to continue',
-            'create an account',
-        ]
-
-        strong_matches = sum(1 for p in strong_patterns if p in content_lower)
-        weak_matches = sum(1 for p in weak_patterns if p in content_lower)
-
-        # Any 2+ strong matches = cookie content
-        if strong_matches >= 2:
-            return True
-
-        # 1 strong + 2 weak = cookie content
-        if strong_matches >= 1 and weak_matches >= 2:
-            return True
-
-        # For short content (<2000 chars), 1 strong + 1 weak is suspicious
-        if len(content) < 2000 and strong_matches >= 1 and weak_matches >= 1:
-            return True
-
-        return False
+        return text_classifier.is_cookie_consent(content)
 
     def has_paywall(self, content):
         """Detect if content indicates a paywall"""
-        if not content:
-            return False
-
-        content_lower = content.lower()
-
-        # CNBC Versant paywall blocker
-        if 'this site is now part ofversant' in content_lower or 'part of versant' in content_lower:
+        return text_classifier.has_paywall(content)
+
+    def update_article(self, article_id, summary, categories, fulltext=None, cluster=None, upgrade=False):
+        """Queue the article's summary, categories, and fullArticle for the DB writer.
+        A cluster this article represents is completed so its near-duplicates can copy the result;
+        upgrade replaces a provisional summary's default categories."""
+        # Detect paywall (the access gate normally stops these before summarizing)
+        if fulltext and self.has_paywall(fulltext):
+            self.result_writer.paywalled(article_id)
+            print(f"  ⚠ Paywall detected - cleared content and marked as failed")
             return True
 
-        paywall_patterns = [
-            'subscribe to read', 'subscribers only', 'subscriber exclusive',
-            'premium content', 'create a free account', 'sign in to continue',
-            'subscription required', 'become a member', 'unlock this article',
-            'register to read', 'paywall', 'exclusive to subscribers'
-        ]
-
-        for pattern in paywall_patterns:
-            if pattern in content_lower:
-                return True
-
-        # Very short content with account/signin keywords
-        if len(content) < 300:
-            if any(kw in content_lower for kw in ['subscribe', 'sign in', 'log in', 'member only']):
-                return True
-
-        return False
-
-    def update_article(self, article_id, summary, categories, fulltext=None):
-        """Update article with summary, categories, and fullArticle"""
-        try:
-            with self.db_lock:
-                conn = mysql.connector.connect(**self.db_config)
-                cursor = conn.cursor()
-                cursor.execute("SET time_zone = '-08:00'")
-
-                # Detect paywall
-                has_paywall = 'Y' if fulltext and self.has_paywall(fulltext) else 'N'
-
-                # If paywall detected, clear summary and fullArticle, mark as failed
-                if has_paywall == 'Y':
-                    cursor.execute("""
-                        UPDATE articles
-                        SET summary = NULL,
-                            `fullArticle` = NULL,
-                            hasPaywall = 'Y',
-                            summary_date = NULL,
-                            isSummaryFailed = 'Y'
-                        WHERE id = %s
-                    """, (article_id,))
-                    print(f"  ⚠ Paywall detected - cleared content and marked as failed")
-                # Update summary and fullArticle with success tracking
-                elif fulltext:
-                    cursor.execute("""
-                        UPDATE articles
-                        SET summary = %s,
-                            `fullArticle` = %s,
-                            hasPaywall = %s,
-                            summary_date = NOW(),
-                            isSummaryFailed = 'N',
-                            summary_retry_count = 0,
-                            summary_last_attempt = NULL
-                        WHERE id = %s
-                    """, (summary, fulltext, has_paywall, article_id))
-                else:
-                    cursor.execute("""
-                        UPDATE articles
-                        SET summary = %s,
-                            summary_date = NOW(),
-                            isSummaryFailed = 'N',
-                            summary_retry_count = 0,
-                            summary_last_attempt = NULL
-                        WHERE id = %s
-                    """, (summary, article_id))
-
-                for category_name in categories:
-                    if category_name in self.categories_cache:
-                        category_id = self.categories_cache[category_name]['id']
-                        cursor.execute("""
-                            INSERT IGNORE INTO article_categories (article_id, category_id)
-                            VALUES (%s, %s)
-                        """, (article_id, category_id))
-
-                conn.commit()
-                cursor.close()
-                conn.close()
-                return True
-
-        except Error as e:
+        category_ids = [category_id for category_id in map(self.category_index.id_for, categories)
+                        if category_id is not None]
+        # Without fresh fullArticle the stored text and hasPaywall flag are left as they are
+        self.result_writer.summary(article_id, summary, category_ids, fulltext=fulltext,
+                                   has_paywall='N' if fulltext else None,
+                                   cluster_hash=cluster.fingerprint if cluster else None,
+                                   replace_categories=upgrade)
+        if cluster is not None:
+            self.article_clusters.complete(cluster, summary, category_ids)
+        return True
+
+    def copy_from_cluster(self, article_id, cluster, fingerprint, fulltext=None, upgrade=False):
+        """Give a near-duplicate its representative's summary and categories. Returns 'copied',
+        'deferred' while the representative is still running (the article goes back to the queue
+        for CLUSTER_DEFER_SECONDS rather than holding a worker), or None when the copy has to be
+        summarized on its own. upgrade replaces a provisional summary's default categories."""
+        # Without leases there is no way to hold the article back, so it is summarized on its own
+        summary, defer = self.article_clusters.resolve(cluster, can_defer=self.result_writer.claims)
+        if defer:
+            self.result_writer.deferred(article_id, self.article_clusters.defer_seconds)
+            return 'deferred'
+        if not summary:
+            return None
+        self.result_writer.summary(article_id, summary, cluster.category_ids, fulltext=fulltext,
+                                   has_paywall='N' if fulltext else None,
+                                   cluster_hash=fingerprint, canonical_id=cluster.canonical_id,
+                                   replace_categories=upgrade)
+        return 'copied'
+
+    def store_provisional_summary(self, article, content, fulltext, retry_count):
+        """Extractive stand-in summary when no provider answered; False if the text has no usable
+        sentences or the queue could not pick the article up again for its LLM upgrade"""
+        if not (self.article_queue and self.article_queue.provisional_enabled):
             return False
+        summary = self.extractive.summarize(article['title'], content)
+        if not summary:
+            return False
+        # Same defaults the LLM categorizer falls back to, without another round of provider calls
+        categories = ['Sports News'] if article.get('mainCategory') == 'Sports' else ['Global Business']
+        category_ids = [category_id for category_id in map(self.category_index.id_for, categories)
+                        if category_id is not None]
+        new_retry_count = retry_count + 1
+        self.result_writer.provisional(article['id'], summary, category_ids, fulltext,
+                                       new_retry_count, retry_delay_minutes(new_retry_count))
+        with self.stats_lock:
+            self.provisional_count += 1
+        print(f"  ✎ Extractive summary ({len(summary.split())} words), provisional until an LLM retry")
+        return True
+
+    def mark_article_paywalled(self, article_id):
+        """Flag a gated article as paywalled and failed without storing its teaser text"""
+        self.result_writer.paywalled(article_id)
+        return True
 
     def mark_article_failed(self, article_id, retry_count=0):
         """Mark article as failed and track retry attempts with exponential backoff (max 5 attempts)"""
-        try:
-            with self.db_lock:
-                conn = mysql.connector.connect(**self.db_config)
-                cursor = conn.cursor()
-                cursor.execute("SET time_zone = '-08:00'")
-
-                new_retry_count = retry_count + 1
-
-                # Increment retry count and update last attempt time
-                cursor.execute("""
-                    UPDATE articles
-                    SET isSummaryFailed = 'Y',
-                        summary_retry_count = %s,
-                        summary_last_attempt = NOW()
-                    WHERE id = %s
-                """, (new_retry_count, article_id))
+        new_retry_count = retry_count + 1
 
-                conn.commit()
-                cursor.close()
-                conn.close()
-
-                # Log if article has reached max attempts
-                if new_retry_count >= 5:
-                    print(f"  ⊗ Article marked inactive after {new_retry_count} failed attempts")
+        # Increment retry count, update last attempt time and schedule the next attempt
+        self.result_writer.failed(article_id, new_retry_count, retry_delay_minutes(new_retry_count))
 
-                return True
+        # Log if article has reached max attempts
+        if new_retry_count >= 5:
+            print(f"  ⊗ Article marked inactive after {new_retry_count} failed attempts")
 
-        except Error as e:
-            return False
+        return True
 
     def process_article(self, article, counter=""):
-        """Process a single article"""
+        """Process a single article, timing it end to end"""
+        with self.metrics.timer('article') as labels:
+            ok = self._process_article(article, counter)
+            labels['outcome'] = 'summarized' if ok else 'not_summarized'
+        self.metrics.count('articles', outcome=labels['outcome'])
+        return ok
+
+    def _process_article(self, article, counter=""):
+        cluster = None
         try:
             retry_count = article.get('summary_retry_count', 0)
             if retry_count > 0:
@@ -1053,6 +1082,9 @@ Return ONLY the category names separated by commas (1-3 categories, exact names
             else:
                 retry_note = " (attempt 1/5)"
             source_name = article.get('source_name', 'Unknown')
+            self.usage_context.source_id = article.get('source_id')
+            self.usage_context.source_name = source_name
+            self.usage_context.purpose = None
             counter_str = f"[{counter}] " if counter else ""
             print(f"{counter_str}[{source_name}] {article['title'][:50]}...{retry_note}")
 
@@ -1061,19 +1093,29 @@ Return ONLY the category names separated by commas (1-3 categories, exact names
             has_existing = existing_content and len(existing_content) >= 100
             content = existing_content if has_existing else None
 
-            # Always try to fetch from URL (to get fresh/full content)
-            url_content = self.get_article_content(article['url'])
-
-            if url_content and len(url_content) > 200:
+            # Skip the page fetch when the stored fullArticle is fresh and good enough
+            use_existing, reason = self.freshness.decide(
+                article, rejectors=(self.is_cookie_consent_content, self.has_paywall)
+            )
+            if use_existing:
+                with self.stats_lock:
+                    self.fetches_skipped += 1
+                url_content = None
+            else:
+                url_content = self.get_article_content(article['url'])
+
+            # Page markup signals apply only when the fetched text is the text being summarized
+            signals = []
+            if use_existing:
+                content = existing_content
+                print(f"  → Using existing fullArticle ({len(content)} chars, {reason})")
+            elif url_content and len(url_content) > 200:
                 # Use fresh content from URL
                 print(f"  → Fetched from URL ({len(url_content)} chars)")
                 content = url_content
+                signals = getattr(self.fetch_context, 'signals', [])
             elif has_existing:
-                # Fallback to existing fullArticle, but check for cookie content
-                if self.is_cookie_consent_content(content):
-                    print(f"  ⊘ Existing fullArticle is cookie consent/privacy policy content")
-                    self.mark_article_failed(article['id'], retry_count)
-                    return False
+                # Fallback to existing fullArticle (cookie/paywall text is caught by the gate below)
                 print(f"  → Using existing fullArticle ({len(content)} chars)")
             else:
                 # No full content — try last-resort short summary via Anthropic
@@ -1088,23 +1130,66 @@ Return ONLY the category names separated by commas (1-3 categories, exact names
                 self.mark_article_failed(article['id'], retry_count)
                 return False
 
+            # Gate paywalled/consent content before spending any provider calls
+            gated, gate_reason = self.access_gate.check(content, signals, source_name)
+            if gated:
+                self.metrics.count('gated', reason=gated)
+                with self.stats_lock:
+                    self.gate_stats[gated] += 1
+                    self.gate_stats['llm_calls_saved'] += AccessGate.CALLS_PER_ARTICLE
+                if gated == 'paywall':
+                    print(f"  ⊘ Paywall detected ({gate_reason}) - not summarized")
+                    self.mark_article_paywalled(article['id'])
+                else:
+                    print(f"  ⊘ Cookie consent/privacy content ({gate_reason}) - not summarized")
+                    self.mark_article_failed(article['id'], retry_count)
+                return False
+
+            # Near-duplicates of a story another article already covers reuse its summary
+            fulltext = content[:50000] if content and len(content) > 200 else None
+            fingerprint = self.article_clusters.fingerprint(content)
+            if fingerprint is not None:
+                cluster, representative, distance = self.article_clusters.join(article['id'], fingerprint)
+                if not representative:
+                    # Another article leads this cluster; only a representative completes it
+                    leader, cluster = cluster, None
+                    print(f"  ≡ Near-duplicate of article {leader.canonical_id} ({distance} bits apart)")
+                    upgrade = article.get('isSummaryProvisional') == 'Y'
+                    copied = self.copy_from_cluster(article['id'], leader, fingerprint, fulltext, upgrade)
+                    if copied == 'copied':
+                        self.metrics.count('cluster_copies')
+                        print(f"  ✓ Done - summary copied from article {leader.canonical_id}")
+                        return True
+                    if copied == 'deferred':
+                        self.metrics.count('cluster_deferrals')
+                        print(f"  ⏳ Representative still summarizing, deferred "
+                              f"{self.article_clusters.defer_seconds}s")
+                        return False
+                    print(f"  → Representative has no summary, summarizing this copy")
+
             # Summarize
-            summary = self.summarize_with_ai(article['title'], content)
+            rejected = []
+            with self.metrics.timer('summarize'):
+                summary = self.summarize_with_ai(article['title'], content, rejected)
             if not summary:
                 print(f"  ⊘ No summary")
+                # Providers down: show an extractive summary now and retry the LLM on the usual backoff.
+                # Text a provider refused to summarize (consent page, garbage) gets no stand-in either.
+                if not rejected and self.store_provisional_summary(article, content, fulltext, retry_count):
+                    self.metrics.count('provisional_summaries')
+                    return True
                 # Don't mark as failed if we have fullArticle - might be AI issue
                 if not has_existing:
                     self.mark_article_failed(article['id'], retry_count)
                 return False
 
             # Categorize with source awareness
-            categories = self.categorize_with_ai(article['title'], summary, article.get('mainCategory'))
-
-            # Save fullArticle (limit to 50KB)
-            fulltext = content[:50000] if content and len(content) > 200 else None
+            with self.metrics.timer('categorize'):
+                categories = self.categorize_with_ai(article['title'], summary, article.get('mainCategory'))
 
             # Update database - also reset retry counter on success
-            if self.update_article(article['id'], summary, categories, fulltext):
+            upgrade = article.get('isSummaryProvisional') == 'Y'
+            if self.update_article(article['id'], summary, categories, fulltext, cluster, upgrade):
                 fulltext_note = f" + {len(fulltext)} chars" if fulltext else ""
                 print(f"  ✓ Done - {', '.join(categories)}{fulltext_note}")
                 return True
@@ -1117,6 +1202,18 @@ Return ONLY the category names separated by commas (1-3 categories, exact names
             retry_count = article.get('summary_retry_count', 0)
             self.mark_article_failed(article['id'], retry_count)
             return False
+        finally:
+            # A failed representative is dropped; its deferred copies summarize themselves when claimed again
+            if cluster is not None:
+                self.article_clusters.complete(cluster)
+
+    def _start(self, max_workers):
+        """Connect and start the long-lived pieces shared by one-shot and watch mode"""
+        if not self.connect_db():
+            return False
+        if self.hedge_enabled:
+            self.hedge_executor = ThreadPoolExecutor(max_workers=max_workers * 2, thread_name_prefix='hedge')
+        return True
 
     def run(self, batch_size=75, max_workers=5):
         """Run parallel processing"""
@@ -1124,40 +1221,237 @@ Return ONLY the category names separated by commas (1-3 categories, exact names
         print(f"Parallel Article Summarizer ({' → '.join(self.provider_order)})")
         print("=" * 60)
 
-        if not self.connect_db():
+        if not self._start(max_workers):
             return
 
-        articles = self.get_unsummarized_articles(batch_size)
+        # Whatever happens after startup, results are flushed and shared resources closed
+        successful = 0
+        articles = []
+        start_time = time.time()
+        try:
+            articles = self.get_unsummarized_articles(batch_size)
+
+            if not articles:
+                print("\n✓ No articles need summarization")
+                return
+
+            print(f"\n📝 Processing {len(articles)} articles with {max_workers} parallel workers...")
+
+            total_articles = len(articles)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {executor.submit(self.process_article, article, f"{i+1}/{total_articles}"): article for i, article in enumerate(articles)}
+
+                for future in as_completed(futures):
+                    if future.result():
+                        successful += 1
+                    self.article_queue.renew()
+        finally:
+            self._finish(successful, len(articles), time.time() - start_time)
+
+    # Watch mode: seconds between cheap polls while busy, and the idle backoff ceiling
+    WATCH_POLL_SECONDS = 2
+    WATCH_MAX_IDLE_SECONDS = 60
+    # Due retries appear without new inserts, so the queue is re-checked at least this often
+    WATCH_RECHECK_SECONDS = 300
+    WATCH_CATEGORY_REFRESH_SECONDS = 600
+    WATCH_REPORT_SECONDS = 900
+
+    def watch(self, batch_size=20, max_workers=5, poll_seconds=None, max_idle_seconds=None):
+        """Long-running worker: keep the pool, sessions, browsers and category index warm and
+        summarize new articles as they land. Polls MAX(articles.id) with an idle backoff;
+        SIGUSR1 or touching SUMMARIZER_WAKE_FILE wakes it at once; SIGTERM/SIGINT drain and exit."""
+        poll_seconds = poll_seconds or self.WATCH_POLL_SECONDS
+        max_idle_seconds = max(max_idle_seconds or self.WATCH_MAX_IDLE_SECONDS, poll_seconds)
+        wake_file = os.getenv('SUMMARIZER_WAKE_FILE', '/tmp/summarizer.wake')
 
-        if not articles:
-            print("\n✓ No articles need summarization")
+        print("=" * 60)
+        print(f"Parallel Article Summarizer - watch mode ({' → '.join(self.provider_order)})")
+        print("=" * 60)
+        if not self._start(max_workers):
             return
 
-        print(f"\n📝 Processing {len(articles)} articles with {max_workers} parallel workers...")
+        stop = Event()
+        wake = Event()
+
+        def request_stop(signum, frame):
+            if not stop.is_set():
+                print(f"\n⏹ Signal {signum} received, finishing in-flight articles...")
+            stop.set()
+            wake.set()
+
+        signal.signal(signal.SIGTERM, request_stop)
+        signal.signal(signal.SIGINT, request_stop)
+        if hasattr(signal, 'SIGUSR1'):
+            signal.signal(signal.SIGUSR1, lambda signum, frame: wake.set())
+
+        def wake_file_mtime():
+            try:
+                return os.stat(wake_file).st_mtime
+            except OSError:
+                return 0
+
+        print(f"👀 Watching for new articles ({max_workers} workers, poll {poll_seconds}s, "
+              f"idle backoff up to {max_idle_seconds}s, wake file {wake_file})")
 
         successful = 0
+        processed = 0
         start_time = time.time()
-        total_articles = len(articles)
+        high_water = None
+        wake_mtime = wake_file_mtime()
+        idle_seconds = poll_seconds
+        last_claim = last_categories = last_report = time.time()
+        in_flight = set()
+        # Keep the pool fed without claiming (and leasing) far more than it can work on
+        max_in_flight = max_workers * 2
 
         with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            futures = {executor.submit(self.process_article, article, f"{i+1}/{total_articles}"): article for i, article in enumerate(articles)}
+            while not stop.is_set():
+                done = {future for future in in_flight if future.done()}
+                for future in done:
+                    processed += 1
+                    if future.result():
+                        successful += 1
+                in_flight -= done
+
+                now = time.time()
+                mtime = wake_file_mtime()
+                notified = wake.is_set() or mtime != wake_mtime
+                wake.clear()
+                wake_mtime = mtime
 
-            for future in as_completed(futures):
+                try:
+                    if not self.connection.is_connected():
+                        self.connection.reconnect(attempts=3, delay=2)
+                        cursor = self.connection.cursor()
+                        cursor.execute("SET time_zone = '-08:00'")
+                        cursor.close()
+                    cursor = self.connection.cursor()
+                    cursor.execute("SELECT MAX(id) FROM articles")
+                    latest = cursor.fetchone()[0] or 0
+                    cursor.close()
+                    # End the read transaction so the next poll sees newly committed rows
+                    self.connection.commit()
+                except Error as e:
+                    print(f"⚠ Poll failed ({e}), retrying in {max_idle_seconds}s")
+                    stop.wait(max_idle_seconds)
+                    continue
+
+                new_rows = high_water is None or latest > high_water
+                free = max_in_flight - len(in_flight)
+                claimed = []
+                if free > 0 and (new_rows or notified or done or now - last_claim >= self.WATCH_RECHECK_SECONDS):
+                    claimed = self.get_unsummarized_articles(min(batch_size, free))
+                    last_claim = now
+                    high_water = latest
+                    for article in claimed:
+                        in_flight.add(executor.submit(self.process_article, article, f"#{article['id']}"))
+                    if claimed:
+                        print(f"📝 Claimed {len(claimed)} articles ({len(in_flight)} in flight)")
+
+                self.article_queue.renew()
+                self.router.write_status()
+                self.metrics.write_textfile()
+
+                if now - last_categories >= self.WATCH_CATEGORY_REFRESH_SECONDS:
+                    self.load_categories()
+                    last_categories = now
+                if now - last_report >= self.WATCH_REPORT_SECONDS and processed:
+                    print(f"⏱ {successful}/{processed} articles summarized in {(now - start_time) / 60:.0f} min; "
+                          f"{self.llm_cache.summary_line()}")
+                    self.usage.flush(self.connection)
+                    last_report = now
+
+                # Busy: short polls. Idle: back off exponentially until a row, signal or wake file shows up.
+                if claimed or in_flight:
+                    idle_seconds = poll_seconds
+                else:
+                    idle_seconds = min(idle_seconds * 2, max_idle_seconds)
+                waited = 0
+                while waited < (poll_seconds if in_flight else idle_seconds) and not stop.is_set():
+                    if wake.wait(1) or wake_file_mtime() != wake_mtime:
+                        idle_seconds = poll_seconds
+                        break
+                    waited += 1
+                    if in_flight and any(future.done() for future in in_flight):
+                        break
+
+            for future in as_completed(in_flight):
+                processed += 1
                 if future.result():
                     successful += 1
 
-        elapsed = time.time() - start_time
+        self._finish(successful, processed, time.time() - start_time)
+
+    def _finish(self, successful, total, elapsed):
+        """Flush results, release leases, print the run report and close shared resources"""
+        # Flush queued results before reporting, then drop this run's leases
+        self.result_writer.close()
+        released = self.article_queue.release() if self.article_queue else 0
+        if self.hedge_executor:
+            self.hedge_executor.shutdown(wait=False, cancel_futures=True)
+            self.hedge_executor = None
 
         print("\n" + "=" * 60)
-        print(f"✓ Processed {successful}/{len(articles)} articles in {elapsed:.1f}s")
+        print(f"✓ Processed {successful}/{total} articles in {elapsed:.1f}s")
+        for provider, health in self.router.snapshot().items():
+            latency = f"{health['ewma_latency']:.1f}s" if health['ewma_latency'] is not None else "n/a"
+            print(f"  {provider}: {health['state']}, ewma {latency}, "
+                  f"{health['successes']} ok / {health['failures']} failed / {health['rate_limits']} rate-limited")
+        if self.hedge_enabled:
+            stats = self.hedge_stats
+            win_rate = f"{stats['won'] / stats['fired'] * 100:.0f}%" if stats['fired'] else "n/a"
+            print(f"  Hedges: {stats['fired']} fired (budget {self.hedge_budget} per {self.hedge_window}s), "
+                  f"{stats['won']} won ({win_rate})")
+        print(f"  {self.llm_cache.summary_line()}")
+        print(f"  Page fetches skipped (fresh fullArticle): {self.fetches_skipped}")
+        gate = self.gate_stats
+        print(f"  Access gate: {gate['paywall']} paywalled, {gate['consent']} consent walls, "
+              f"{gate['llm_calls_saved']} LLM calls saved")
+        print(f"  {self.article_clusters.summary_line(AccessGate.CALLS_PER_ARTICLE)}")
+        if self.provisional_count:
+            print(f"  Extractive fallback: {self.provisional_count} provisional summaries (queued for LLM retry)")
+        print(f"  {self.fetch_strategy.summary_line()}")
+        print(f"  {self.rate_limiter.summary_line()}")
+        print(f"  {self.result_writer.summary_line()}")
+        if self.article_queue and self.article_queue.claims_enabled:
+            print(f"  Leases: worker {self.article_queue.worker_id}, {released} released")
+        stats = self.compression_stats
+        if stats['articles']:
+            saved = stats['input_tokens'] - stats['output_tokens']
+            print(f"  Compression: {saved} input tokens saved over {stats['articles']} articles "
+                  f"({saved / max(stats['input_tokens'], 1) * 100:.0f}%)")
+        for line in self.usage.summary_lines():
+            print(f"  {line}")
+        print("-" * 60)
+        for line in self.metrics.summary_lines():
+            print(f"  {line}")
         print("=" * 60)
+        self.router.write_status(force=True)
+        self.metrics.close()
 
+        self.render_service.close()
+        self.llm_cache.close()
+        self.fetch_strategy.close()
+        self.rate_limiter.close()
         if self.connection and self.connection.is_connected():
+            self.usage.flush(self.connection)
             self.connection.close()
 
 if __name__ == "__main__":
-    batch_size = int(sys.argv[1]) if len(sys.argv) > 1 else 75
-    max_workers = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    parser = argparse.ArgumentParser(description="Summarize unsummarized articles in parallel")
+    parser.add_argument("batch_size", nargs="?", type=int, default=None,
+                        help="Articles per run (default 75), or per claim in --watch mode (default 20)")
+    parser.add_argument("max_workers", nargs="?", type=int, default=5, help="Parallel workers (default 5)")
+    parser.add_argument("--watch", action="store_true",
+                        help="Keep running and summarize new articles as they arrive (stop with SIGTERM)")
+    parser.add_argument("--poll", type=float, default=None,
+                        help=f"Seconds between polls while busy (default {ParallelSummarizer.WATCH_POLL_SECONDS})")
+    parser.add_argument("--max-idle", type=float, default=None,
+                        help=f"Idle backoff ceiling in seconds (default {ParallelSummarizer.WATCH_MAX_IDLE_SECONDS})")
+    args = parser.parse_args()
 
     summarizer = ParallelSummarizer()
-    summarizer.run(batch_size, max_workers)
+    if args.watch:
+        summarizer.watch(args.batch_size or 20, args.max_workers, args.poll, args.max_idle)
+    else:
+        summarizer.run(args.batch_size or 75, args.max_workers)